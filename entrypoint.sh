@@ -51,6 +51,8 @@ else
 fi
 
 # ── Start Gunicorn ─────────────────────────────────────────────────
+# The application (src.wsgi / src.asgi) and worker class follow
+# SERVER_INTERFACE, see src/gunicorn.conf.py.
 echo ""
-echo "→ Starting Gunicorn..."
-exec gunicorn src.wsgi:application -c src/gunicorn.conf.py
\ No newline at end of file
+echo "→ Starting Gunicorn (${SERVER_INTERFACE:-wsgi})..."
+exec gunicorn -c src/gunicorn.conf.py
\ No newline at end of file
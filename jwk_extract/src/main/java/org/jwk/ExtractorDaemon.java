@@ -0,0 +1,124 @@
+package org.jwk;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.EOFException;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.PrintStream;
+import java.nio.charset.StandardCharsets;
+
+/**
+ * Long-lived extractor process (java -jar ecdsa-extractor.jar --daemon).
+ *
+ * Keeps the JVM, BouncyCastle and Jackson warm so that each extraction
+ * costs milliseconds instead of a JVM start-up. Requests are read from
+ * stdin and answered on stdout, one at a time, with a binary framing
+ * (all integers big-endian, as written by DataOutputStream):
+ *
+ * Request:
+ *   u8   op            0 = ping, 1 = jwk, 2 = metadata
+ *   i32  password_len  -1 when no PKCS#12 password is given
+ *   ...  password      UTF-8
+ *   i32  cert_len
+ *   ...  cert          raw PEM/DER/P7B/P12 bytes
+ *
+ * Response:
+ *   u8   status        0 = ok (payload is JSON), 1 = error (payload is
+ *                      the message the CLI would print on stderr)
+ *   i32  payload_len
+ *   ...  payload       UTF-8
+ *
+ * The process exits with 0 when stdin is closed, and with 2 on a framing
+ * error (the caller must then discard it and start a new one).
+ */
+public final class ExtractorDaemon {
+
+    static final int OP_PING = 0;
+    static final int OP_JWK = 1;
+    static final int OP_METADATA = 2;
+
+    private static final int STATUS_OK = 0;
+    private static final int STATUS_ERROR = 1;
+
+    /** Upper bound for a single certificate or password frame (10 MiB). */
+    private static final int MAX_FRAME = 10 * 1024 * 1024;
+
+    private ExtractorDaemon() {
+    }
+
+    public static int serve() {
+        DataInputStream in = new DataInputStream(
+                new BufferedInputStream(new FileInputStream(FileDescriptor.in)));
+        DataOutputStream out = new DataOutputStream(
+                new BufferedOutputStream(new FileOutputStream(FileDescriptor.out)));
+
+        // stdout carries the framed protocol: anything a library prints
+        // there would corrupt it, so route System.out to stderr.
+        System.setOut(new PrintStream(new FileOutputStream(FileDescriptor.err), true));
+
+        try {
+            while (true) {
+                int op = in.read();
+                if (op < 0) {
+                    return 0;
+                }
+                String password = readPassword(in);
+                byte[] cert = readFrame(in);
+
+                try {
+                    String result = switch (op) {
+                        case OP_PING -> "\"pong\"";
+                        case OP_JWK -> JWKExtractor.extractJWK(cert, password);
+                        case OP_METADATA -> JWKExtractor.extractMetadata(cert, password);
+                        default -> throw new IllegalArgumentException("Unknown op " + op);
+                    };
+                    writeResponse(out, STATUS_OK, result);
+                } catch (UnsupportedOperationException e) {
+                    writeResponse(out, STATUS_ERROR, "Unsupported key type: " + e.getMessage());
+                } catch (Exception e) {
+                    writeResponse(out, STATUS_ERROR, "Error: " + e.getMessage());
+                }
+            }
+        } catch (EOFException e) {
+            System.err.println("Error: truncated request frame.");
+            return 2;
+        } catch (IOException e) {
+            System.err.println("Error: " + e.getMessage());
+            return 2;
+        }
+    }
+
+    private static String readPassword(DataInputStream in) throws IOException {
+        int len = in.readInt();
+        if (len == -1) {
+            return null;
+        }
+        return new String(readBytes(in, len), StandardCharsets.UTF_8);
+    }
+
+    private static byte[] readFrame(DataInputStream in) throws IOException {
+        return readBytes(in, in.readInt());
+    }
+
+    private static byte[] readBytes(DataInputStream in, int len) throws IOException {
+        if (len < 0 || len > MAX_FRAME) {
+            throw new IOException("Invalid frame length " + len + ".");
+        }
+        byte[] buf = new byte[len];
+        in.readFully(buf);
+        return buf;
+    }
+
+    private static void writeResponse(DataOutputStream out, int status, String payload) throws IOException {
+        byte[] bytes = payload.getBytes(StandardCharsets.UTF_8);
+        out.writeByte(status);
+        out.writeInt(bytes.length);
+        out.write(bytes);
+        out.flush();
+    }
+}
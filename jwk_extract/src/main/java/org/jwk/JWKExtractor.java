@@ -57,12 +57,31 @@ public class JWKExtractor {
         return buildMetadata(cert);
     }
 
+    /**
+     * In-memory variants used by {@link ExtractorDaemon}: the certificate
+     * bytes never touch the disk. Detection follows the same order as for
+     * a file without a .p12/.pfx extension (X.509 first, then PKCS#12).
+     */
+    public static String extractJWK(byte[] certBytes, String p12Password) throws Exception {
+        X509Certificate cert = loadCertificate(certBytes, "", p12Password);
+        return buildJWK(cert);
+    }
+
+    public static String extractMetadata(byte[] certBytes, String p12Password) throws Exception {
+        X509Certificate cert = loadCertificate(certBytes, "", p12Password);
+        return buildMetadata(cert);
+    }
+
     // ?? Certificate loading ?????????????????????????????????????????????
 
     private static X509Certificate loadCertificate(String certPath, String p12Password) throws Exception {
         byte[] fileBytes = Files.readAllBytes(Paths.get(certPath));
         String fileName = Paths.get(certPath).getFileName().toString().toLowerCase();
+        return loadCertificate(fileBytes, fileName, p12Password);
+    }
 
+    private static X509Certificate loadCertificate(byte[] fileBytes, String fileName, String p12Password)
+            throws Exception {
         // Try PKCS#12 first if extension matches
         if (fileName.endsWith(".p12") || fileName.endsWith(".pfx")) {
             return loadFromPkcs12(fileBytes, p12Password);
@@ -11,10 +11,14 @@ import java.util.List;
  *   java -jar ecdsa-extractor.jar --jwk <cert-path>
  *   java -jar ecdsa-extractor.jar --metadata <cert-path>
  *   java -jar ecdsa-extractor.jar --metadata --p12-password changeit <cert-path>
+ *   java -jar ecdsa-extractor.jar --daemon
  *
  * The cert-path is everything after the flags. If the path contains spaces
  * and wasn't quoted by the caller, the trailing args are joined back together.
  *
+ * --daemon keeps the JVM running and serves requests on stdin/stdout
+ * (see {@link ExtractorDaemon} for the framing).
+ *
  * Exit codes:
  *   0 = success (JSON on stdout)
  *   1 = error (message on stderr)
@@ -38,6 +42,8 @@ public class Main {
                 mode = "jwk";
             } else if ("--metadata".equals(arg)) {
                 mode = "metadata";
+            } else if ("--daemon".equals(arg)) {
+                System.exit(ExtractorDaemon.serve());
             } else if ("--help".equals(arg) || "-h".equals(arg)) {
                 printUsage();
                 System.exit(0);
@@ -91,10 +97,12 @@ public class Main {
 
     private static void printUsage() {
         System.err.println("Usage: java -jar ecdsa-extractor.jar [--jwk|--metadata] [--p12-password <pwd>] <cert-path>");
+        System.err.println("       java -jar ecdsa-extractor.jar --daemon");
         System.err.println();
         System.err.println("Modes:");
         System.err.println("  --jwk       Output JWK only (default)");
         System.err.println("  --metadata  Output full certificate metadata including JWK");
+        System.err.println("  --daemon    Serve framed requests on stdin/stdout until EOF");
         System.err.println();
         System.err.println("Options:");
         System.err.println("  --p12-password <pwd>  Password for PKCS#12 (.p12/.pfx) keystores");
@@ -0,0 +1,139 @@
+"""
+Regenerate the certificate extractor parity corpus (see compare_cert_extractors).
+
+Writes the certificates next to this file and manifest.json, which gives
+per file the PKCS#12 password and the key type / curve both backends
+must report (or "error": true when both must reject the file).
+
+Usage:
+  python src/apps/certificates/fixtures/extractor_corpus/generate.py
+"""
+
+import datetime
+import json
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import pkcs7, pkcs12
+from cryptography.x509.oid import NameOID
+
+HERE = Path(__file__).parent
+P12_PASSWORD = "changeit"
+
+NOT_BEFORE = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+NOT_AFTER = datetime.datetime(2049, 12, 31, tzinfo=datetime.UTC)  # UTCTime
+NOT_AFTER_GENERALIZED = datetime.datetime(2126, 1, 1, tzinfo=datetime.UTC)  # GeneralizedTime
+
+
+def _name(*attributes) -> x509.Name:
+    return x509.Name([x509.NameAttribute(oid, value) for oid, value in attributes])
+
+
+def _cert(key, subject, *, issuer=None, issuer_key=None, serial=1, not_after=NOT_AFTER, ca=False, extensions=True):
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(issuer or subject)
+        .public_key(key.public_key())
+        .serial_number(serial)
+        .not_valid_before(NOT_BEFORE)
+        .not_valid_after(not_after)
+    )
+    if extensions:
+        builder = builder.add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True)
+    signer = issuer_key or key
+    algorithm = None if isinstance(signer, (ed25519.Ed25519PrivateKey, ed448.Ed448PrivateKey)) else hashes.SHA256()
+    return builder.sign(signer, algorithm)
+
+
+def _write(files: dict, name: str, data: bytes, **expected) -> None:
+    (HERE / name).write_bytes(data)
+    files[name] = expected
+
+
+def main() -> None:
+    files: dict[str, dict] = {}
+    pem = serialization.Encoding.PEM
+    der = serialization.Encoding.DER
+
+    keys = {
+        "p256": (ec.generate_private_key(ec.SECP256R1()), "EC", "P-256"),
+        "p384": (ec.generate_private_key(ec.SECP384R1()), "EC", "P-384"),
+        "p521": (ec.generate_private_key(ec.SECP521R1()), "EC", "P-521"),
+        "secp256k1": (ec.generate_private_key(ec.SECP256K1()), "EC", "secp256k1"),
+        "rsa2048": (rsa.generate_private_key(public_exponent=65537, key_size=2048), "RSA", None),
+        "rsa3072": (rsa.generate_private_key(public_exponent=65537, key_size=3072), "RSA", None),
+        "ed25519": (ed25519.Ed25519PrivateKey.generate(), "Ed25519", None),
+        "ed448": (ed448.Ed448PrivateKey.generate(), "Ed448", None),
+    }
+    certs = {}
+    for serial, (label, (key, key_type, curve)) in enumerate(keys.items(), start=1):
+        cert = _cert(key, _name((NameOID.COMMON_NAME, f"corpus {label}"), (NameOID.ORGANIZATION_NAME, "Annuaire DID")), serial=serial)
+        certs[label] = cert
+        for ext, encoding in (("pem", pem), ("der", der)):
+            _write(files, f"{label}.{ext}", cert.public_bytes(encoding), key_type=key_type, key_curve=curve)
+
+    # Chain: leaf first, then intermediate and root.
+    root_key, inter_key, leaf_key = (ec.generate_private_key(ec.SECP256R1()) for _ in range(3))
+    root_name = _name((NameOID.COMMON_NAME, "corpus root CA"))
+    inter_name = _name((NameOID.COMMON_NAME, "corpus intermediate CA"))
+    root = _cert(root_key, root_name, serial=100, ca=True)
+    inter = _cert(inter_key, inter_name, issuer=root_name, issuer_key=root_key, serial=101, ca=True)
+    leaf = _cert(leaf_key, _name((NameOID.COMMON_NAME, "corpus leaf")), issuer=inter_name, issuer_key=inter_key, serial=102)
+    chain = [leaf, inter, root]
+    _write(files, "chain.pem", b"".join(c.public_bytes(pem) for c in chain), key_type="EC", key_curve="P-256")
+    _write(files, "chain.p7b", pkcs7.serialize_certificates(chain, der), key_type="EC", key_curve="P-256")
+    _write(files, "chain-pem.p7b", pkcs7.serialize_certificates(chain, pem), key_type="EC", key_curve="P-256")
+
+    # PKCS#12, with and without a password.
+    p12_key = keys["p384"][0]
+    encrypted = serialization.BestAvailableEncryption(P12_PASSWORD.encode())
+    _write(
+        files, "password.p12",
+        pkcs12.serialize_key_and_certificates(b"corpus", p12_key, certs["p384"], [inter, root], encrypted),
+        p12_password=P12_PASSWORD, key_type="EC", key_curve="P-384",
+    )
+    _write(
+        files, "nopassword.p12",
+        pkcs12.serialize_key_and_certificates(b"corpus", p12_key, certs["p384"], None, serialization.NoEncryption()),
+        key_type="EC", key_curve="P-384",
+    )
+    _write(
+        files, "rsa-password.pfx",
+        pkcs12.serialize_key_and_certificates(b"corpus", keys["rsa2048"][0], certs["rsa2048"], None, encrypted),
+        p12_password=P12_PASSWORD, key_type="RSA", key_curve=None,
+    )
+
+    # Distinguished names that need RFC 4514 escaping.
+    dn_key = keys["p256"][0]
+    escaped = x509.Name([
+        x509.RelativeDistinguishedName([x509.NameAttribute(NameOID.DOMAIN_COMPONENT, "example")]),
+        x509.RelativeDistinguishedName([x509.NameAttribute(NameOID.COUNTRY_NAME, "FR")]),
+        x509.RelativeDistinguishedName([x509.NameAttribute(NameOID.ORGANIZATION_NAME, 'Dupont, Fils & "Cie" <SA>; Ltd')]),
+        x509.RelativeDistinguishedName([x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "#lead")]),
+        x509.RelativeDistinguishedName([
+            x509.NameAttribute(NameOID.COMMON_NAME, " Zoé a=b+c\\d "),
+            x509.NameAttribute(NameOID.SERIAL_NUMBER, "42"),
+        ]),
+        x509.RelativeDistinguishedName([x509.NameAttribute(NameOID.EMAIL_ADDRESS, "pki@example.org")]),
+    ])
+    _write(files, "escaped-dn.pem", _cert(dn_key, escaped, serial=200).public_bytes(pem), key_type="EC", key_curve="P-256")
+
+    # No extensions at all, and a validity past 2049 (GeneralizedTime).
+    bare = _cert(dn_key, _name((NameOID.COMMON_NAME, "corpus bare")), serial=201, extensions=False)
+    _write(files, "no-extensions.der", bare.public_bytes(der), key_type="EC", key_curve="P-256")
+    long_lived = _cert(dn_key, _name((NameOID.COMMON_NAME, "corpus 2126")), serial=202, not_after=NOT_AFTER_GENERALIZED)
+    _write(files, "generalized-time.pem", long_lived.public_bytes(pem), key_type="EC", key_curve="P-256")
+
+    # Not a certificate: both backends must reject it.
+    _write(files, "not-a-certificate.pem", b"-----BEGIN CERTIFICATE-----\nbm90IGEgY2VydA==\n-----END CERTIFICATE-----\n", error=True)
+
+    manifest = {name: {k: v for k, v in expected.items() if v is not None} for name, expected in sorted(files.items())}
+    (HERE / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    print(f"{len(files)} files written to {HERE}")
+
+
+if __name__ == "__main__":
+    main()
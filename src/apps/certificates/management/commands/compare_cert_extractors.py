@@ -0,0 +1,153 @@
+"""
+Management command: compare_cert_extractors
+
+Runs every certificate of a corpus through the python extractor and a
+JAR-based one ("jar" by default, or "daemon") and reports any field where
+their metadata differs. Use it before switching CERT_EXTRACTOR_BACKEND,
+and whenever the JAR or the cryptography package is upgraded.
+
+A directory holding a manifest.json is checked against it instead of
+being scanned: only the listed files, each with its own PKCS#12
+password, and both backends must report the expected key_type /
+key_curve (or both reject files marked "error": true). CI runs it on
+src/apps/certificates/fixtures/extractor_corpus/ (see generate.py there).
+
+Usage:
+  python -m src.manage compare_cert_extractors path/to/certs/
+  python -m src.manage compare_cert_extractors src/apps/certificates/fixtures/extractor_corpus/
+  python -m src.manage compare_cert_extractors a.pem b.p12 --p12-password changeit
+  python -m src.manage compare_cert_extractors path/to/certs/ --against daemon
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.common.exceptions import ValidationError
+from src.integrations.cert_service import (
+    BACKEND_DAEMON,
+    BACKEND_JAR,
+    BACKEND_PYTHON,
+    extract_metadata,
+)
+
+MANIFEST_NAME = "manifest.json"
+EXPECTED_FIELDS = ("key_type", "key_curve")
+
+
+class Command(BaseCommand):
+    help = "Check that the python and jar certificate extractors agree on a corpus."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="Certificate files or directories (scanned recursively).",
+        )
+        parser.add_argument(
+            "--p12-password",
+            type=str,
+            default=None,
+            help="Password passed to both backends for PKCS#12 files (not listed in a manifest).",
+        )
+        parser.add_argument(
+            "--against",
+            choices=(BACKEND_JAR, BACKEND_DAEMON),
+            default=BACKEND_JAR,
+            help="JAR-based backend to compare the python extractor with.",
+        )
+
+    def handle(self, *args, **options):
+        cases = sorted(self._collect(options["paths"], options["p12_password"]), key=lambda case: case[0])
+        if not cases:
+            raise CommandError("No certificate files found.")
+
+        reference = options["against"]
+        mismatches = 0
+        for path, p12_password, expected in cases:
+            data = path.read_bytes()
+            results = {}
+            for backend in (reference, BACKEND_PYTHON):
+                try:
+                    results[backend] = extract_metadata(
+                        cert_pem_bytes=data,
+                        p12_password=p12_password,
+                        backend=backend,
+                        use_cache=False,
+                    )
+                except ValidationError as e:
+                    results[backend] = ValidationError(e.message)
+
+            jar, native = results[reference], results[BACKEND_PYTHON]
+
+            if isinstance(jar, Exception) and isinstance(native, Exception):
+                if expected is None or expected.get("error"):
+                    self.stdout.write(f"  both-failed  {path}")
+                    continue
+                mismatches += 1
+                self.stdout.write(self.style.ERROR(f"  FAILED       {path}"))
+                self.stdout.write(f"      jar:    {jar}")
+                self.stdout.write(f"      python: {native}")
+                continue
+
+            if isinstance(jar, Exception) or isinstance(native, Exception):
+                mismatches += 1
+                self.stdout.write(self.style.ERROR(f"  MISMATCH     {path}"))
+                self.stdout.write(f"      jar:    {jar}")
+                self.stdout.write(f"      python: {native}")
+                continue
+
+            if expected is not None and expected.get("error"):
+                mismatches += 1
+                self.stdout.write(self.style.ERROR(f"  ACCEPTED     {path} (manifest expects both backends to reject it)"))
+                continue
+
+            diff = sorted(k for k in jar.keys() | native.keys() if jar.get(k) != native.get(k))
+            unexpected = sorted(
+                k for k in EXPECTED_FIELDS if expected is not None and native.get(k) != expected.get(k)
+            )
+            if not diff and not unexpected:
+                self.stdout.write(self.style.SUCCESS(f"  ok           {path}"))
+                continue
+
+            mismatches += 1
+            self.stdout.write(self.style.ERROR(f"  MISMATCH     {path}"))
+            for key in diff:
+                self.stdout.write(f"      {key}:")
+                self.stdout.write(f"        jar:    {jar.get(key)!r}")
+                self.stdout.write(f"        python: {native.get(key)!r}")
+            for key in unexpected:
+                self.stdout.write(f"      {key}: {native.get(key)!r}, manifest expects {expected.get(key)!r}")
+
+        if mismatches:
+            raise CommandError(f"{mismatches}/{len(cases)} certificate(s) differ between backends or from the manifest.")
+
+        self.stdout.write(self.style.SUCCESS(f"{len(cases)} certificate(s) checked, backends agree."))
+
+    @classmethod
+    def _collect(cls, paths, p12_password):
+        """Yield (path, p12_password, expected) ; expected is None outside a manifest."""
+        for raw in paths:
+            path = Path(raw)
+            if path.is_dir() and (path / MANIFEST_NAME).is_file():
+                yield from cls._from_manifest(path)
+            elif path.is_dir():
+                yield from ((p, p12_password, None) for p in path.rglob("*") if p.is_file())
+            elif path.is_file():
+                yield path, p12_password, None
+            else:
+                raise CommandError(f"No such file or directory: {raw}")
+
+    @staticmethod
+    def _from_manifest(directory):
+        try:
+            manifest = json.loads((directory / MANIFEST_NAME).read_text())
+        except ValueError as e:
+            raise CommandError(f"Invalid {directory / MANIFEST_NAME}: {e}") from e
+
+        for name, expected in manifest.items():
+            path = directory / name
+            if not path.is_file():
+                raise CommandError(f"{directory / MANIFEST_NAME} lists a missing file: {name}")
+            yield path, expected.get("p12_password"), expected
@@ -55,6 +55,13 @@ def get_certificate_versions(*, certificate_id: UUID) -> QuerySet[CertificateVer
     )
 
 
+def get_public_keys_for_versions(*, version_ids) -> dict:
+    """``{id de version: public_key_jwk}`` pour les versions demandées, en une requête."""
+    return dict(
+        CertificateVersion.objects.filter(id__in=version_ids).values_list("id", "public_key_jwk")
+    )
+
+
 def get_active_org_certificates(*, organization_id: UUID) -> QuerySet[Certificate]:
     """Uniquement les certificats ACTIVE pour une organisation."""
     return (
@@ -137,7 +144,7 @@ def get_linked_documents_for_cert(*, cert_id: UUID) -> list[dict]:
 
     vms = DocumentVerificationMethod.objects.filter(
         certificate_id=cert_id
-    ).select_related("document", "document__organization", "document__owner")
+    ).select_related("document")
 
     docs_dict = {}
     for vm in vms:
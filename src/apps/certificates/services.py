@@ -3,7 +3,7 @@ Services de certificats (opérations d'écriture).
 
 Flux de téléchargement :
   1. Enregistrer PEM via l'application files (upload_certificate_file)
-  2. Appeler JAR --metadata pour extraire le JWK + métadonnées du certif
+  2. Appeler l'extracteur (cert_service) --metadata pour extraire le JWK + métadonnées du certif
   3. Créer le Certificat + CertificateVersion
   4. Consigner l'entrée d'audit
 
@@ -54,7 +54,7 @@ def upload_certificate(
     Télécharger un nouveau certificat.
 
     1. Enregistre le fichier via l'application de fichiers
-    2. Appelle le JAR pour extraire JWK + métadonnées
+    2. Appelle l'extracteur (natif ou JAR) pour extraire JWK + métadonnées
     3. Crée le Certificat + première CertificateVersion
 
     Renvoie l'instance Certificate.
@@ -74,7 +74,7 @@ def upload_certificate(
     # 1. Enregistrer le fichier
     file_instance = upload_certificate_file(file=file, uploaded_by=uploaded_by)
 
-    # 2. Extraire les métadonnées via JAR
+    # 2. Extraire les métadonnées via cert_service
     file_instance.file.seek(0)
     cert_bytes = file_instance.file.read()
     metadata = extract_metadata(cert_pem_bytes=cert_bytes, p12_password=p12_password)
@@ -18,8 +18,10 @@ Flux de mise à jour (pour les documents déjà PUBLISHED) :
   L'ORG_ADMIN peut également re-publier n'importe quel document.
 """
 
+from typing import Literal
 from uuid import UUID
 
+from django.conf import settings
 from django.http import HttpRequest
 from ninja import Router
 from ninja_jwt.authentication import JWTAuth
@@ -30,17 +32,20 @@ from src.apps.documents import services as doc_services
 from src.apps.documents.models import DocumentVerificationMethod
 from src.apps.documents.schemas import (
     AddVerificationMethodSchema,
+    BulkPublishResultSchema,
+    BulkPublishSchema,
     CreateDocumentSchema,
     DeactivateSchema,
     DocDetailSchema,
     ErrorSchema,
     MessageSchema,
+    PublishJobSchema,
     ReviewSchema,
     UpdateDraftSchema,
     VerificationMethodResponse,
 )
 from src.common.did.assembler import build_did_uri
-from src.common.exceptions import NotFoundError
+from src.common.exceptions import NotFoundError, PermissionDeniedError
 from src.common.pagination import PaginatedResponse, paginate_queryset
 from src.common.permissions import (
     Permission,
@@ -71,6 +76,8 @@ def _is_admin(membership) -> bool:
 
 
 def _did_uri(doc) -> str:
+    if doc.did_uri:
+        return doc.did_uri
     return build_did_uri(
         org_slug=doc.organization.slug,
         owner_identifier=doc.owner_identifier,
@@ -150,11 +157,31 @@ def _version_response(v) -> dict:
         "version_number": v.version_number,
         "content": v.content,
         "signature": v.signature,
+        "content_hash": v.content_hash,
         "published_at": v.published_at.isoformat() if v.published_at else None,
         "published_by_email": v.published_by.email if v.published_by else "",
     }
 
 
+def _publish_job_response(job, org_id: UUID) -> dict:
+    return {
+        "id": job.id,
+        "document_id": job.document_id,
+        "status": job.status,
+        "draft_hash": job.draft_hash,
+        "version_number": job.version.version_number if job.version else None,
+        "error": job.error,
+        "attempts": job.attempts,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "status_url": (
+            f"/api/v2/org/organizations/{org_id}/documents/{job.document_id}"
+            f"/publish-jobs/{job.id}"
+        ),
+    }
+
+
 def _get_doc_or_404(doc_id: UUID, org_id: UUID):
     doc = doc_selectors.get_document_by_id(doc_id=doc_id)
     if doc is None or str(doc.organization_id) != str(org_id):
@@ -233,6 +260,54 @@ def create_document(request: HttpRequest, org_id: UUID, payload: CreateDocumentS
     return 201, _doc_detail(doc)
 
 
+@router.post(
+    f"{_P}/bulk-publish",
+    response={200: BulkPublishResultSchema, 400: ErrorSchema, 403: ErrorSchema},
+    auth=JWTAuth(),
+    summary="Publier plusieurs documents approuvés (ORG_ADMIN)",
+)
+def bulk_publish_documents(
+        request: HttpRequest,
+        org_id: UUID,
+        payload: BulkPublishSchema,
+        mode: Literal["sync", "async"] | None = None,
+):
+    """
+    Publier un lot de documents (document_ids, ou tous les APPROVED de l'org).
+
+    En mode sync, les publications tournent en parallèle, plafonnées à
+    BULK_PUBLISH_CONCURRENCY (concurrency ne peut que l'abaisser), sur au
+    plus BULK_PUBLISH_SYNC_MAX_DOCUMENTS documents : la requête doit finir
+    avant le timeout gunicorn. Au-delà, mode=async est requis : chaque
+    document devient un PublishJob (status QUEUED + job_id), au plus
+    BULK_PUBLISH_MAX_DOCUMENTS par appel.
+    Un résultat par document ; un échec n'interrompt pas le lot.
+    """
+    membership = require_permission(request.auth, org_id, Permission.MUTATE_DOCUMENTS)
+    if not _is_admin(membership):
+        raise PermissionDeniedError("Only organization admins can bulk publish documents.")
+
+    enqueue = (mode or settings.DOCUMENT_PUBLISH_MODE) == "async"
+    cap = settings.BULK_PUBLISH_CONCURRENCY
+    results = doc_services.bulk_publish(
+        organization=membership.organization,
+        published_by=request.auth,
+        document_ids=payload.document_ids,
+        concurrency=min(payload.concurrency or cap, cap),
+        enqueue=enqueue,
+        max_documents=(
+            settings.BULK_PUBLISH_MAX_DOCUMENTS if enqueue else settings.BULK_PUBLISH_SYNC_MAX_DOCUMENTS
+        ),
+    )
+    failed = sum(1 for r in results if r["status"] in ("FAILED", "NOT_FOUND"))
+    return {
+        "total": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "results": results,
+    }
+
+
 @router.get(
     f"{_P}/pending-review",
     response=PaginatedResponse,
@@ -471,11 +546,22 @@ def reject_document(
 
 @router.post(
     f"{_P}/{{doc_id}}/publish",
-    response={200: DocDetailSchema, 400: ErrorSchema, 404: ErrorSchema},
+    response={
+        200: DocDetailSchema,
+        202: PublishJobSchema,
+        400: ErrorSchema,
+        404: ErrorSchema,
+        503: ErrorSchema,
+    },
     auth=JWTAuth(),
     summary="Signer et publier le document (ou re-publier avec nouvelle version)",
 )
-def publish_document(request: HttpRequest, org_id: UUID, doc_id: UUID):
+def publish_document(
+        request: HttpRequest,
+        org_id: UUID,
+        doc_id: UUID,
+        mode: Literal["sync", "async"] | None = None,
+):
     """
     Signer et publier un document DID.
 
@@ -483,6 +569,10 @@ def publish_document(request: HttpRequest, org_id: UUID, doc_id: UUID):
       - ORG_ADMIN sur DRAFT : publication directe (ignore l'examen)
       - Tout rôle sur APPROVED : publication après examen
       - Propriétaire ou ORG_ADMIN sur PUBLISHED : re-publier (nouvelle version du draft_content)
+
+    mode=async (ou DOCUMENT_PUBLISH_MODE="async") : met la saga en file
+    Celery et répond 202 avec le job ; suivre via GET .../publish-jobs/{job_id}.
+    Un même brouillon publié deux fois renvoie le même job.
     """
     membership = require_permission(request.auth, org_id, Permission.MUTATE_DOCUMENTS)
     doc = _get_doc_or_404(doc_id, org_id)
@@ -490,6 +580,14 @@ def publish_document(request: HttpRequest, org_id: UUID, doc_id: UUID):
 
     skip_review = _is_admin(membership)
 
+    if (mode or settings.DOCUMENT_PUBLISH_MODE) == "async":
+        job, _created = doc_services.enqueue_publish(
+            document=doc,
+            requested_by=request.auth,
+            skip_review=skip_review,
+        )
+        return 202, _publish_job_response(job, org_id)
+
     doc = doc_services.sign_and_publish(
         document=doc,
         published_by=request.auth,
@@ -500,6 +598,26 @@ def publish_document(request: HttpRequest, org_id: UUID, doc_id: UUID):
     return _doc_detail(doc)
 
 
+@router.get(
+    f"{_P}/{{doc_id}}/publish-jobs/{{job_id}}",
+    response={200: PublishJobSchema, 404: ErrorSchema},
+    auth=JWTAuth(),
+    summary="Suivre un job de publication asynchrone",
+)
+def get_publish_job(request: HttpRequest, org_id: UUID, doc_id: UUID, job_id: UUID):
+    """États : QUEUED → RUNNING → SUCCEEDED | FAILED (RUNNING → QUEUED si réessai)."""
+    membership = require_permission(request.auth, org_id, Permission.VIEW_DOCUMENTS)
+    doc = _get_doc_or_404(doc_id, org_id)
+
+    if not _can_view_all(membership) and doc.owner_id != request.auth.id:
+        raise NotFoundError("Document not found.")
+
+    job = doc_selectors.get_publish_job(job_id=job_id, document_id=doc.id)
+    if job is None:
+        raise NotFoundError("Publish job not found.")
+    return _publish_job_response(job, org_id)
+
+
 @router.post(
     f"{_P}/{{doc_id}}/deactivate",
     response={200: MessageSchema, 400: ErrorSchema, 404: ErrorSchema},
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DocumentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.apps.documents"
+
+    def ready(self):
+        from src.apps.documents import events  # noqa: F401 — branche les récepteurs de document_changed
@@ -0,0 +1,117 @@
+"""
+Événements de cycle de vie des documents DID.
+
+Les services émettent ``document_changed`` quand le contenu public d'un
+DID change (publication, désactivation, suppression — y compris en cascade
+avec l'organisation ou le propriétaire) et à chaque changement de statut
+du workflow d'examen (soumission, retrait, approbation, rejet, retour en
+brouillon), qui modifie la recherche publique, les métadonnées de
+résolution et les statistiques. Le signal est envoyé APRÈS le commit de
+la transaction (``transaction.on_commit``) : les récepteurs
+voient l'état commité, et rien n'est émis si la transaction est annulée.
+Un récepteur en échec est journalisé sans affecter les autres, ni la
+requête (``send_robust``).
+
+Récepteurs branchés ici (DocumentsConfig.ready) :
+  - cache de résolution : l'entrée du DID est reconstruite à partir du
+    document commité (re-warm), ou supprimée si la résolution locale est
+    désactivée — les TTL de résolution peuvent donc être longs ; à la
+    suppression, les versions en cache (sans expiration) sont oubliées ;
+  - recherche publique : la génération des pages en cache est incrémentée ;
+  - statistiques d'organisation : invalidées (global + propriétaire).
+
+Arguments du signal : did_uri, event, document_id, organization_id, owner_id,
+version_ids (versions publiées du document supprimé ; vide sinon).
+"""
+
+import structlog
+from django.db import transaction
+from django.dispatch import Signal, receiver
+
+logger = structlog.get_logger(__name__)
+
+PUBLISHED = "published"
+DEACTIVATED = "deactivated"
+DELETED = "deleted"
+STATUS_CHANGED = "status_changed"
+
+document_changed = Signal()
+
+
+def emit_document_changed(document, *, event: str) -> None:
+    """Planifie ``document_changed`` pour *document* après le commit de la transaction courante."""
+    _send_on_commit(document.__class__, _payload(document, event=event))
+
+
+def emit_documents_deleted(documents) -> None:
+    """
+    Planifie ``document_changed`` (DELETED) pour chaque document de
+    *documents* déjà publié. À appeler AVANT la suppression : les versions
+    sont lues en base.
+    """
+    from src.apps.documents.models import DIDDocumentVersion
+
+    documents = [doc for doc in documents if doc.did_uri]
+    version_ids = {}
+    for document_id, version_number in DIDDocumentVersion.objects.filter(
+        document__in=documents
+    ).values_list("document_id", "version_number"):
+        version_ids.setdefault(document_id, []).append(version_number)
+
+    for document in documents:
+        if document.id in version_ids:
+            payload = _payload(document, event=DELETED, version_ids=version_ids[document.id])
+            _send_on_commit(document.__class__, payload)
+
+
+def _payload(document, *, event: str, version_ids=()) -> dict:
+    return {
+        "did_uri": document.did_uri,
+        "event": event,
+        "document_id": document.id,
+        "organization_id": document.organization_id,
+        "owner_id": document.owner_id,
+        "version_ids": tuple(version_ids),
+    }
+
+
+def _send_on_commit(sender, payload: dict) -> None:
+    def send():
+        for handler, response in document_changed.send_robust(sender=sender, **payload):
+            if isinstance(response, Exception):
+                logger.error(
+                    "document_changed_handler_failed",
+                    handler=getattr(handler, "__name__", str(handler)),
+                    did=payload["did_uri"],
+                    error=str(response),
+                )
+
+    transaction.on_commit(send)
+
+
+# ── Récepteurs ──────────────────────────────────────────────────────────
+
+
+@receiver(document_changed, dispatch_uid="documents.rewarm_resolver_cache")
+def rewarm_resolver_cache(sender, *, did_uri: str, event: str, version_ids=(), **kwargs) -> None:
+    from src.integrations.resolver import forget_did_versions, rewarm_did
+
+    if not did_uri:
+        return
+    if event == DELETED:
+        forget_did_versions(did_uri, version_ids)
+    rewarm_did(did_uri)
+
+
+@receiver(document_changed, dispatch_uid="documents.invalidate_public_search")
+def invalidate_public_search_cache(sender, **kwargs) -> None:
+    from src.apps.documents.selectors import invalidate_public_search
+
+    invalidate_public_search()
+
+
+@receiver(document_changed, dispatch_uid="documents.invalidate_org_stats")
+def invalidate_organization_stats(sender, *, organization_id, owner_id, **kwargs) -> None:
+    from src.apps.organizations.selectors import invalidate_org_stats
+
+    invalidate_org_stats(organization_id=organization_id, user_id=owner_id)
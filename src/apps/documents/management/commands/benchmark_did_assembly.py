@@ -0,0 +1,110 @@
+"""
+Management command: benchmark_did_assembly
+
+Measures ``assemble_did_document`` against the number of verification
+methods, in the three situations the draft workflow goes through:
+
+  cold    — fragment cache empty: every verificationMethod entry is built
+            (the cost of every reassembly before fragments were cached);
+  warm    — nothing changed since the last assembly: every entry is reused;
+  add one — one method added to an already assembled document: only the
+            new entry is built (``add_verification_method`` → ``_reassemble_draft``).
+
+Runs on in-memory verification methods, so database time is not included.
+
+Usage:
+  python -m src.manage benchmark_did_assembly
+  python -m src.manage benchmark_did_assembly --vms 1 200 500 --repeat 50
+"""
+
+import timeit
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+
+from src.common.did.assembler import (
+    assemble_did_document,
+    build_did_uri,
+    clear_vm_fragment_cache,
+)
+
+_JWK = {
+    "kty": "EC",
+    "crv": "P-256",
+    "x": "f83OJ3D2xF1Bg8vub9tLe1gHMzV76e8Tus9uPHvRVEU",
+    "y": "x_FEzRu9m36HLN_tue659LNpXW6pCyStikYjKIWI5a0",
+}
+
+
+class Command(BaseCommand):
+    help = "Benchmark DID document assembly (cold / warm / one added method) against VM count."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--vms",
+            type=int,
+            nargs="+",
+            default=[1, 10, 50, 100, 200, 500],
+            help="Verification-method counts to measure.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=0,
+            help="Assemblies per measurement (default: adapted to the document size).",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'VMs':>5} {'cold µs':>12} {'warm µs':>12} {'add one µs':>12} {'speed-up':>9}")
+        for count in options["vms"]:
+            did_uri = build_did_uri("benchmark-org", "benchmark-owner", f"doc-{count}")
+            methods = _verification_methods(did_uri, count + 1)
+            before, after = methods[:count], methods
+
+            number = options["repeat"] or max(5, 5000 // (count + 1))
+
+            def cold(did_uri=did_uri, after=after):
+                clear_vm_fragment_cache()
+                assemble_did_document(did_uri=did_uri, verification_methods=after)
+
+            def warm(did_uri=did_uri, after=after):
+                assemble_did_document(did_uri=did_uri, verification_methods=after)
+
+            def add_one(did_uri=did_uri, after=after):
+                clear_vm_fragment_cache(did_uri, after[-1:])
+                assemble_did_document(did_uri=did_uri, verification_methods=after)
+
+            cold_s = _best(cold, number)
+            assemble_did_document(did_uri=did_uri, verification_methods=before)
+            warm_s = _best(warm, number)
+            add_s = _best(add_one, number)
+
+            self.stdout.write(
+                f"{count:>5} {cold_s * 1e6:>12.1f} {warm_s * 1e6:>12.1f} {add_s * 1e6:>12.1f}"
+                f" {cold_s / add_s:>8.1f}x"
+            )
+
+        clear_vm_fragment_cache()
+
+
+def _best(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def _verification_methods(did_uri: str, count: int) -> list:
+    """*count* active JsonWebKey2020 methods, each on its own certificate version."""
+    return [
+        SimpleNamespace(
+            id=f"{did_uri}-vm-{index}",
+            is_active=True,
+            method_id_fragment=f"key-{index}",
+            method_type="JsonWebKey2020",
+            relationships="authentication,assertionMethod",
+            relationship_list=["authentication", "assertionMethod"],
+            certificate=SimpleNamespace(
+                current_version_id=index,
+                current_version=SimpleNamespace(public_key_jwk=dict(_JWK, kid=f"key-{index}")),
+            ),
+        )
+        for index in range(count)
+    ]
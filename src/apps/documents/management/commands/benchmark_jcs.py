@@ -0,0 +1,273 @@
+"""
+Management command: benchmark_jcs
+
+Checks ``src.common.did.jcs`` against the RFC 8785 conformance vectors
+(Appendix B numbers, member ordering, string escaping) — and against the
+``jcs`` package on the same inputs when it is installed — then times it,
+``jcs.canonicalize`` and the former ``json.dumps(sort_keys=True)`` path on
+assembled DID documents with 1 to 500 verification methods.
+
+Exits non-zero if any vector fails, so it can gate a deployment.
+
+Usage:
+  python -m src.manage benchmark_jcs
+  python -m src.manage benchmark_jcs --vms 1 50 500 --repeat 200
+  python -m src.manage benchmark_jcs --vectors-only
+"""
+
+import json
+import struct
+import timeit
+from functools import partial
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.common.did.assembler import assemble_did_document, build_did_uri
+from src.common.did.jcs import canonicalize
+
+# RFC 8785 Appendix B: IEEE-754 bit pattern → ECMAScript serialization.
+NUMBER_VECTORS = [
+    ("0000000000000000", "0"),
+    ("8000000000000000", "0"),
+    ("0000000000000001", "5e-324"),
+    ("8000000000000001", "-5e-324"),
+    ("7fefffffffffffff", "1.7976931348623157e+308"),
+    ("ffefffffffffffff", "-1.7976931348623157e+308"),
+    ("4340000000000000", "9007199254740992"),
+    ("c340000000000000", "-9007199254740992"),
+    ("4430000000000000", "295147905179352830000"),
+    ("44b52d02c7e14af5", "9.999999999999997e+22"),
+    ("44b52d02c7e14af6", "1e+23"),
+    ("44b52d02c7e14af7", "1.0000000000000001e+23"),
+    ("444b1ae4d6e2ef4e", "999999999999999700000"),
+    ("444b1ae4d6e2ef4f", "999999999999999900000"),
+    ("444b1ae4d6e2ef50", "1e+21"),
+    ("3eb0c6f7a0b5ed8c", "9.999999999999997e-7"),
+    ("3eb0c6f7a0b5ed8d", "0.000001"),
+    ("41b3de4355555553", "333333333.3333332"),
+    ("41b3de4355555554", "333333333.33333325"),
+    ("41b3de4355555555", "333333333.3333333"),
+    ("41b3de4355555556", "333333333.3333334"),
+    ("41b3de4355555557", "333333333.33333343"),
+    ("becbf647612f3696", "-0.0000033333333333333333"),
+    ("43143ff3c1cb0959", "1424953923781206.2"),
+]
+
+# RFC 8785 §3.2.2 / §3.2.3 and the reference implementation's test data:
+# JSON input → canonical output.
+DOCUMENT_VECTORS = [
+    (
+        "values",
+        (
+            '{"numbers": [333333333.33333329, 1E30, 4.50, 2e-3, 0.000000000000000000000000001],'
+            ' "string": "\\u20ac$\\u000F\\u000aA\'\\u0042\\u0022\\u005c\\\\\\"\\/",'
+            ' "literals": [null, true, false]}'
+        ),
+        (
+            '{"literals":[null,true,false],"numbers":[333333333.3333333,1e+30,4.5,0.002,1e-27],'
+            '"string":"\u20ac$\\u000f\\nA\'B\\"\\\\\\\\\\"/"}'
+        ),
+    ),
+    (
+        "sorting",
+        (
+            '{"\\u20ac": "Euro Sign", "\\r": "Carriage Return", "\\ufb33": "Hebrew Letter Dalet With Dagesh",'
+            ' "1": "One", "\\ud83d\\ude00": "Emoji: Grinning Face", "\\u0080": "Control",'
+            ' "\\u00f6": "Latin Small Letter O With Diaeresis"}'
+        ),
+        (
+            '{"\\r":"Carriage Return","1":"One","\u0080":"Control","\u00f6":"Latin Small Letter O With Diaeresis",'
+            '"\u20ac":"Euro Sign","\U0001f600":"Emoji: Grinning Face","\ufb33":"Hebrew Letter Dalet With Dagesh"}'
+        ),
+    ),
+    (
+        "arrays",
+        '[56, {"d": true, "10": null, "1": [ ]}]',
+        '[56,{"1":[],"10":null,"d":true}]',
+    ),
+    (
+        "structures",
+        (
+            '{"1": {"f": {"f": "hi", "F": 5}, "\\n": 56.0}, "10": { }, "": "empty",'
+            ' "a": { }, "111": [ {"e": "yes", "E": "no" } ], "A": { }}'
+        ),
+        (
+            '{"":"empty","1":{"\\n":56,"f":{"F":5,"f":"hi"}},"10":{},"111":[{"E":"no","e":"yes"}],'
+            '"A":{},"a":{}}'
+        ),
+    ),
+    (
+        "french",
+        (
+            '{"peach": "This sorting order", "p\u00e9ch\u00e9": "is wrong according to French",'
+            ' "p\u00eache": "but canonicalization MUST", "sin": "ignore locale"}'
+        ),
+        (
+            '{"peach":"This sorting order","p\u00e9ch\u00e9":"is wrong according to French",'
+            '"p\u00eache":"but canonicalization MUST","sin":"ignore locale"}'
+        ),
+    ),
+    (
+        "unicode",
+        '{"Unnormalized Unicode":"A\\u030a"}',
+        '{"Unnormalized Unicode":"A\u030a"}',
+    ),
+    (
+        "weird",
+        (
+            '{"\\u20ac": "Euro Sign", "\\r": "Carriage Return", "\\u000a": "Newline", "1": "One",'
+            ' "\\u0080": "Control\\u007f", "\\ud83d\\ude02": "Smiley", "\\u00f6": "Latin Small Letter O With Diaeresis",'
+            ' "\\ufb33": "Hebrew Letter Dalet With Dagesh", "</script>": "Browser Challenge"}'
+        ),
+        (
+            '{"\\n":"Newline","\\r":"Carriage Return","1":"One","</script>":"Browser Challenge",'
+            '"\u0080":"Control\u007f","\u00f6":"Latin Small Letter O With Diaeresis","\u20ac":"Euro Sign",'
+            '"\U0001f602":"Smiley","\ufb33":"Hebrew Letter Dalet With Dagesh"}'
+        ),
+    ),
+]
+
+REJECTED_VALUES = [
+    ("NaN", float("nan")),
+    ("Infinity", float("inf")),
+    ("-Infinity", float("-inf")),
+    ("2**53 + 1", 2**53 + 1),
+]
+
+
+class Command(BaseCommand):
+    help = "Check the RFC 8785 canonicalizer against conformance vectors and benchmark it."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--vms",
+            type=int,
+            nargs="+",
+            default=[1, 10, 50, 100, 250, 500],
+            help="Verification-method counts of the benchmarked DID documents.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=0,
+            help="Canonicalizations per measurement (default: adapted to the document size).",
+        )
+        parser.add_argument(
+            "--vectors-only",
+            action="store_true",
+            help="Only run the conformance vectors.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import jcs as jcs_package  # type: ignore[import-untyped]
+        except ImportError:
+            jcs_package = None
+            self.stdout.write(self.style.WARNING("jcs package not installed: compared with the vectors only."))
+
+        failures = self._check_vectors(jcs_package)
+        if failures:
+            raise CommandError(f"{failures} conformance vector(s) failed.")
+        self.stdout.write(self.style.SUCCESS("All RFC 8785 conformance vectors pass."))
+
+        if not options["vectors_only"]:
+            self._benchmark(options["vms"], options["repeat"], jcs_package)
+
+    # ── Conformance ─────────────────────────────────────────────────────
+
+    def _check_vectors(self, jcs_package) -> int:
+        failures = 0
+
+        for bits, expected in NUMBER_VECTORS:
+            value = struct.unpack(">d", bytes.fromhex(bits))[0]
+            failures += self._expect(f"number {bits}", canonicalize(value).decode(), expected)
+            failures += self._expect(f"number {bits} in a list", canonicalize([value]).decode(), f"[{expected}]")
+
+        for name, source, expected in DOCUMENT_VECTORS:
+            data = json.loads(source)
+            failures += self._expect(f"document {name}", canonicalize(data).decode(), expected)
+            if jcs_package is not None:
+                failures += self._expect(f"document {name} (jcs package)", jcs_package.canonicalize(data).decode(), expected)
+
+        for name, value in REJECTED_VALUES:
+            try:
+                canonicalize({"n": value})
+            except ValueError:
+                continue
+            failures += 1
+            self.stdout.write(self.style.ERROR(f"  FAIL  {name} was accepted"))
+
+        # Fast and reference paths must agree on DID-shaped documents.
+        for count in (0, 1, 7):
+            doc = _did_document(count)
+            expected = json.dumps(doc, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            failures += self._expect(f"DID document, {count} VMs", canonicalize(doc).decode(), expected)
+            if jcs_package is not None:
+                failures += self._expect(f"DID document, {count} VMs (jcs package)", jcs_package.canonicalize(doc).decode(), expected)
+
+        return failures
+
+    def _expect(self, name: str, actual: str, expected: str) -> int:
+        if actual == expected:
+            return 0
+        self.stdout.write(self.style.ERROR(f"  FAIL  {name}"))
+        self.stdout.write(f"      expected: {expected}")
+        self.stdout.write(f"      actual:   {actual}")
+        return 1
+
+    # ── Benchmark ───────────────────────────────────────────────────────
+
+    def _benchmark(self, vm_counts: list[int], repeat: int, jcs_package):
+        candidates = [("canonicalize", canonicalize)]
+        if jcs_package is not None:
+            candidates.append(("jcs package", jcs_package.canonicalize))
+        candidates.append(("json.dumps", _json_dumps))
+
+        header = f"{'VMs':>5} {'bytes':>9}" + "".join(f" {name + ' µs':>17}" for name, _ in candidates)
+        self.stdout.write("")
+        self.stdout.write(header)
+        for count in vm_counts:
+            doc = _did_document(count)
+            size = len(canonicalize(doc))
+            number = repeat or max(10, 20000 // (count + 1))
+            row = f"{count:>5} {size:>9}"
+            for _, func in candidates:
+                best = min(timeit.repeat(partial(func, doc), number=number, repeat=3)) / number
+                row += f" {best * 1e6:>17.1f}"
+            self.stdout.write(row)
+
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _did_document(vm_count: int) -> dict:
+    """An assembled DID document with *vm_count* P-256 verification methods."""
+    did_uri = build_did_uri("benchmark-org", "benchmark-owner", f"doc-{vm_count}")
+    jwk = {
+        "kty": "EC",
+        "crv": "P-256",
+        "x": "f83OJ3D2xF1Bg8vub9tLe1gHMzV76e8Tus9uPHvRVEU",
+        "y": "x_FEzRu9m36HLN_tue659LNpXW6pCyStikYjKIWI5a0",
+    }
+    methods = [
+        SimpleNamespace(
+            id=index,
+            is_active=True,
+            method_id_fragment=f"key-{index}",
+            method_type="JsonWebKey2020",
+            relationships="authentication,assertionMethod",
+            relationship_list=["authentication", "assertionMethod"],
+            certificate=SimpleNamespace(
+                current_version_id=index,
+                current_version=SimpleNamespace(public_key_jwk=dict(jwk, kid=f"key-{index}")),
+            ),
+        )
+        for index in range(vm_count)
+    ]
+    return assemble_did_document(
+        did_uri=did_uri,
+        verification_methods=methods,
+        service_endpoints=[{"id": "files", "type": "LinkedDomains", "serviceEndpoint": "https://example.com/"}],
+    )
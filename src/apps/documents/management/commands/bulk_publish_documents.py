@@ -0,0 +1,95 @@
+"""
+Management command: bulk_publish_documents
+
+Publishes the APPROVED documents of an organization (or an explicit list
+of document ids) through documents.services.bulk_publish, with at most
+--concurrency publishes in flight toward SignServer / the Registrar.
+Prints one line per document and exits non-zero if any publish failed.
+
+Usage:
+  python -m src.manage bulk_publish_documents acme --as admin@acme.test
+  python -m src.manage bulk_publish_documents acme --as admin@acme.test --concurrency 8
+  python -m src.manage bulk_publish_documents acme --as admin@acme.test --ids <uuid> <uuid>
+  python -m src.manage bulk_publish_documents acme --as admin@acme.test --enqueue
+"""
+
+import time
+from uuid import UUID
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.documents.services import bulk_publish
+
+
+class Command(BaseCommand):
+    help = "Publish the APPROVED documents of an organization with bounded concurrency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("organization", help="Organization slug.")
+        parser.add_argument(
+            "--as",
+            dest="email",
+            required=True,
+            help="E-mail of the user recorded as publisher.",
+        )
+        parser.add_argument(
+            "--ids",
+            nargs="+",
+            type=UUID,
+            default=None,
+            help="Document ids to publish (default: every APPROVED document).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="Publishes in flight (default: BULK_PUBLISH_CONCURRENCY).",
+        )
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Queue one Celery publish job per document instead of publishing here.",
+        )
+
+    def handle(self, *args, **options):
+        from src.apps.organizations.models import Organization
+        from src.apps.users.models import User
+
+        organization = Organization.objects.filter(slug=options["organization"]).first()
+        if organization is None:
+            raise CommandError(f"Organization '{options['organization']}' not found.")
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"User '{options['email']}' not found.")
+
+        concurrency = options["concurrency"] or settings.BULK_PUBLISH_CONCURRENCY
+        start = time.monotonic()
+        results = bulk_publish(
+            organization=organization,
+            published_by=user,
+            document_ids=options["ids"],
+            concurrency=concurrency,
+            enqueue=options["enqueue"],
+        )
+        elapsed = time.monotonic() - start
+
+        failed = 0
+        for r in results:
+            if r["status"] in ("FAILED", "NOT_FOUND"):
+                failed += 1
+                self.stdout.write(self.style.ERROR(
+                    f"  {r['status']:<10} {r['document_id']}  {r['label']}  {r['error']}"
+                ))
+            elif r["job_id"]:
+                self.stdout.write(f"  {r['status']:<10} {r['document_id']}  {r['label']}  job {r['job_id']}")
+            else:
+                self.stdout.write(f"  {r['status']:<10} {r['document_id']}  {r['label']}  v{r['version_number']}")
+
+        summary = (
+            f"{len(results)} document(s), {len(results) - failed} ok, {failed} failed "
+            f"in {elapsed:.1f}s (concurrency {concurrency})."
+        )
+        if failed:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
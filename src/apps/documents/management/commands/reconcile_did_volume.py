@@ -0,0 +1,87 @@
+"""
+Management command: reconcile_did_volume
+
+Compares the live content of every published document (whatever its
+status: one back in review or deactivated keeps its did.json) with the
+did.json files under DID_DOCUMENTS_ROOT
+(documents.services.reconcile_did_volume) and fixes only the differences:
+missing or drifted did.json files are rewritten and missing .gz/.br
+variants added. did.json files with no published document are reported,
+and removed only with --prune. Also rebuilds the whole volume after a loss.
+
+With --dry-run nothing is touched; the differences are listed and the
+command exits non-zero if there are any (usable as a drift check).
+
+Usage:
+  python -m src.manage reconcile_did_volume --dry-run
+  python -m src.manage reconcile_did_volume
+  python -m src.manage reconcile_did_volume --org acme --processes 8
+  python -m src.manage reconcile_did_volume --prune
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.documents.services import reconcile_did_volume
+
+
+class Command(BaseCommand):
+    help = "Rebuild / reconcile the did.json files of the dids volume with the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report the differences, change nothing.")
+        parser.add_argument("--org", default=None, help="Organization slug (default: all).")
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="Worker processes (default: CPU count, 1 = in-process).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=500, help="Documents per worker task.")
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete did.json files with no published document (default: only report them).",
+        )
+        parser.add_argument("--quiet", action="store_true", help="Only print the summary.")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        start = time.monotonic()
+        report = reconcile_did_volume(
+            dry_run=dry_run,
+            organization_slug=options["org"],
+            processes=options["processes"],
+            chunk_size=options["chunk_size"],
+            prune=options["prune"],
+        )
+        elapsed = time.monotonic() - start
+
+        if not options["quiet"]:
+            for diff in report["differences"]:
+                line = f"  {diff['outcome']:<9} {diff['did']}"
+                if diff["outcome"] == "drift":
+                    line += f"  disk={diff['disk_hash'][:12]} db={diff['expected_hash'][:12]}"
+                self.stdout.write(line)
+            orphan_label = "removed" if options["prune"] and not dry_run else "orphan"
+            for path in report["orphans"]:
+                self.stdout.write(f"  {orphan_label:<9} {path}")
+
+        counts = {}
+        for diff in report["differences"]:
+            counts[diff["outcome"]] = counts.get(diff["outcome"], 0) + 1
+        rate = report["checked"] / elapsed if elapsed else 0
+        summary = (
+            f"{report['checked']} document(s) checked in {elapsed:.1f}s ({rate:.0f}/s) "
+            f"under {settings.DID_DOCUMENTS_ROOT}: {report['unchanged']} unchanged, "
+            f"{counts.get('missing', 0)} missing, {counts.get('drift', 0)} drifted, "
+            f"{counts.get('variants', 0)} without compressed variant, "
+            f"{len(report['orphans'])} orphan(s)."
+        )
+
+        drifted = report["differences"] or report["orphans"]
+        if dry_run and drifted:
+            raise CommandError(f"[dry-run] {summary}")
+        self.stdout.write(self.style.SUCCESS(f"[dry-run] {summary}" if dry_run else summary))
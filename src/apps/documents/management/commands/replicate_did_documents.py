@@ -0,0 +1,69 @@
+"""
+Management command: replicate_did_documents
+
+Pushes the live did.json of every published document (optionally one
+organization), whatever its status — back in review or deactivated
+included — to DID storage backends in batches: to seed a new S3 bucket /
+edge replica, or to bring one back after an outage. Each batch
+goes through assembler.write_did_json_batch, so S3 uploads run with
+DID_STORAGE_UPLOAD_CONCURRENCY requests in flight.
+
+The dids volume itself is better reconciled with reconcile_did_volume,
+which only rewrites what differs.
+
+Usage:
+  python -m src.manage replicate_did_documents --backend s3
+  python -m src.manage replicate_did_documents --backend s3 --org acme --batch-size 500
+  python -m src.manage replicate_did_documents            # DID_STORAGE_BACKENDS
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.documents.selectors import get_published_document_contents
+from src.common.did.assembler import build_did_uri, write_did_json_batch
+from src.common.exceptions import ApplicationError
+from src.integrations.did_storage import DID_STORAGES
+
+
+class Command(BaseCommand):
+    help = "Write the published did.json files to DID storage backends in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backend",
+            action="append",
+            choices=DID_STORAGES,
+            default=None,
+            help="Backend to write to (repeatable; default: DID_STORAGE_BACKENDS).",
+        )
+        parser.add_argument("--org", default=None, help="Organization slug (default: all).")
+        parser.add_argument("--batch-size", type=int, default=200, help="Documents per batch.")
+
+    def handle(self, *args, **options):
+        rows = get_published_document_contents(organization_slug=options["org"])
+        batch, written = [], 0
+        start = time.monotonic()
+        try:
+            for org_slug, owner_id, label, content in rows.iterator(chunk_size=2000):
+                owner = str(owner_id) if owner_id else "unknown"
+                batch.append((build_did_uri(org_slug, owner, label), content))
+                if len(batch) >= options["batch_size"]:
+                    written += self._flush(batch, options["backend"])
+                    batch = []
+            if batch:
+                written += self._flush(batch, options["backend"])
+        except ApplicationError as e:
+            raise CommandError(f"Stopped after {written} document(s): {e.message}") from e
+
+        elapsed = time.monotonic() - start
+        rate = written / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(f"{written} document(s) replicated in {elapsed:.1f}s ({rate:.0f}/s).")
+        )
+
+    def _flush(self, batch: list, backends: list[str] | None) -> int:
+        write_did_json_batch(batch, backends=backends)
+        self.stdout.write(f"  {len(batch)} document(s) written")
+        return len(batch)
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.9 on 2026-10-17 02:33
+
+import uuid
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0004_diddocument_last_reminded_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('draft_hash', models.CharField(help_text='SHA-256 du draft_content canonique et de la version de base.', max_length=64)),
+                ('status', models.CharField(choices=[('QUEUED', 'Queued'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='QUEUED', max_length=20)),
+                ('skip_review', models.BooleanField(default=False)),
+                ('error', models.TextField(blank=True, default='')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='publish_jobs', to='documents.diddocument')),
+                ('requested_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('version', models.ForeignKey(blank=True, help_text='Version créée par ce job (SUCCEEDED uniquement).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='documents.diddocumentversion')),
+            ],
+            options={
+                'db_table': 'did_publish_jobs',
+                'ordering': ['-created_at'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status__in', ['QUEUED', 'RUNNING', 'SUCCEEDED'])), fields=('document', 'draft_hash'), name='unique_live_publish_job_per_draft')],
+            },
+        ),
+    ]
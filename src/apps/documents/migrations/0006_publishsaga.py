@@ -0,0 +1,47 @@
+# Generated by Django 6.0.9 on 2026-10-17 02:37
+
+import uuid
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0005_publishjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishSaga',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('step', models.CharField(choices=[('STARTED', 'Started'), ('SIGNED', 'Signed'), ('REGISTERED', 'Registered'), ('WRITTEN', 'Written to disk'), ('PERSISTED', 'Persisted'), ('ABORTED', 'Aborted'), ('COMPENSATED', 'Compensated'), ('COMPENSATION_FAILED', 'Compensation failed'), ('FAILED', 'Failed (manual intervention)')], default='STARTED', max_length=20)),
+                ('did_uri', models.CharField(max_length=500)),
+                ('is_create', models.BooleanField()),
+                ('base_version', models.PositiveIntegerField(default=0, help_text='Numéro de la version en ligne au démarrage (0 = première publication).')),
+                ('skip_review', models.BooleanField(default=False)),
+                ('content', models.JSONField(help_text='Document envoyé au Registrar.')),
+                ('previous_content', models.JSONField(blank=True, help_text="Contenu en ligne avant la saga, restauré en compensation d'une mise à jour.", null=True)),
+                ('proof_value', models.TextField(blank=True, default='')),
+                ('registrar_response', models.JSONField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('recovery_attempts', models.PositiveIntegerField(default=0)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='publish_sagas', to='documents.diddocument')),
+                ('publish_job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='documents.publishjob')),
+                ('published_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'did_publish_sagas',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['step', 'updated_at'], name='publish_saga_step_idx')],
+            },
+        ),
+    ]
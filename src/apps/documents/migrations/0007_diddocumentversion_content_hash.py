@@ -0,0 +1,18 @@
+# Generated by Django 6.0.9 on 2026-10-17 02:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0006_publishsaga'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='diddocumentversion',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', help_text='SHA-256 du did.json publié (ETag fort).', max_length=64),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.9 on 2026-10-17 02:59
+
+from django.db import migrations, models
+
+
+def backfill_did_uri(apps, schema_editor):
+    from src.common.did.assembler import build_did_uri
+
+    DIDDocument = apps.get_model("documents", "DIDDocument")
+    docs = list(DIDDocument.objects.filter(did_uri__isnull=True).select_related("organization"))
+    for doc in docs:
+        doc.did_uri = build_did_uri(
+            org_slug=doc.organization.slug,
+            owner_identifier=str(doc.owner_id) if doc.owner_id else "unknown",
+            label=doc.label,
+        )
+    DIDDocument.objects.bulk_update(docs, ["did_uri"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0007_diddocumentversion_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='diddocument',
+            name='did_uri',
+            field=models.CharField(blank=True, editable=False, help_text="URI DID complet, dénormalisé et indexé (résolution / recherche sans jointure). Renseigné par les services à la création ; le slug, le propriétaire et l'étiquette ne changent plus ensuite.", max_length=255, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_did_uri, migrations.RunPython.noop),
+    ]
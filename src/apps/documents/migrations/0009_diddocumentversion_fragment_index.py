@@ -0,0 +1,33 @@
+# Generated by Django 6.0.9 on 2026-10-17 03:13
+
+from django.db import migrations, models
+
+
+def backfill_fragment_index(apps, schema_editor):
+    from src.common.did.assembler import build_fragment_index
+
+    DIDDocumentVersion = apps.get_model("documents", "DIDDocumentVersion")
+    batch = []
+    for version in DIDDocumentVersion.objects.only("id", "content").iterator(chunk_size=1000):
+        version.fragment_index = build_fragment_index(version.content)
+        batch.append(version)
+        if len(batch) >= 1000:
+            DIDDocumentVersion.objects.bulk_update(batch, ["fragment_index"])
+            batch = []
+    DIDDocumentVersion.objects.bulk_update(batch, ["fragment_index"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0008_diddocument_did_uri'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='diddocumentversion',
+            name='fragment_index',
+            field=models.JSONField(blank=True, default=dict, help_text="Fragment → objet (verificationMethod, service) du contenu publié, pour le déréférencement d'URL DID sans relire le document."),
+        ),
+        migrations.RunPython(backfill_fragment_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.9 on 2026-10-17 03:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0009_diddocumentversion_fragment_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='diddocumentversion',
+            index=models.Index(fields=['document', 'published_at'], name='doc_version_published_idx'),
+        ),
+    ]
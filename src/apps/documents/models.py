@@ -38,6 +38,16 @@ class DIDDocument(BaseModel):
         max_length=120,
         help_text="Segment de chemin dans l'URI DID : did:web:<host>:<org_slug>:<user>:<label>",
     )
+    did_uri = models.CharField(
+        max_length=255,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="URI DID complet, dénormalisé et indexé (résolution / recherche sans jointure). "
+        "Renseigné par les services à la création ; le slug, le propriétaire et l'étiquette "
+        "ne changent plus ensuite.",
+    )
 
     owner = models.ForeignKey(
         "users.User",
@@ -125,7 +135,7 @@ class DIDDocument(BaseModel):
         ]
 
     def __str__(self) -> str:
-        return (
+        return self.did_uri or (
             f"did:web:...:{self.organization.slug}:{self.owner_identifier}:{self.label}"
         )
 
@@ -136,13 +146,16 @@ class DIDDocument(BaseModel):
         Utilise l'identifiant unique (UUID) du propriétaire pour garantir
         la stabilité de l'URI indépendamment de l'adresse e-mail.
         """
-        if self.owner:
-            return str(self.owner.id)
+        if self.owner_id:
+            return str(self.owner_id)
         return "unknown"
 
     @property
     def did_uri_suffix(self) -> str:
-        """Retourne la partie org_slug:user:label. L'URI complet nécessite la conf de l'hôte."""
+        """Retourne la partie org_slug:user:label. L'URI complet est dans did_uri."""
+        if self.did_uri:
+            # did:web:<host>:<org_slug>:<user>:<label> — sans jointure vers l'organisation
+            return self.did_uri.split(":", 3)[3]
         return f"{self.organization.slug}:{self.owner_identifier}:{self.label}"
 
     def is_owner(self, user) -> bool:
@@ -209,6 +222,18 @@ class DIDDocumentVersion(BaseModel):
         default="",
         help_text="Bloc JWS ou de preuve depuis SignServer.",
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="SHA-256 du did.json publié (ETag fort).",
+    )
+    fragment_index = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Fragment → objet (verificationMethod, service) du contenu publié, "
+                  "pour le déréférencement d'URL DID sans relire le document.",
+    )
 
     published_at = models.DateTimeField(null=True, blank=True)
     published_by = models.ForeignKey(
@@ -227,11 +252,16 @@ class DIDDocumentVersion(BaseModel):
         db_table = "did_document_versions"
         ordering = ["-version_number"]
         constraints = [
+            # Sert aussi d'index pour la résolution par versionId.
             models.UniqueConstraint(
                 fields=["document", "version_number"],
                 name="unique_version_per_document",
             ),
         ]
+        indexes = [
+            # Résolution par versionTime : dernière version publiée à une date.
+            models.Index(fields=["document", "published_at"], name="doc_version_published_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.document} v{self.version_number}"
@@ -293,3 +323,144 @@ class DocumentVerificationMethod(BaseModel):
     @property
     def relationship_list(self) -> list[str]:
         return [r.strip() for r in self.relationships.split(",") if r.strip()]
+
+
+class PublishJobStatus(models.TextChoices):
+    QUEUED = "QUEUED", "Queued"
+    RUNNING = "RUNNING", "Running"
+    SUCCEEDED = "SUCCEEDED", "Succeeded"
+    FAILED = "FAILED", "Failed"
+
+
+class PublishJob(BaseModel):
+    """
+    Publication asynchrone d'un document (mode async de l'API publish).
+
+    Idempotente par (document, draft_hash) : tant qu'un job pour le même
+    brouillon est en file, en cours ou réussi, une nouvelle demande renvoie
+    ce job au lieu d'en créer un second (double-clic, retry client).
+    """
+
+    document = models.ForeignKey(
+        DIDDocument,
+        on_delete=models.CASCADE,
+        related_name="publish_jobs",
+    )
+    draft_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 du draft_content canonique et de la version de base.",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=PublishJobStatus.choices,
+        default=PublishJobStatus.QUEUED,
+    )
+    skip_review = models.BooleanField(default=False)
+    requested_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    version = models.ForeignKey(
+        DIDDocumentVersion,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        help_text="Version créée par ce job (SUCCEEDED uniquement).",
+    )
+    error = models.TextField(blank=True, default="")
+    attempts = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "did_publish_jobs"
+        ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["document", "draft_hash"],
+                condition=models.Q(
+                    status__in=["QUEUED", "RUNNING", "SUCCEEDED"],
+                ),
+                name="unique_live_publish_job_per_draft",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.document} publish {self.status}"
+
+
+class PublishSagaStep(models.TextChoices):
+    STARTED = "STARTED", "Started"
+    SIGNED = "SIGNED", "Signed"
+    REGISTERED = "REGISTERED", "Registered"
+    WRITTEN = "WRITTEN", "Written to disk"
+    PERSISTED = "PERSISTED", "Persisted"
+    ABORTED = "ABORTED", "Aborted"
+    COMPENSATED = "COMPENSATED", "Compensated"
+    COMPENSATION_FAILED = "COMPENSATION_FAILED", "Compensation failed"
+    FAILED = "FAILED", "Failed (manual intervention)"
+
+
+class PublishSaga(BaseModel):
+    """
+    Journal durable d'une saga sign_and_publish.
+
+    Chaque étape est écrite en autocommit (settings.PUBLISH_SAGA_DATABASE)
+    avant de passer à la suivante : si le processus meurt entre le
+    Registrar et la BD, la tâche de reprise sait quoi reprendre ou annuler.
+    """
+
+    document = models.ForeignKey(
+        DIDDocument,
+        on_delete=models.CASCADE,
+        related_name="publish_sagas",
+    )
+    publish_job = models.ForeignKey(
+        PublishJob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    published_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    step = models.CharField(
+        max_length=20,
+        choices=PublishSagaStep.choices,
+        default=PublishSagaStep.STARTED,
+    )
+    did_uri = models.CharField(max_length=500)
+    is_create = models.BooleanField()
+    base_version = models.PositiveIntegerField(
+        default=0,
+        help_text="Numéro de la version en ligne au démarrage (0 = première publication).",
+    )
+    skip_review = models.BooleanField(default=False)
+    content = models.JSONField(help_text="Document envoyé au Registrar.")
+    previous_content = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Contenu en ligne avant la saga, restauré en compensation d'une mise à jour.",
+    )
+    proof_value = models.TextField(blank=True, default="")
+    registrar_response = models.JSONField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    recovery_attempts = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "did_publish_sagas"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["step", "updated_at"], name="publish_saga_step_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.document} saga {self.step}"
@@ -1,16 +1,25 @@
 import math
-from urllib.parse import urlparse
+from datetime import datetime
 
+import structlog
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpRequest
-from ninja import Query, Router
+from ninja import Query, Router, Schema
 from ninja.throttling import AnonRateThrottle
 
 from src.apps.documents.models import DocumentStatus
-from src.apps.documents.selectors import search_published_documents
+from src.apps.documents.selectors import (
+    public_search_cache_key,
+    search_published_documents,
+)
 from src.apps.organizations.models import Organization
+from src.common.exceptions import ValidationError
 from src.common.types import OrgStatus
 
+logger = structlog.get_logger(__name__)
+
 public_throttle = AnonRateThrottle("60/m")
 
 router = Router(tags=["Public Search"])
@@ -27,6 +36,22 @@ class PublicDocResult(dict):
     pass
 
 
+class VerifyProofRequest(Schema):
+    document: dict
+    public_key_jwk: dict | None = None
+
+
+class ResolveBatchRequest(Schema):
+    dids: list[str]
+
+
+class VerifyProofResult(Schema):
+    verified: bool
+    verificationMethod: str | None
+    created: str | None
+    error: str | None
+
+
 # ── Search published documents ───────────────────────────────────────────
 
 
@@ -36,7 +61,7 @@ class PublicDocResult(dict):
     summary="Search published DID documents (public, no auth)",
     throttle=public_throttle,
 )
-def search_documents(
+async def search_documents(
         request: HttpRequest,
         q: str = Query("", description="Search term (label, DID URI, org name)"),
         org_id: str = Query("", description="Filter by organization ID"),
@@ -47,7 +72,33 @@ def search_documents(
     """
     Recherche publique dans tous les documents DID publiés.
     Retourne des résultats paginés avec les informations de base du document et l'URI DID.
+    Pages en cache PUBLIC_SEARCH_CACHE_TTL s, périmées à chaque publication / désactivation.
+    Sans Redis, la requête est exécutée sans cache.
     """
+    cache_key = await sync_to_async(public_search_cache_key)(
+        q=q, org_id=org_id, sort=sort, page=page, page_size=page_size
+    )
+    if cache_key is not None:
+        try:
+            cached = await cache.aget(cache_key)
+        except Exception as e:
+            logger.warning("public_search_cache_unavailable", operation="get", error=str(e))
+            cache_key = cached = None
+        if cached is not None:
+            return cached
+
+    response = await sync_to_async(_search_page)(
+        q=q, org_id=org_id, sort=sort, page=page, page_size=page_size
+    )
+    if cache_key is not None:
+        try:
+            await cache.aset(cache_key, response, timeout=settings.PUBLIC_SEARCH_CACHE_TTL)
+        except Exception as e:
+            logger.warning("public_search_cache_unavailable", operation="set", error=str(e))
+    return response
+
+
+def _search_page(*, q: str, org_id: str, sort: str, page: int, page_size: int) -> dict:
     docs, total = search_published_documents(
         q=q,
         org_id=org_id,
@@ -58,19 +109,15 @@ def search_documents(
 
     total_pages = max(1, math.ceil(total / page_size))
 
-    domain = settings.PLATFORM_DOMAIN
-    domain = urlparse(domain).netloc
-
     results = []
     for doc in docs:
         org_slug = doc.organization.slug if doc.organization else ""
-        did_uri = f"did:web:{domain}:{org_slug}:{doc.owner_identifier}:{doc.label}"
 
         results.append(
             {
                 "id": str(doc.id),
                 "label": doc.label,
-                "did_uri": did_uri,
+                "did_uri": doc.did_uri,
                 "status": doc.status,
                 "organization_name": doc.organization.name if doc.organization else "",
                 "organization_slug": org_slug,
@@ -90,14 +137,13 @@ def search_documents(
     }
 
 
-
 @router.get(
     f"{_P}/organizations",
     response=list,
     summary="List approved organizations (public, no auth)",
     throttle=public_throttle,
 )
-def list_organizations(request: HttpRequest):
+async def list_organizations(request: HttpRequest):
     """
     Returns a simple list of approved organizations for the search filter.
     Only organizations that have at least one published document are included.
@@ -112,7 +158,7 @@ def list_organizations(request: HttpRequest):
         .order_by("name")
     )
 
-    return [{"id": str(o["id"]), "name": o["name"], "slug": o["slug"]} for o in orgs]
+    return [{"id": str(o["id"]), "name": o["name"], "slug": o["slug"]} async for o in orgs]
 
 
 # ── DID Resolver proxy ──────────────────────────────────────────────────
@@ -124,13 +170,20 @@ def list_organizations(request: HttpRequest):
     summary="Resolve a DID via the Universal Resolver (public, no auth)",
     throttle=public_throttle,
 )
-def resolve_did_proxy(
+async def resolve_did_proxy(
         request: HttpRequest,
         did: str = Query(..., description="The fully-qualified DID URI to resolve"),
+        version_id: int | None = Query(None, alias="versionId", ge=1, description="Resolve this version"),
+        version_time: datetime | None = Query(
+            None, alias="versionTime", description="Resolve the version in force at this time (UTC if no offset)"
+        ),
 ):
     """
     Proxy DID resolution through the backend to the configured Universal Resolver.
 
+    versionId / versionTime resolve a past version (served from the
+    version history for DIDs hosted here, cached indefinitely).
+
     Returns the full W3C DID Resolution Result:
       {
         "didDocument": { ... },
@@ -138,32 +191,127 @@ def resolve_did_proxy(
         "didDocumentMetadata": { ... }
       }
     """
-    from src.integrations.resolver import resolve_did
+    from src.integrations.resolver import aresolve_did, resolve_did_version
 
-    result = resolve_did(did)
+    if version_id is None and version_time is None:
+        result = await aresolve_did(did)
+    else:
+        result = await sync_to_async(resolve_did_version)(did, version_id=version_id, version_time=version_time)
 
     # Log resolution for analytics (fire-and-forget, never block the response)
+    await sync_to_async(_log_resolutions)([did])
+
+    return result
+
+
+@router.post(
+    "/resolve/batch",
+    response=dict,
+    summary="Resolve a batch of DIDs in one call (public, no auth)",
+    throttle=public_throttle,
+)
+def resolve_did_batch(request: HttpRequest, payload: ResolveBatchRequest):
+    """
+    Résout plusieurs DID en un appel : doublons résolus une fois, DID en
+    cache ou hébergés ici servis immédiatement, les autres demandés au
+    Universal Resolver en parallèle.
+
+    Répond 200 avec un résultat par DID, dans l'ordre :
+      {"did": ..., "result": { <DID Resolution Result> }}
+      {"did": ..., "error": "...", "status": 404}
+    """
+    from src.integrations.resolver import resolve_dids
+
+    dids = list(dict.fromkeys(payload.dids))
+    if not dids:
+        raise ValidationError("Provide at least one DID.")
+    if len(dids) > settings.DID_RESOLVE_BATCH_MAX_DIDS:
+        raise ValidationError(
+            f"At most {settings.DID_RESOLVE_BATCH_MAX_DIDS} DIDs per batch (got {len(dids)})."
+        )
+
+    outcomes = resolve_dids(dids)  # copies: the cached results are never handed out
+    resolved = [did for did, outcome in outcomes.items() if "result" in outcome]
+    _log_resolutions(resolved)
+
+    return {
+        "results": [{"did": did, **outcome} for did, outcome in outcomes.items()],
+        "resolved": len(resolved),
+        "failed": len(outcomes) - len(resolved),
+    }
+
+
+@router.get(
+    "/dereference",
+    response=dict,
+    summary="Dereference a DID URL: fragment, ?service=, ?versionId= or ?versionTime= (public, no auth)",
+    throttle=public_throttle,
+)
+def dereference_did_url(
+        request: HttpRequest,
+        did_url: str = Query(
+            ...,
+            description="DID URL, URL-encoded (e.g. did:web:…:passport%23key-1, did:web:…:passport%3Fservice%3Dfiles)",
+        ),
+):
+    """
+    Déréférence une URL DID vers le seul objet demandé — méthode de
+    vérification (#fragment) ou service (?service=), éventuellement d'une
+    version publiée (?versionId=, ?versionTime=) — au lieu du document entier.
+
+    Pour les DID hébergés ici, l'objet est lu dans l'index des fragments
+    construit à la publication.
+    """
+    from src.integrations.dereferencer import dereference
+
+    return dereference(did_url)
+
+
+def _log_resolutions(dids: list[str]) -> None:
+    """Audit DID_RESOLVED par DID (analytique) ; ne doit jamais interrompre la résolution."""
     try:
         from src.apps.audits.services import log_action
         from src.apps.organizations.selectors import get_organization_by_slug
 
-        # Parse org slug from DID URI: did:web:domain:ORG_SLUG:user:label
-        parts = did.split(":")
-        org = None
-        if len(parts) >= 4:
-            org = get_organization_by_slug(slug=parts[3])
-
-        log_action(
-            actor=None,
-            action="DID_RESOLVED",
-            resource_type="DID_DOCUMENT",
-            resource_id=org.id if org else None,
-            organization=org,
-            description=f"DID resolved: {did}",
-            metadata={"did": did},
-        )
+        organizations = {}
+        for did in dids:
+            # Parse org slug from DID URI: did:web:domain:ORG_SLUG:user:label
+            parts = did.split(":")
+            slug = parts[3] if len(parts) >= 4 else None
+            if slug not in organizations:
+                organizations[slug] = get_organization_by_slug(slug=slug) if slug else None
+            org = organizations[slug]
+
+            log_action(
+                actor=None,
+                action="DID_RESOLVED",
+                resource_type="DID_DOCUMENT",
+                resource_id=org.id if org else None,
+                organization=org,
+                description=f"DID resolved: {did}",
+                metadata={"did": did},
+            )
     except Exception:
         pass  # L'audit ne doit jamais interrompre la résolution
 
-    return result
 
+# ── Proof verification ──────────────────────────────────────────────────
+
+
+@router.post(
+    "/verify",
+    response=VerifyProofResult,
+    summary="Verify the ecdsa-jcs-2019 proof of a DID document (public, no auth)",
+    throttle=public_throttle,
+)
+def verify_document_proof(request: HttpRequest, payload: VerifyProofRequest):
+    """
+    Vérifie localement la preuve Data Integrity (ecdsa-jcs-2019) d'un
+    document DID signé, contre le publicKeyJwk de la méthode de
+    vérification référencée (ou public_key_jwk si fourni).
+
+    Répond toujours 200 : verified=false et error décrivent un échec.
+    """
+    from src.common.did.assembler import verify_proof
+
+    return verify_proof(payload.document, public_key_jwk=payload.public_key_jwk)
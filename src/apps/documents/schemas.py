@@ -51,6 +51,11 @@ class DeactivateSchema(Schema):
     reason: str = ""
 
 
+class BulkPublishSchema(Schema):
+    document_ids: list[UUID] | None = None  # None = tous les documents APPROVED
+    concurrency: int | None = None
+
+
 # ── Schémas de réponse ──────────────────────────────────────────────────
 
 
@@ -111,10 +116,41 @@ class DocVersionSchema(Schema):
     version_number: int
     content: Any
     signature: str
+    content_hash: str
     published_at: str | None
     published_by_email: str
 
 
+class PublishJobSchema(Schema):
+    id: UUID
+    document_id: UUID
+    status: str
+    draft_hash: str
+    version_number: int | None
+    error: str
+    attempts: int
+    created_at: str
+    started_at: str | None
+    finished_at: str | None
+    status_url: str
+
+
+class BulkPublishItemSchema(Schema):
+    document_id: UUID
+    label: str
+    status: str
+    version_number: int | None
+    job_id: UUID | None
+    error: str
+
+
+class BulkPublishResultSchema(Schema):
+    total: int
+    succeeded: int
+    failed: int
+    results: list[BulkPublishItemSchema]
+
+
 class MessageSchema(Schema):
     message: str
 
@@ -11,6 +11,7 @@ from src.apps.documents.models import (
     DIDDocumentVersion,
     DocumentStatus,
     DocumentVerificationMethod,
+    PublishJob,
 )
 
 # ── Recherches d'objet unique ───────────────────────────────────────────
@@ -30,9 +31,163 @@ def get_document_by_id(*, doc_id: UUID) -> DIDDocument | None:
         return None
 
 
+def get_document_by_did_uri(*, did_uri: str) -> DIDDocument | None:
+    """Document par URI DID complet — une recherche sur l'index unique de did_uri, sans jointure."""
+    try:
+        return DIDDocument.objects.get(did_uri=did_uri)
+    except DIDDocument.DoesNotExist:
+        return None
+
+
+def get_document_for_resolution(*, did_uri: str) -> DIDDocument | None:
+    """
+    Document publié par URI DID, pour la résolution locale : version
+    courante jointe, date de première publication annotée
+    (``first_published_at``). None si le DID n'a jamais été publié.
+
+    Sélection sur la version publiée, pas sur le statut : un document
+    repassé en brouillon ou en examen reste servi avec sa dernière version
+    (comme son did.json), DEACTIVATED compris.
+    """
+    from django.db.models import Min
+
+    try:
+        return (
+            DIDDocument.objects.filter(
+                did_uri=did_uri,
+                current_version__isnull=False,
+                content__isnull=False,
+            )
+            .select_related("current_version")
+            .annotate(first_published_at=Min("versions__published_at"))
+            .get()
+        )
+    except DIDDocument.DoesNotExist:
+        return None
+
+
+def get_version_for_dereferencing(
+    *,
+    did_uri: str,
+    version_number: int | None = None,
+    fragment: str | None = None,
+) -> dict | None:
+    """
+    Version publiée d'un DID pour le déréférencement d'URL DID : la version
+    courante, ou *version_number*. Une seule requête, en valeurs.
+
+    Avec *fragment*, seul l'objet indexé est lu (``fragment_object``, None
+    si le fragment est absent de la version), pas le contenu ; sans, le
+    contenu complet (``content``). Clés communes : version_number,
+    published_at, document__status, document__updated_at. None si le DID
+    n'a pas été publié ou si la version n'existe pas.
+
+    Sélection sur la version publiée, pas sur le statut du document (voir
+    ``get_document_for_resolution``).
+    """
+    from django.db.models import F
+    from django.db.models.fields.json import KeyTransform
+
+    qs = DIDDocumentVersion.objects.filter(document__did_uri=did_uri, published_at__isnull=False)
+    if version_number is None:
+        qs = qs.filter(document__current_version_id=F("id"))
+    else:
+        qs = qs.filter(version_number=version_number)
+
+    fields = ["version_number", "published_at", "document__status", "document__updated_at"]
+    if fragment is None:
+        fields.append("content")
+    else:
+        qs = qs.annotate(fragment_object=KeyTransform(fragment, "fragment_index"))
+        fields.append("fragment_object")
+    return qs.values(*fields).first()
+
+
+def get_published_version(*, did_uri: str, version_number: int) -> DIDDocumentVersion | None:
+    """
+    Version *version_number* d'un DID publié (index unique (document,
+    version_number)), date de première publication annotée
+    (``first_published_at``). None si elle n'existe pas.
+
+    Une version publiée est immuable : servie quel que soit le statut
+    actuel du document.
+    """
+    from django.db.models import OuterRef, Subquery
+
+    first_published = DIDDocumentVersion.objects.filter(
+        document=OuterRef("document"), version_number=1
+    ).values("published_at")[:1]
+    try:
+        return (
+            DIDDocumentVersion.objects.filter(
+                document__did_uri=did_uri,
+                version_number=version_number,
+                published_at__isnull=False,
+            )
+            .annotate(first_published_at=Subquery(first_published))
+            .get()
+        )
+    except DIDDocumentVersion.DoesNotExist:
+        return None
+
+
+def get_version_number_at(*, did_uri: str, at) -> int | None:
+    """
+    Numéro de la version d'un DID publié en vigueur à *at* : la dernière
+    publiée à cette date ou avant, quel que soit le statut actuel du
+    document (index (document, published_at)). None si aucune.
+    """
+    return (
+        DIDDocumentVersion.objects.filter(
+            document__did_uri=did_uri,
+            published_at__lte=at,
+        )
+        .order_by("-published_at")
+        .values_list("version_number", flat=True)
+        .first()
+    )
+
+
+def get_publish_job(*, job_id: UUID, document_id: UUID) -> PublishJob | None:
+    try:
+        return PublishJob.objects.select_related("version").get(
+            id=job_id, document_id=document_id
+        )
+    except PublishJob.DoesNotExist:
+        return None
+
+
 # ── Requêtes de liste ───────────────────────────────────────────────────
 
 
+def get_documents_for_bulk_publish(
+    *, organization_id: UUID, document_ids: list[UUID] | None = None
+) -> QuerySet[DIDDocument]:
+    """Documents ciblés par une publication groupée (tous les APPROVED si document_ids est None)."""
+    qs = DIDDocument.objects.filter(organization_id=organization_id)
+    if document_ids is None:
+        qs = qs.filter(status=DocumentStatus.APPROVED)
+    else:
+        qs = qs.filter(id__in=document_ids)
+    return qs.select_related("organization", "owner", "current_version").order_by("created_at")
+
+
+def get_published_document_contents(*, organization_slug: str | None = None) -> QuerySet:
+    """
+    (slug d'org, id du propriétaire, étiquette, contenu) des documents dont
+    le did.json est en ligne, sans ordre ni instances de modèle — à
+    parcourir avec ``.iterator()``.
+
+    Tout document déjà publié (``content`` défini) quel que soit son statut :
+    repassé en examen ou en brouillon, il reste servi avec sa dernière
+    version publiée, et DEACTIVATED garde aussi son did.json.
+    """
+    qs = DIDDocument.objects.filter(content__isnull=False)
+    if organization_slug:
+        qs = qs.filter(organization__slug=organization_slug)
+    return qs.order_by().values_list("organization__slug", "owner_id", "label", "content")
+
+
 def get_org_documents(*, organization_id: UUID, user_id: UUID) -> QuerySet[DIDDocument]:
     """Tous les documents pour une organisation (pour ORG_ADMIN / AUDITOR)."""
     from django.db.models import Count, Q
@@ -106,6 +261,22 @@ def get_active_verification_methods(
     )
 
 
+def get_verification_methods_for_assembly(
+    *, document_id: UUID
+) -> QuerySet[DocumentVerificationMethod]:
+    """
+    Méthodes actives pour l'assemblage du document DID.
+
+    Joint seulement le certificat (current_version_id) : les JWK ne sont
+    chargées que pour les fragments absents du cache de l'assembleur.
+    """
+    return (
+        DocumentVerificationMethod.objects.filter(document_id=document_id, is_active=True)
+        .select_related("certificate")
+        .order_by("created_at")
+    )
+
+
 # ── Versions ────────────────────────────────────────────────────────────
 
 
@@ -170,7 +341,10 @@ def search_published_documents(
         "organization", "owner", "current_version"
     ).annotate(version_count=Count("versions", distinct=True))
 
-    if q:
+    if q.startswith("did:"):
+        # URI DID complet : recherche exacte sur l'index de did_uri
+        qs = qs.filter(did_uri=q)
+    elif q:
         qs = qs.filter(
             Q(label__icontains=q)
             | Q(organization__name__icontains=q)
@@ -194,6 +368,50 @@ def search_published_documents(
     return qs[offset: offset + page_size], total
 
 
+# ── Cache de la recherche publique ──────────────────────────────────────
+#
+# Les pages de /search/documents sont mises en cache sous une génération :
+# invalidate_public_search() (à chaque publication / désactivation, via
+# documents.events) l'incrémente, ce qui périme toutes les pages d'un coup.
+# Si Redis est indisponible, la recherche s'exécute sans cache.
+
+_PUBLIC_SEARCH_GENERATION_KEY = "public_search:generation"
+
+
+def public_search_cache_key(**params) -> str | None:
+    """
+    Clé de cache d'une page de recherche publique pour *params*, dans la
+    génération courante ; None si le cache est indisponible.
+    """
+    import hashlib
+    import json
+
+    import structlog
+    from django.core.cache import cache
+
+    try:
+        generation = cache.get_or_set(_PUBLIC_SEARCH_GENERATION_KEY, 1, timeout=None)
+    except Exception as e:
+        structlog.get_logger(__name__).warning("public_search_cache_unavailable", operation="generation", error=str(e))
+        return None
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:32]
+    return f"public_search:{generation}:{digest}"
+
+
+def invalidate_public_search() -> None:
+    """Périme toutes les pages de recherche publique en cache."""
+    import structlog
+    from django.core.cache import cache
+
+    try:
+        try:
+            cache.incr(_PUBLIC_SEARCH_GENERATION_KEY)
+        except ValueError:
+            cache.set(_PUBLIC_SEARCH_GENERATION_KEY, 2, timeout=None)
+    except Exception as e:
+        structlog.get_logger(__name__).warning("public_search_cache_unavailable", operation="invalidate", error=str(e))
+
+
 def get_verifiable_credential(document: DIDDocument) -> dict | None:
     """
     Construire un Identifiant Vérifiable pour un doc DID publié.
@@ -209,7 +427,7 @@ def get_verifiable_credential(document: DIDDocument) -> dict | None:
     if not document.content or document.status == DocumentStatus.DEACTIVATED:
         return None
 
-    did_uri = build_did_uri(
+    did_uri = document.did_uri or build_did_uri(
         org_slug=document.organization.slug,
         owner_identifier=document.owner_identifier,
         label=document.label,
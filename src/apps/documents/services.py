@@ -4,30 +4,52 @@ Services de Document DID (opérations d'écriture).
 
 import re
 
+import hashlib
 import json
 import base64
 import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 import structlog
-from django.db import transaction
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from django.utils import timezone
 
 from src.apps.certificates.models import CertificateStatus
+from src.apps.documents import events
+from src.apps.documents.events import emit_document_changed
 from src.apps.documents.models import (
     DIDDocument,
     DIDDocumentVersion,
     DocumentStatus,
     DocumentVerificationMethod,
+    PublishJob,
+    PublishJobStatus,
+    PublishSaga,
+    PublishSagaStep,
     VerificationRelationship,
 )
 from src.apps.users.models import User
 from src.common.did.assembler import (
     assemble_did_document,
     build_did_uri,
+    build_fragment_index,
+    delete_did_json_from_disk,
     normalize_did_document,
     sign_and_attach_proof,
+    uncached_certificate_versions,
     write_did_json_to_disk,
 )
-from src.common.exceptions import ConflictError, NotFoundError, ValidationError
+from src.common.exceptions import (
+    ApplicationError,
+    ConflictError,
+    NotFoundError,
+    OutcomeUnknownError,
+    ServiceUnavailableError,
+    ValidationError,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -35,7 +57,9 @@ LABEL_RE = re.compile(r"^[a-z0-9][a-z0-9\-]{0,118}[a-z0-9]$")
 
 
 def _did_uri_for(doc: DIDDocument) -> str:
-    """Construit l'URI DID à partir des relations d'un document."""
+    """URI DID d'un document : la colonne did_uri, ou reconstruit à partir de ses relations."""
+    if doc.did_uri:
+        return doc.did_uri
     return build_did_uri(
         org_slug=doc.organization.slug,
         owner_identifier=doc.owner_identifier,
@@ -112,6 +136,11 @@ def create_document(
     doc = DIDDocument.objects.create(
         organization=organization,
         label=label,
+        did_uri=build_did_uri(
+            org_slug=organization.slug,
+            owner_identifier=str(created_by.id),
+            label=label,
+        ),
         status=DocumentStatus.DRAFT,
         owner=created_by,
         created_by=created_by,
@@ -192,6 +221,8 @@ def update_draft(
     document.draft_content = did_json
 
     document.save(update_fields=update_fields)
+    if was_rejected:
+        emit_document_changed(document, event=events.STATUS_CHANGED)
 
     is_update = document.content is not None
     _log(
@@ -315,6 +346,7 @@ def submit_for_review(*, document: DIDDocument, submitted_by: User) -> DIDDocume
     document.save(
         update_fields=["status", "submitted_by", "submitted_at", "updated_at"]
     )
+    emit_document_changed(document, event=events.STATUS_CHANGED)
 
     from src.apps.emails.tasks import send_document_submitted_email
 
@@ -331,9 +363,6 @@ def submit_for_review(*, document: DIDDocument, submitted_by: User) -> DIDDocume
         f"Document '{document.label}' submitted for review.",
     )
 
-    from src.apps.organizations.selectors import invalidate_org_stats
-    invalidate_org_stats(organization_id=document.organization_id, user_id=document.owner_id)
-
     logger.info("document_submitted", doc_id=str(document.id))
     return document
 
@@ -349,6 +378,7 @@ def unsubmit_document(*, document: DIDDocument, unsubmitted_by: User) -> DIDDocu
     document.save(
         update_fields=["status", "submitted_by", "submitted_at", "updated_at"]
     )
+    emit_document_changed(document, event=events.STATUS_CHANGED)
 
     _log(
         "DOC_UNSUBMITTED",
@@ -413,6 +443,7 @@ def approve_document(
             "updated_at",
         ]
     )
+    emit_document_changed(document, event=events.STATUS_CHANGED)
 
     from src.apps.emails.tasks import send_document_reviewed_email
 
@@ -431,9 +462,6 @@ def approve_document(
         f"Document '{document.label}' approved.{f' Comment: {comment}' if comment else ''}",
     )
 
-    from src.apps.organizations.selectors import invalidate_org_stats
-    invalidate_org_stats(organization_id=document.organization_id, user_id=document.owner_id)
-
     logger.info("document_approved", doc_id=str(document.id))
     return document
 
@@ -461,6 +489,7 @@ def reject_document(
             "updated_at",
         ]
     )
+    emit_document_changed(document, event=events.STATUS_CHANGED)
 
     from src.apps.emails.tasks import send_document_reviewed_email
 
@@ -479,9 +508,6 @@ def reject_document(
         f"Document '{document.label}' rejected.{f' Reason: {reason}' if reason else ''}",
     )
 
-    from src.apps.organizations.selectors import invalidate_org_stats
-    invalidate_org_stats(organization_id=document.organization_id, user_id=document.owner_id)
-
     logger.info("document_rejected", doc_id=str(document.id))
     return document
 
@@ -493,7 +519,13 @@ def reject_document(
 #   2. sign_and_attach_proof()  — pure crypto, pas d'état externe
 #   3. _call_registrar()        — changement d'état externe (hors atomicité)
 #   4. _persist_publish()       — écriture DB dans atomic()
-#   5. Sur échec étape 4         — _call_registrar_deactivate() pour annuler l'étape 3
+#   5. Sur échec étape 3bis/4   — _compensate_saga() pour annuler l'étape 3
+#
+# Chaque étape est journalisée dans PublishSaga (voir « Journal de saga »
+# plus bas) : un crash entre 3 et 4 est repris par recover_publish_sagas().
+# Un refus certain du Registrar à l'étape 3 abandonne la saga (ABORTED) ;
+# une issue inconnue (OutcomeUnknownError : timeout de lecture, 5xx) la
+# laisse SIGNED, et la reprise vérifie auprès du Registrar.
 #
 # Le statut intermédiaire SIGNED est supprimé. Nous passons directement du
 # statut source à PUBLISHED dans une seule écriture DB atomique.
@@ -505,6 +537,7 @@ def sign_and_publish(
         document: DIDDocument,
         published_by: User,
         skip_review: bool = False,
+        publish_job: PublishJob | None = None,
 ) -> DIDDocument:
     """
     Signer via SignServer (ecdsa-jcs-2019) et publier via Universal Registrar.
@@ -515,6 +548,8 @@ def sign_and_publish(
       - PUBLISHED  : re-publier avec draft_content mis à jour (nouvelle version)
 
     Pour la republi. depuis PUBLISHED, draft_content doit différer de content.
+    publish_job : PublishJob à l'origine de l'appel (mode async), clôturé
+    par la reprise si le worker meurt en cours de saga.
     """
     # ── Étape 1 : Valider (pur — aucune écriture) ───────────────────
     _validate_for_publish(document, skip_review)
@@ -523,6 +558,16 @@ def sign_and_publish(
     if not content:
         raise ValidationError("No draft content to publish.")
 
+    did_uri = _did_uri_for(document)
+    saga = _saga_begin(
+        document=document,
+        published_by=published_by,
+        skip_review=skip_review,
+        content=content,
+        did_uri=did_uri,
+        publish_job=publish_job,
+    )
+
     # ── Étape 2 : Signer (pure crypto — pas de changement d'état ext) ────────
     #signed_doc, proof_value = sign_and_attach_proof(content)
 
@@ -539,22 +584,32 @@ def sign_and_publish(
     #     doc_id=str(document.id),
     #     cryptosuite="ecdsa-jcs-2019",
     # )
+    _saga_advance(saga, PublishSagaStep.SIGNED, proof_value="")  # proof_value
 
     # ── Étape 3 : Enregistrer en externe (hors transaction) ─────────
-    is_first = document.current_version is None
-    did_uri = _did_uri_for(document)
-    registrar_resp = _call_registrar(content, is_create=is_first)
-    write_did_json_to_disk(did_uri, content)
+    try:
+        registrar_resp = _call_registrar(content, is_create=saga.is_create)
+    except OutcomeUnknownError as e:
+        # Peut-être appliqué : la reprise vérifie auprès du Registrar.
+        _saga_advance(saga, PublishSagaStep.SIGNED, last_error=str(e))
+        raise
+    except Exception as e:
+        _saga_advance(saga, PublishSagaStep.ABORTED, last_error=str(e))
+        raise
 
-    # ── Étape 4 : Persister dans la BD de manière atomique ──────────
-    # Sur échec → Étape 5 : désactivation compensatoire pr annuler l'étape 3.
+    # ── Étape 3bis + 4 : fichier did.json, puis BD de manière atomique ──
+    # Sur échec → Étape 5 : compensation pour annuler l'étape 3.
     try:
+        _saga_advance(saga, PublishSagaStep.REGISTERED, registrar_response=registrar_resp)
+        content_hash = write_did_json_to_disk(did_uri, content)
+        _saga_advance(saga, PublishSagaStep.WRITTEN)
         document = _persist_publish(
             document=document,
             published_by=published_by,
             signed_doc= content, # signed_doc,
             proof_value= '', # proof_value,
             registrar_resp=registrar_resp,
+            content_hash=content_hash,
         )
     except Exception as db_error:
         logger.error(
@@ -562,24 +617,12 @@ def sign_and_publish(
             doc_id=str(document.id),
             error=str(db_error),
         )
-        try:
-            _call_registrar_deactivate(did_uri)
-            logger.warning(
-                "registrar_compensated",
-                doc_id=str(document.id),
-                did_uri=did_uri,
-            )
-        except Exception as comp_error:
-            # Compensation also failed — log prominently, requires manual intervention
-            logger.critical(
-                "registrar_compensation_failed",
-                doc_id=str(document.id),
-                did_uri=did_uri,
-                db_error=str(db_error),
-                comp_error=str(comp_error),
-            )
+        _compensate_saga(saga, reason=str(db_error))
         raise
 
+    # Après le commit seulement : si la transaction englobante (requête
+    # ATOMIC_REQUESTS) est annulée, la saga reste WRITTEN et sera reprise.
+    transaction.on_commit(lambda: _saga_advance(saga, PublishSagaStep.PERSISTED))
     return document
 
 
@@ -636,6 +679,7 @@ def _persist_publish(
         signed_doc: dict,
         proof_value: str,
         registrar_resp: dict,
+        content_hash: str = "",
 ) -> DIDDocument:
     """
     Écriture BD atomique : créer l'enreg de version et promouvoir le brouillon en direct.
@@ -650,6 +694,8 @@ def _persist_publish(
         version_number=next_ver,
         content=signed_doc,
         signature=proof_value,
+        content_hash=content_hash,
+        fragment_index=build_fragment_index(signed_doc),
         published_at=timezone.now(),
         published_by=published_by,
         registrar_response=registrar_resp,
@@ -681,8 +727,8 @@ def _persist_publish(
         },
     )
 
-    from src.apps.organizations.selectors import invalidate_org_stats
-    invalidate_org_stats(organization_id=document.organization_id, user_id=document.owner_id)
+    # Après commit : caches de résolution, recherche publique, stats d'org
+    emit_document_changed(document, event=events.PUBLISHED)
 
     logger.info(
         "document_published",
@@ -693,6 +739,676 @@ def _persist_publish(
     return document
 
 
+# ── Publication asynchrone (jobs Celery) ────────────────────────────────
+#
+# enqueue_publish() valide de façon synchrone (400 immédiat), crée un
+# PublishJob idempotent par (document, draft_hash) et planifie la tâche
+# après le commit. run_publish_job() exécute la même saga que le mode
+# synchrone côté worker.
+
+_LIVE_JOB_STATUSES = (
+    PublishJobStatus.QUEUED,
+    PublishJobStatus.RUNNING,
+    PublishJobStatus.SUCCEEDED,
+)
+
+
+def compute_draft_hash(document: DIDDocument) -> str:
+    """SHA-256 du brouillon canonique + numéro de la version de base."""
+    base = document.current_version.version_number if document.current_version else 0
+    payload = json.dumps(
+        {"base_version": base, "draft": document.draft_content},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def enqueue_publish(
+        *,
+        document: DIDDocument,
+        requested_by: User,
+        skip_review: bool = False,
+) -> tuple[PublishJob, bool]:
+    """
+    Mettre en file la publication d'un document.
+
+    Returns:
+        (job, created) — created=False si un job vivant existe déjà pour
+        ce même brouillon (double-clic) : il est renvoyé tel quel.
+    """
+    _validate_for_publish(document, skip_review)
+    draft_hash = compute_draft_hash(document)
+
+    existing = PublishJob.objects.filter(
+        document=document, draft_hash=draft_hash, status__in=_LIVE_JOB_STATUSES
+    ).first()
+    if existing:
+        logger.info("publish_job_deduplicated", doc_id=str(document.id), job_id=str(existing.id))
+        return existing, False
+
+    try:
+        with transaction.atomic():
+            job = PublishJob.objects.create(
+                document=document,
+                draft_hash=draft_hash,
+                skip_review=skip_review,
+                requested_by=requested_by,
+            )
+    except IntegrityError:
+        # Course avec une requête concurrente : l'autre job a gagné.
+        job = PublishJob.objects.get(
+            document=document, draft_hash=draft_hash, status__in=_LIVE_JOB_STATUSES
+        )
+        return job, False
+
+    from src.apps.documents.tasks import publish_document_task
+
+    transaction.on_commit(lambda: publish_document_task.delay(str(job.id)))
+    logger.info("publish_job_queued", doc_id=str(document.id), job_id=str(job.id))
+    return job, True
+
+
+def run_publish_job(*, job_id, retryable: bool = False) -> PublishJob | None:
+    """
+    Exécuter un PublishJob (appelé par la tâche Celery).
+
+    Seul un job QUEUED est pris (QUEUED → RUNNING atomique), ce qui rend
+    la tâche sûre face aux redélivraisons (acks_late). Si retryable et que
+    la dépendance externe est indisponible (ServiceUnavailableError), le
+    job repasse QUEUED et l'exception remonte pour que Celery réessaie —
+    sauf OutcomeUnknownError (le Registrar a pu appliquer la requête) : le
+    job reste RUNNING et la reprise de la saga le clôture.
+    """
+    claimed = PublishJob.objects.filter(id=job_id, status=PublishJobStatus.QUEUED).update(
+        status=PublishJobStatus.RUNNING,
+        started_at=timezone.now(),
+        attempts=F("attempts") + 1,
+    )
+    if not claimed:
+        logger.info("publish_job_not_claimed", job_id=str(job_id))
+        return None
+
+    job = PublishJob.objects.select_related("requested_by").get(id=job_id)
+    from src.apps.documents.selectors import get_document_by_id
+
+    document = get_document_by_id(doc_id=job.document_id)
+
+    if compute_draft_hash(document) != job.draft_hash:
+        return _finish_job(job, error="Draft changed since the publish was requested.")
+
+    try:
+        document = sign_and_publish(
+            document=document,
+            published_by=job.requested_by,
+            skip_review=job.skip_review,
+            publish_job=job,
+        )
+    except OutcomeUnknownError as e:
+        # Ne pas rejouer : la saga reste SIGNED, sa reprise clôturera le job.
+        job.error = e.message
+        job.save(update_fields=["error", "updated_at"])
+        logger.warning("publish_job_outcome_unknown", job_id=str(job.id), error=e.message)
+        return job
+    except ServiceUnavailableError as e:
+        if retryable:
+            job.status = PublishJobStatus.QUEUED
+            job.error = e.message
+            job.save(update_fields=["status", "error", "updated_at"])
+            raise
+        return _finish_job(job, error=e.message)
+    except ApplicationError as e:
+        return _finish_job(job, error=e.message)
+    except Exception as e:
+        logger.exception("publish_job_crashed", job_id=str(job.id))
+        return _finish_job(job, error=f"Unexpected error: {e}")
+
+    return _finish_job(job, version=document.current_version)
+
+
+def _finish_job(job: PublishJob, *, error: str = "", version=None) -> PublishJob:
+    job.status = PublishJobStatus.FAILED if error else PublishJobStatus.SUCCEEDED
+    job.error = error
+    job.version = version
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "error", "version", "finished_at", "updated_at"])
+    logger.info(
+        "publish_job_finished",
+        job_id=str(job.id),
+        doc_id=str(job.document_id),
+        status=job.status,
+        error=error or None,
+    )
+    return job
+
+
+# ── Publication groupée ─────────────────────────────────────────────────
+#
+# bulk_publish() applique sign_and_publish() à un lot de documents via un
+# pool de threads borné (BULK_PUBLISH_CONCURRENCY) : le débit suit le
+# plafond tout en limitant la charge envoyée à SignServer / Registrar.
+# Chaque document est une saga indépendante ; un échec n'arrête pas le lot.
+
+
+def bulk_publish(
+        *,
+        organization,
+        published_by: User,
+        document_ids: list | None = None,
+        skip_review: bool = False,
+        concurrency: int | None = None,
+        enqueue: bool = False,
+        max_documents: int | None = None,
+) -> list[dict]:
+    """
+    Publier plusieurs documents d'une organisation.
+
+    Args:
+        document_ids: documents à publier ; None = tous les APPROVED de l'org.
+        concurrency: publications simultanées (défaut BULK_PUBLISH_CONCURRENCY).
+        enqueue: mettre chaque document en file (PublishJob) au lieu de
+            publier dans ce processus.
+        max_documents: refuser le lot au-delà de cette taille (ValidationError).
+
+    Returns:
+        Un résultat par document, dans l'ordre demandé :
+        {"document_id", "label", "status", "version_number", "job_id", "error"}
+        avec status PUBLISHED, QUEUED, FAILED ou NOT_FOUND.
+    """
+    from src.apps.documents.selectors import get_documents_for_bulk_publish
+
+    documents = {
+        doc.id: doc
+        for doc in get_documents_for_bulk_publish(
+            organization_id=organization.id, document_ids=document_ids
+        )
+    }
+    ordered_ids = list(documents) if document_ids is None else list(dict.fromkeys(document_ids))
+    if max_documents is not None and len(ordered_ids) > max_documents:
+        raise ValidationError(
+            f"Bulk publish is limited to {max_documents} documents per call "
+            f"({len(ordered_ids)} requested)."
+            + ("" if enqueue else " Use mode=async for larger batches.")
+        )
+    results = {
+        doc_id: _bulk_result(doc_id, status="NOT_FOUND", error="Document not found.")
+        for doc_id in ordered_ids
+        if doc_id not in documents
+    }
+    pending = [doc_id for doc_id in ordered_ids if doc_id in documents]
+
+    if enqueue:
+        for doc_id in pending:
+            results[doc_id] = _bulk_enqueue_one(documents[doc_id], published_by, skip_review)
+    elif pending:
+        workers = max(1, min(concurrency or settings.BULK_PUBLISH_CONCURRENCY, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-publish") as pool:
+            futures = {
+                doc_id: pool.submit(_bulk_publish_one, doc_id, published_by, skip_review)
+                for doc_id in pending
+            }
+            for doc_id, future in futures.items():
+                results[doc_id] = future.result()
+
+    ordered = [results[doc_id] for doc_id in ordered_ids]
+    logger.info(
+        "bulk_publish_done",
+        org_id=str(organization.id),
+        total=len(ordered),
+        failed=sum(1 for r in ordered if r["status"] in ("FAILED", "NOT_FOUND")),
+        enqueue=enqueue,
+    )
+    return ordered
+
+
+def _bulk_publish_one(doc_id, published_by: User, skip_review: bool) -> dict:
+    """Tâche du pool : sa propre connexion BD, fermée à la fin."""
+    from django.db import connections
+
+    from src.apps.documents.selectors import get_document_by_id
+
+    try:
+        document = get_document_by_id(doc_id=doc_id)
+        try:
+            document = sign_and_publish(
+                document=document,
+                published_by=published_by,
+                skip_review=skip_review,
+            )
+        except ApplicationError as e:
+            return _bulk_result(doc_id, label=document.label, status="FAILED", error=e.message)
+        return _bulk_result(
+            doc_id,
+            label=document.label,
+            status="PUBLISHED",
+            version_number=document.current_version.version_number,
+        )
+    except Exception as e:
+        logger.exception("bulk_publish_document_crashed", doc_id=str(doc_id))
+        return _bulk_result(doc_id, status="FAILED", error=f"Unexpected error: {e}")
+    finally:
+        connections.close_all()
+
+
+def _bulk_enqueue_one(document: DIDDocument, requested_by: User, skip_review: bool) -> dict:
+    try:
+        job, _created = enqueue_publish(
+            document=document,
+            requested_by=requested_by,
+            skip_review=skip_review,
+        )
+    except ApplicationError as e:
+        return _bulk_result(document.id, label=document.label, status="FAILED", error=e.message)
+    return _bulk_result(document.id, label=document.label, status="QUEUED", job_id=job.id)
+
+
+def _bulk_result(doc_id, *, status: str, label: str = "", version_number=None, job_id=None, error=""):
+    return {
+        "document_id": doc_id,
+        "label": label,
+        "status": status,
+        "version_number": version_number,
+        "job_id": job_id,
+        "error": error,
+    }
+
+
+# ── Journal de saga (reprise après crash) ───────────────────────────────
+#
+# sign_and_publish() écrit une ligne PublishSaga et l'avance à chaque
+# étape sur une connexion dédiée en autocommit (PUBLISH_SAGA_DATABASE),
+# hors de la transaction de requête :
+#
+#   STARTED → SIGNED → REGISTERED → WRITTEN → PERSISTED
+#              ↘ ABORTED   ↘ COMPENSATED | COMPENSATION_FAILED
+#
+# recover_publish_sagas() (tâche beat) traite par lots les sagas restées
+# dans une étape intermédiaire plus de PUBLISH_SAGA_RECOVERY_AFTER
+# secondes : elle reprend la publication quand le brouillon est toujours
+# celui envoyé au Registrar, sinon elle compense. Une saga SIGNED (appel
+# au Registrar interrompu ou d'issue inconnue) est d'abord vérifiée auprès
+# du Registrar : abandonnée s'il ne publie pas son contenu, reprise sinon. Après
+# PUBLISH_SAGA_MAX_RECOVERY_ATTEMPTS échecs la saga passe FAILED.
+
+_SAGA_TERMINAL_STEPS = frozenset({
+    PublishSagaStep.PERSISTED,
+    PublishSagaStep.ABORTED,
+    PublishSagaStep.COMPENSATED,
+    PublishSagaStep.FAILED,
+})
+
+_SAGA_RECOVERABLE_STEPS = (
+    PublishSagaStep.STARTED,
+    PublishSagaStep.SIGNED,
+    PublishSagaStep.REGISTERED,
+    PublishSagaStep.WRITTEN,
+    PublishSagaStep.COMPENSATION_FAILED,
+)
+
+
+def _journal_db() -> str:
+    return getattr(settings, "PUBLISH_SAGA_DATABASE", "default")
+
+
+def _saga_begin(
+        *,
+        document: DIDDocument,
+        published_by: User | None,
+        skip_review: bool,
+        content: dict,
+        did_uri: str,
+        publish_job: PublishJob | None = None,
+) -> PublishSaga:
+    current = document.current_version
+    saga = PublishSaga.objects.using(_journal_db()).create(
+        document_id=document.id,
+        publish_job_id=publish_job.id if publish_job else None,
+        published_by_id=published_by.id if published_by else None,
+        did_uri=did_uri,
+        is_create=current is None,
+        base_version=current.version_number if current else 0,
+        skip_review=skip_review,
+        content=content,
+        previous_content=document.content,
+    )
+    logger.info("publish_saga_started", saga_id=str(saga.id), doc_id=str(document.id))
+    return saga
+
+
+def _saga_advance(saga: PublishSaga, step: str, **fields) -> None:
+    """Passer la saga à *step* (écriture immédiate, hors transaction de requête)."""
+    now = timezone.now()
+    if step in _SAGA_TERMINAL_STEPS:
+        fields["finished_at"] = now
+    PublishSaga.objects.using(_journal_db()).filter(id=saga.id).update(
+        step=step, updated_at=now, **fields
+    )
+    saga.step = step
+    saga.updated_at = now
+    for name, value in fields.items():
+        setattr(saga, name, value)
+    logger.info("publish_saga_step", saga_id=str(saga.id), doc_id=str(saga.document_id), step=step)
+
+
+def _compensate_saga(saga: PublishSaga, *, reason: str) -> bool:
+    """
+    Annuler l'étape Registrar (et le did.json) d'une saga non persistée.
+
+    Première publication : désactivation du DID. Mise à jour : le contenu
+    précédemment en ligne est ré-enregistré, le DID reste actif.
+    """
+    try:
+        if saga.is_create or saga.previous_content is None:
+            _call_registrar_deactivate(saga.did_uri)
+            delete_did_json_from_disk(saga.did_uri)
+        else:
+            _call_registrar(saga.previous_content, is_create=False)
+            write_did_json_to_disk(saga.did_uri, saga.previous_content)
+    except Exception as comp_error:
+        # Compensation also failed — retried by recover_publish_sagas()
+        logger.critical(
+            "registrar_compensation_failed",
+            saga_id=str(saga.id),
+            doc_id=str(saga.document_id),
+            did_uri=saga.did_uri,
+            db_error=reason,
+            comp_error=str(comp_error),
+        )
+        _saga_advance(
+            saga, PublishSagaStep.COMPENSATION_FAILED, last_error=f"{reason} / {comp_error}"
+        )
+        return False
+
+    logger.warning(
+        "registrar_compensated",
+        saga_id=str(saga.id),
+        doc_id=str(saga.document_id),
+        did_uri=saga.did_uri,
+    )
+    _saga_advance(saga, PublishSagaStep.COMPENSATED, last_error=reason)
+    return True
+
+
+def recover_publish_sagas(
+        *,
+        older_than: int | None = None,
+        batch_size: int | None = None,
+) -> dict[str, int]:
+    """
+    Reprendre ou compenser un lot de sagas interrompues.
+
+    Args:
+        older_than: secondes sans progression avant reprise
+            (défaut PUBLISH_SAGA_RECOVERY_AFTER).
+        batch_size: nombre max de sagas traitées (défaut PUBLISH_SAGA_RECOVERY_BATCH).
+
+    Returns:
+        Compteur {étape finale: nombre de sagas}, plus "skipped" (prise par
+        un autre worker) et "error" (nouvel essai au prochain passage).
+    """
+    if older_than is None:
+        older_than = settings.PUBLISH_SAGA_RECOVERY_AFTER
+    if batch_size is None:
+        batch_size = settings.PUBLISH_SAGA_RECOVERY_BATCH
+    db = _journal_db()
+    cutoff = timezone.now() - timedelta(seconds=older_than)
+
+    sagas = list(
+        PublishSaga.objects.using(db)
+        .filter(step__in=_SAGA_RECOVERABLE_STEPS, updated_at__lt=cutoff)
+        .order_by("updated_at")[:batch_size]
+    )
+    results: dict[str, int] = {}
+    for saga in sagas:
+        # Prise optimiste : un seul worker gagne (updated_at inchangé).
+        claimed = PublishSaga.objects.using(db).filter(
+            id=saga.id, updated_at=saga.updated_at
+        ).update(updated_at=timezone.now(), recovery_attempts=F("recovery_attempts") + 1)
+        if not claimed:
+            outcome = "skipped"
+        else:
+            saga.recovery_attempts += 1
+            outcome = _recover_saga(saga)
+        results[outcome] = results.get(outcome, 0) + 1
+
+    if sagas:
+        logger.info("publish_sagas_recovered", **results)
+    return results
+
+
+def _recover_saga(saga: PublishSaga) -> str:
+    log = logger.bind(saga_id=str(saga.id), doc_id=str(saga.document_id), step=saga.step)
+
+    if saga.recovery_attempts > settings.PUBLISH_SAGA_MAX_RECOVERY_ATTEMPTS:
+        log.critical("publish_saga_recovery_exhausted", last_error=saga.last_error)
+        _saga_advance(saga, PublishSagaStep.FAILED)
+        _close_saga_job(saga, document=None)
+        return str(saga.step)
+
+    document = (
+        DIDDocument.objects.select_related("organization", "owner", "current_version")
+        .filter(id=saga.document_id)
+        .first()
+    )
+    try:
+        if saga.step == PublishSagaStep.COMPENSATION_FAILED:
+            _compensate_saga(saga, reason=saga.last_error or "recovery")
+        elif saga.step == PublishSagaStep.STARTED:
+            _saga_advance(saga, PublishSagaStep.ABORTED, last_error="Interrupted before registration.")
+        elif saga.step == PublishSagaStep.SIGNED and not _saga_was_registered(saga):
+            # Le Registrar n'a pas appliqué la requête : rien à annuler.
+            _saga_advance(saga, PublishSagaStep.ABORTED, last_error="Not applied by the Registrar.")
+        elif document is not None and _saga_was_persisted(saga, document):
+            write_did_json_to_disk(saga.did_uri, saga.content)
+            _saga_advance(saga, PublishSagaStep.PERSISTED)
+        elif document is not None and _saga_is_superseded(saga, document):
+            # Une publication plus récente a déjà écrasé le Registrar.
+            _saga_advance(saga, PublishSagaStep.ABORTED, last_error="Superseded by a later publish.")
+        elif document is not None and _saga_can_resume(saga, document):
+            content_hash = write_did_json_to_disk(saga.did_uri, saga.content)
+            _persist_publish(
+                document=document,
+                published_by=User.objects.filter(id=saga.published_by_id).first(),
+                signed_doc=saga.content,
+                proof_value=saga.proof_value,
+                registrar_resp=saga.registrar_response,
+                content_hash=content_hash,
+            )
+            _saga_advance(saga, PublishSagaStep.PERSISTED)
+        else:
+            _compensate_saga(saga, reason="Document changed before the publish was persisted.")
+    except Exception as e:
+        log.exception("publish_saga_recovery_failed")
+        PublishSaga.objects.using(_journal_db()).filter(id=saga.id).update(last_error=str(e))
+        return "error"
+
+    log.info("publish_saga_recovery_done", outcome=saga.step)
+    _close_saga_job(saga, document=document)
+    return str(saga.step)
+
+
+def _saga_was_registered(saga: PublishSaga) -> bool:
+    """Le Registrar publie le contenu de la saga (appel SIGNED d'issue inconnue)."""
+    from src.integrations.registrar import fetch_registered_document
+
+    registered = fetch_registered_document(saga.did_uri)
+    return registered is not None and normalize_did_document(registered) == saga.content
+
+
+def _saga_was_persisted(saga: PublishSaga, document: DIDDocument) -> bool:
+    """La version de la saga est en BD (crash entre le commit et PERSISTED)."""
+    current = document.current_version
+    return (
+        current is not None
+        and current.version_number == saga.base_version + 1
+        and current.content == saga.content
+    )
+
+
+def _saga_is_superseded(saga: PublishSaga, document: DIDDocument) -> bool:
+    current = document.current_version
+    return (current.version_number if current else 0) != saga.base_version
+
+
+def _saga_can_resume(saga: PublishSaga, document: DIDDocument) -> bool:
+    """Le brouillon est toujours celui envoyé au Registrar et reste publiable."""
+    if not document.draft_content or normalize_did_document(document.draft_content) != saga.content:
+        return False
+    try:
+        _validate_for_publish(document, saga.skip_review)
+    except ValidationError:
+        return False
+    return True
+
+
+def _close_saga_job(saga: PublishSaga, *, document: DIDDocument | None) -> None:
+    """Clôturer le PublishJob resté RUNNING (worker mort pendant la saga)."""
+    if saga.publish_job_id is None or saga.step not in _SAGA_TERMINAL_STEPS:
+        return
+    job = PublishJob.objects.filter(id=saga.publish_job_id, status=PublishJobStatus.RUNNING).first()
+    if job is None:
+        return
+    if saga.step == PublishSagaStep.PERSISTED:
+        _finish_job(job, version=document.current_version if document else None)
+    else:
+        _finish_job(job, error=saga.last_error or f"Publish saga {saga.step.lower()}.")
+
+
+# ── Reconstruction / réconciliation du volume dids ──────────────────────
+
+
+def reconcile_did_volume(
+        *,
+        dry_run: bool = False,
+        organization_slug: str | None = None,
+        processes: int | None = None,
+        chunk_size: int = 500,
+        prune: bool = False,
+) -> dict:
+    """
+    Aligner DID_DOCUMENTS_ROOT sur le contenu en ligne des documents publiés
+    (``content`` défini, quel que soit le statut : un document repassé en
+    examen reste servi, un DEACTIVATED garde son did.json).
+
+    Les documents sont lus par lots (``iterator()``) et comparés à leur
+    did.json dans un pool de processus (``assembler.sync_did_json_files``) ;
+    l'arborescence est parcourue en parallèle, un répertoire d'organisation
+    par tâche. Seules les différences sont écrites : did.json absent ou
+    divergent, variante compressée manquante ; les did.json sans document
+    publié (orphelins) sont rapportés, et supprimés seulement si *prune*. Sert aussi à reconstruire
+    le volume entier après une perte.
+
+    Args:
+        dry_run: ne rien écrire ni supprimer, seulement rapporter.
+        organization_slug: limiter à une organisation (et à son répertoire).
+        processes: processus de travail (défaut : nombre de CPU, 1 = en processus).
+        chunk_size: documents envoyés à un processus à la fois.
+        prune: supprimer les orphelins (défaut : seulement les rapporter).
+
+    Returns:
+        {"checked", "unchanged", "differences", "orphans", "dry_run"} —
+        differences : résultats de ``sync_did_json_files`` ; orphans :
+        chemins relatifs.
+    """
+    import os
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from functools import partial
+
+    from src.apps.documents.selectors import get_published_document_contents
+    from src.common.did.assembler import remove_did_json_file, sync_did_json_files
+
+    root = str(settings.DID_DOCUMENTS_ROOT)
+    sync = partial(
+        sync_did_json_files,
+        root=root,
+        brotli=getattr(settings, "DID_JSON_BROTLI", False),
+        dry_run=dry_run,
+    )
+    processes = max(1, processes or os.cpu_count() or 1)
+
+    expected: set[str] = set()
+    org_slugs: set[str] = {organization_slug} if organization_slug else set()
+    checked = 0
+
+    def chunks():
+        nonlocal checked
+        chunk = []
+        rows = get_published_document_contents(organization_slug=organization_slug)
+        for org_slug, owner_id, label, content in rows.iterator(chunk_size=2000):
+            owner = str(owner_id) if owner_id else "unknown"
+            expected.add(f"{org_slug}/{owner}/{label}/did.json")
+            org_slugs.add(org_slug)
+            chunk.append((build_did_uri(org_slug, owner, label), content))
+            checked += 1
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    differences: list[dict] = []
+    if processes == 1:
+        for chunk in chunks():
+            differences.extend(sync(chunk))
+        on_disk = _did_json_files_on_disk(root, org_slugs, organization_slug, map)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            # Au plus 2 lots en attente par processus : la mémoire reste bornée.
+            pending = set()
+            for chunk in chunks():
+                pending.add(pool.submit(sync, chunk))
+                if len(pending) >= 2 * processes:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        differences.extend(future.result())
+            for future in pending:
+                differences.extend(future.result())
+            on_disk = _did_json_files_on_disk(root, org_slugs, organization_slug, pool.map)
+
+    orphans = sorted(on_disk - expected)
+    if prune and not dry_run:
+        for relative_path in orphans:
+            remove_did_json_file(root, relative_path)
+
+    report = {
+        "checked": checked,
+        "unchanged": checked - len(differences),
+        "differences": differences,
+        "orphans": orphans,
+        "dry_run": dry_run,
+    }
+    logger.info(
+        "did_volume_reconciled",
+        checked=report["checked"],
+        differences=len(differences),
+        orphans=len(orphans),
+        pruned=prune and not dry_run,
+        dry_run=dry_run,
+    )
+    return report
+
+
+def _did_json_files_on_disk(root: str, org_slugs: set[str], organization_slug: str | None, map_fn) -> set[str]:
+    """did.json présents sous *root* : un répertoire d'organisation par tâche de *map_fn*."""
+    import os
+    from functools import partial
+
+    from src.common.did.assembler import list_did_json_files
+
+    if organization_slug is None:
+        try:
+            org_slugs = org_slugs | {
+                e.name for e in os.scandir(root) if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")
+            }
+        except OSError:
+            pass
+    found: set[str] = set()
+    for paths in map_fn(partial(list_did_json_files, root), sorted(org_slugs)):
+        found.update(paths)
+    return found
+
+
 # ── Désactiver ──────────────────────────────────────────────────────────
 
 
@@ -711,6 +1427,7 @@ def deactivate_document(
 
     document.status = DocumentStatus.DEACTIVATED
     document.save(update_fields=["status", "updated_at"])
+    emit_document_changed(document, event=events.DEACTIVATED)
 
     _log(
         "DOC_DEACTIVATED",
@@ -783,14 +1500,18 @@ def _create_verification_methods(*, document, organization, vm_specs, user):
 
 
 def _assemble_from_db(document, did_uri, service_endpoints=None, controller=None):
-    from src.apps.documents.selectors import get_active_verification_methods
+    from src.apps.certificates.selectors import get_public_keys_for_versions
+    from src.apps.documents.selectors import get_verification_methods_for_assembly
 
-    vms = list(get_active_verification_methods(document_id=document.id))
+    vms = list(get_verification_methods_for_assembly(document_id=document.id))
+    # Seuls les fragments absents du cache de l'assembleur lisent leur JWK.
+    missing = uncached_certificate_versions(did_uri, vms)
     return assemble_did_document(
         did_uri=did_uri,
         verification_methods=vms,
         service_endpoints=service_endpoints,
         controller=controller,
+        public_key_jwks=get_public_keys_for_versions(version_ids=missing) if missing else {},
     )
 
 
@@ -0,0 +1,40 @@
+"""
+Tâches Celery des documents DID.
+"""
+
+import structlog
+from celery import shared_task
+
+from src.common.exceptions import ServiceUnavailableError
+
+logger = structlog.get_logger(__name__)
+
+
+@shared_task(bind=True, max_retries=5, default_retry_delay=30)
+def publish_document_task(self, job_id: str):
+    """
+    Exécuter un PublishJob mis en file par enqueue_publish().
+
+    Réessaie (job remis en QUEUED) tant qu'une dépendance externe est
+    indisponible (circuit ouvert) ; au dernier essai le job passe FAILED.
+    """
+    from src.apps.documents.services import run_publish_job
+
+    try:
+        job = run_publish_job(
+            job_id=job_id,
+            retryable=self.request.retries < self.max_retries,
+        )
+    except ServiceUnavailableError as exc:
+        logger.warning("publish_job_retry", job_id=job_id, error=exc.message)
+        raise self.retry(exc=exc) from exc
+
+    return job.status if job else None
+
+
+@shared_task
+def recover_publish_sagas_task():
+    """Tâche beat : reprendre ou compenser les sagas de publication interrompues."""
+    from src.apps.documents.services import recover_publish_sagas
+
+    return recover_publish_sagas()
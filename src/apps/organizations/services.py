@@ -283,6 +283,8 @@ def reactivate_organization(
 
 @transaction.atomic
 def delete_organization(*, organization: Organization, deleted_by: User) -> None:
+    from src.apps.documents.events import emit_documents_deleted
+
     _log_org_audit(
         actor=deleted_by,
         action="ORG_DELETED",
@@ -290,6 +292,8 @@ def delete_organization(*, organization: Organization, deleted_by: User) -> None
         description=f"Organization '{organization.name}' deleted.",
     )
     logger.info("org_deleted", org_id=str(organization.id))
+    # Ses documents partent en cascade : périmer les caches de résolution / recherche.
+    emit_documents_deleted(organization.did_documents.all())
     organization.delete()
 
 
@@ -607,6 +607,8 @@ def delete_document(request: HttpRequest, doc_id: UUID):
         deactivate_document(document=doc, deactivated_by=request.auth, reason="Deactivated by Superadmin")
         return {"message": "Document deactivated successfully."}
     else:
+        from src.apps.documents.events import emit_documents_deleted
+        emit_documents_deleted([doc])
         doc.delete()
         return {"message": "Document deleted successfully."}
 
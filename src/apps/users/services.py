@@ -124,6 +124,8 @@ def set_otp_secret(*, user: User, otp_secret: str) -> User:
 
 @transaction.atomic
 def delete_user(*, user: User, deleted_by: User) -> None:
+    from src.apps.documents.events import emit_documents_deleted
+
     log_action(
         actor=deleted_by,
         action=AuditAction.USER_UPDATED,  # ou ajouter USER_DELETED
@@ -132,4 +134,6 @@ def delete_user(*, user: User, deleted_by: User) -> None:
         description=f"User '{user.email}' deleted.",
     )
     logger.info("user_deleted", user_id=str(user.id))
+    # Ses documents partent en cascade : périmer les caches de résolution / recherche.
+    emit_documents_deleted(user.owned_documents.all())
     user.delete()
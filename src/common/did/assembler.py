@@ -12,8 +12,11 @@ Algorithme de preuve (W3C Data Integrity ECDSA Cryptosuites v1.0) :
   2. Canonicalise les options de preuve en JCS → octets.
   3. Canonicalise le document non signé en JCS → octets.
   4. hash_data = SHA-256(octets_options_preuve) || SHA-256(octets_document)
-  5. Envoie hash_data au PlainSigner de SignServer (SHA256withECDSA).
-  6. Convertit la signature DER retournée en r||s brut (64 octets pour P-256).
+     (SHA-384 pour une clé P-384).
+  5. Signe hash_data via le signataire configuré (SIGNER_BACKEND, voir
+     src.integrations.signer) — par défaut le PlainSigner de SignServer.
+  6. Convertit la signature DER retournée en r||s brut (64 octets pour P-256,
+     96 pour P-384).
   7. Encode en Multibase : ``'z' + base58btc(sig_brute)`` — ou —
      ``'u' + base64url_no_pad(sig_brute)``.
      Nous utilisons ``'z' + base58btc`` qui est le défaut dans la spécification.
@@ -28,6 +31,8 @@ import json
 import structlog
 from django.conf import settings
 
+from src.common.did.jcs import canonicalize
+
 logger = structlog.get_logger(__name__)
 
 # ── Constantes ──────────────────────────────────────────────────────────
@@ -55,6 +60,11 @@ _ALG_MAP = {
     ("RSA", None): "RS256",
 }
 
+# Fragments verificationMethod déjà assemblés, partagés entre documents et
+# brouillons (voir _vm_fragment). Vidé en bloc quand il est plein.
+_VM_FRAGMENT_CACHE_SIZE = 4096
+_vm_fragments: dict[tuple, dict] = {}
+
 
 # ═════════════════════════════════════════════════════════════════════════
 #  Assemblage du document DID
@@ -79,6 +89,7 @@ def assemble_did_document(
     verification_methods: list,
     service_endpoints: list[dict] | None = None,
     controller: str | list[str] | None = None,
+    public_key_jwks: dict | None = None,
 ) -> dict:
     """
     Assemble a complete DID document from verification method records.
@@ -95,6 +106,17 @@ def assemble_did_document(
         controller: Optional controller DID(s). If None, defaults to
             self-controlled (controller = did_uri). Can be a single DID
             string or a list of DID strings for multi-party control.
+        public_key_jwks: Optional ``{certificate version id: JWK}`` for the
+            fragments that are not cached yet (see
+            ``uncached_certificate_versions``). Without it — or for a version
+            missing from it — the JWK is read from
+            ``vm.certificate.current_version``.
+
+    Each verificationMethod entry is a cached fragment keyed by (DID, VM id,
+    fragment, certificate version id, relationships, method type): only
+    methods that were added or changed since the last assembly are built
+    again. Fragments are shared — treat the returned document as read-only
+    below the top level.
 
     Returns:
         W3C DID Core v1.0 compliant JSON dict (unsigned).
@@ -119,25 +141,14 @@ def assemble_did_document(
         if not vm.is_active:
             continue
 
-        cert_version = vm.certificate.current_version
-        if cert_version is None:
+        version_id = vm.certificate.current_version_id
+        if version_id is None:
             continue
 
-        method_full_id = f"{did_uri}#{vm.method_id_fragment}"
-
-        jwk = _enrich_jwk(
-            cert_version.public_key_jwk or {},
-            vm.relationship_list,
-        )
-
-        vm_entry = {
-            "id": method_full_id,
-            "type": vm.method_type,
-            "controller": did_uri,
-            "publicKeyJwk": jwk,
-        }
+        vm_entry = _vm_fragment(did_uri, vm, version_id, public_key_jwks)
         vm_entries.append(vm_entry)
 
+        method_full_id = vm_entry["id"]
         for rel in vm.relationship_list:
             if rel in relationship_map:
                 relationship_map[rel].append(method_full_id)
@@ -155,6 +166,35 @@ def assemble_did_document(
     return normalize_did_document(doc)
 
 
+def uncached_certificate_versions(did_uri: str, verification_methods) -> set:
+    """
+    Certificate version ids whose verificationMethod fragment must be built.
+
+    Lets the caller load just those JWKs in one query and pass them to
+    ``assemble_did_document(public_key_jwks=...)``.
+    """
+    return {
+        vm.certificate.current_version_id
+        for vm in verification_methods
+        if vm.is_active
+        and vm.certificate.current_version_id is not None
+        and _vm_fragment_key(did_uri, vm, vm.certificate.current_version_id) not in _vm_fragments
+    }
+
+
+def clear_vm_fragment_cache(did_uri: str | None = None, verification_methods=()) -> None:
+    """
+    Drop assembled verificationMethod fragments: those of
+    *verification_methods* (at their current certificate version) when
+    given, else all of them.
+    """
+    if did_uri is None:
+        _vm_fragments.clear()
+        return
+    for vm in verification_methods:
+        _vm_fragments.pop(_vm_fragment_key(did_uri, vm, vm.certificate.current_version_id), None)
+
+
 def normalize_did_document(doc: dict) -> dict:
     """
     Produce a W3C-friendly DID document dict.
@@ -199,14 +239,38 @@ def normalize_did_document(doc: dict) -> dict:
     return ordered
 
 
-def did_web_uri_to_disk_path(did_uri: str, root) :
+def build_fragment_index(doc: dict) -> dict:
     """
-    Map a did:web URI to the on-disk path used by driver-did-web / nginx.
+    Map each fragment of a DID document to the object it identifies, for
+    DID URL dereferencing (``did:…#key-1``, ``did:…?service=files``)
+    without parsing the whole document.
+
+    Covers ``verificationMethod`` and ``service`` entries and verification
+    methods embedded in relationship arrays. Ids may be absolute
+    (``did:…#key-1``) or relative (``#key-1``); the first object wins when
+    an id appears twice.
+    """
+    if not doc:
+        return {}
 
-    did:web:host:org_slug:owner_id:label → {root}/org_slug/owner_id/label/did.json
+    candidates = [*(doc.get("verificationMethod") or []), *(doc.get("service") or [])]
+    for rel_type in RELATIONSHIP_TYPES:
+        candidates.extend(doc.get(rel_type) or [])
+
+    index: dict = {}
+    for obj in candidates:
+        obj_id = obj.get("id") if isinstance(obj, dict) else None
+        if isinstance(obj_id, str) and "#" in obj_id:
+            index.setdefault(obj_id.split("#", 1)[1], obj)
+    return index
+
+
+def did_web_uri_to_relative_path(did_uri: str) -> str:
     """
-    from pathlib import Path
+    Map a did:web URI to its did.json path relative to the dids volume root.
 
+    did:web:host:org_slug:owner_id:label → org_slug/owner_id/label/did.json
+    """
     prefix = "did:web:"
     if not did_uri.startswith(prefix):
         raise ValueError(f"Not a did:web URI: {did_uri}")
@@ -217,22 +281,164 @@ def did_web_uri_to_disk_path(did_uri: str, root) :
 
     org_slug, owner_id = parts[1], parts[2]
     label = parts[3] if len(parts) == 4 else ":".join(parts[3:])
-    return Path(root) / org_slug / owner_id / label / "did.json"
+    return f"{org_slug}/{owner_id}/{label}/did.json"
+
+
+def did_web_uri_to_disk_path(did_uri: str, root) :
+    """
+    Map a did:web URI to the on-disk path used by driver-did-web / nginx.
+
+    did:web:host:org_slug:owner_id:label → {root}/org_slug/owner_id/label/did.json
+    """
+    from pathlib import Path
+
+    return Path(root) / did_web_uri_to_relative_path(did_uri)
+
+
+def serialize_did_json(content: dict) -> bytes:
+    """Compact UTF-8 bytes of the normalized document, as written to did.json."""
+    return json.dumps(
+        normalize_did_document(content),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def did_json_content_hash(data: bytes) -> str:
+    """SHA-256 (hex) of the did.json bytes — the strong ETag of the document."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_did_json_to_disk(did_uri: str, content: dict) -> str:
+    """
+    Publish the did.json of a DID document to the DID storage.
+
+    Compact JSON, written through ``get_did_storage()`` (DID_STORAGE_BACKENDS:
+    the dids volume by default, S3-compatible storage, or both). On the
+    volume the file is written to a temporary file and renamed over
+    did.json, so nginx never serves a partial document; ``did.json.gz``
+    (and ``did.json.br`` with DID_JSON_BROTLI) are written alongside for
+    ``gzip_static`` / ``brotli_static``, and nothing is rewritten when
+    did.json already holds the same bytes — mtime and the nginx ETag then
+    stay stable.
+
+    Returns:
+        The SHA-256 content hash (see ``did_json_content_hash``).
+    """
+    from src.integrations.did_storage import get_did_storage
+
+    path = did_web_uri_to_relative_path(did_uri)
+    data = serialize_did_json(content)
+    content_hash = did_json_content_hash(data)
+
+    outcome = get_did_storage().write(path, data)
+    if outcome == "unchanged":
+        logger.info("did_json_unchanged", path=path, did=did_uri, content_hash=content_hash)
+    else:
+        logger.info("did_json_written", path=path, did=did_uri, content_hash=content_hash, bytes=len(data))
+    return content_hash
+
+
+def write_did_json_batch(documents: list[tuple[str, dict]], *, backends: list[str] | None = None) -> list[str]:
+    """
+    ``write_did_json_to_disk`` for many ``(did_uri, content)`` at once —
+    S3 uploads of the batch run concurrently (DID_STORAGE_UPLOAD_CONCURRENCY).
+
+    Args:
+        backends: DID storage backends to write to (default: DID_STORAGE_BACKENDS).
+
+    Returns:
+        The SHA-256 content hash of each document, in input order.
+    """
+    from src.integrations.did_storage import get_did_storage
+
+    items = [(did_web_uri_to_relative_path(did_uri), serialize_did_json(content)) for did_uri, content in documents]
+    get_did_storage(backends).write_many(items)
+    logger.info("did_json_batch_written", documents=len(items))
+    return [did_json_content_hash(data) for _, data in items]
+
+
+def delete_did_json_from_disk(did_uri: str) -> None:
+    """Remove a DID document (and its compressed variants) from the DID storage (no-op if absent)."""
+    from src.integrations.did_storage import get_did_storage
+
+    path = did_web_uri_to_relative_path(did_uri)
+    get_did_storage().delete(path)
+    logger.info("did_json_deleted", path=path, did=did_uri)
+
+
+def sync_did_json_files(
+    entries: list[tuple[str, dict]],
+    *,
+    root: str,
+    brotli: bool = False,
+    dry_run: bool = False,
+) -> list[dict]:
+    """
+    Bring the did.json of each ``(did_uri, content)`` under *root* in line
+    with *content*.
+
+    Runs in a worker process of the volume reconciliation (no Django
+    settings or database needed), so everything it depends on is passed in.
 
+    Returns:
+        One ``{did, path, outcome, expected_hash, disk_hash}`` per document
+        that differed — outcome "missing", "drift" or "variants" (did.json
+        right, a compressed sibling missing). Unchanged documents are left out.
+    """
+    from src.integrations.did_storage import read_bytes, sync_did_json_file
+
+    differences = []
+    for did_uri, content in entries:
+        path = did_web_uri_to_disk_path(did_uri, root)
+        data = serialize_did_json(content)
+        current = read_bytes(path)
+        outcome = sync_did_json_file(path, data, current, brotli=brotli, dry_run=dry_run)
+        if outcome != "unchanged":
+            differences.append(
+                {
+                    "did": did_uri,
+                    "path": str(path),
+                    "outcome": outcome,
+                    "expected_hash": did_json_content_hash(data),
+                    "disk_hash": did_json_content_hash(current) if current is not None else "",
+                }
+            )
+    return differences
+
+
+def list_did_json_files(root: str, org_slug: str) -> list[str]:
+    """Relative paths (``org/owner/label/did.json``) of the did.json files of one organization directory."""
+    import os
+
+    found = []
+    org_dir = os.path.join(root, org_slug)
+    for owner in _subdirectories(org_dir):
+        owner_dir = os.path.join(org_dir, owner)
+        for label in _subdirectories(owner_dir):
+            if os.path.isfile(os.path.join(owner_dir, label, "did.json")):
+                found.append(f"{org_slug}/{owner}/{label}/did.json")
+    return found
+
+
+def remove_did_json_file(root: str, relative_path: str) -> None:
+    """Delete ``root/relative_path`` and its compressed variants (orphan clean-up)."""
+    from pathlib import Path
 
-def write_did_json_to_disk(did_uri: str, content: dict) -> None:
-    """Write a normalized DID document to the shared dids volume."""
-    from django.conf import settings
+    from src.integrations.did_storage import remove_did_json_file as remove
 
-    path = did_web_uri_to_disk_path(did_uri, settings.DID_DOCUMENTS_ROOT)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    normalized = normalize_did_document(content)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(normalized, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    logger.info("did_json_written", path=str(path), did=did_uri)
+    remove(Path(root) / relative_path)
 
 
+def _subdirectories(path: str) -> list[str]:
+    import os
+
+    try:
+        with os.scandir(path) as it:
+            return [e.name for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")]
+    except OSError:
+        return []
+
 
 def create_proof(
     did_document: dict,
@@ -246,7 +452,8 @@ def create_proof(
       1. Builds the proof-options object.
       2. JCS-canonicalises both proof options and the document.
       3. Computes ``hash_data = SHA-256(options) || SHA-256(doc)``.
-      4. Sends *hash_data* to SignServer's PlainSigner.
+      4. Sends *hash_data* to the configured signer (SignServer's
+         PlainSigner by default, see ``src.integrations.signer``).
       5. Converts the DER response to raw r||s.
       6. Multibase-encodes the raw signature.
       7. Returns the complete proof dict (ready to attach).
@@ -263,32 +470,102 @@ def create_proof(
     Raises:
         ValidationError: If signing fails.
     """
-    from src.integrations.signserver import sign_bytes
+    from src.integrations.signer import get_signer
+
+    signer = get_signer()
+    proof_options = _build_proof_options(did_document, verification_method_id, _proof_created())
+    hash_data = _proof_hash_data(proof_options, did_document, hash_name=signer.hash_name)
+
+    # ── 5. Sign (SignServer, local key or stub — SIGNER_BACKEND) ────
+    der_signature = signer.sign(hash_data)
+
+    return _finish_proof(proof_options, der_signature, key_size=signer.key_size)
+
+
+def create_proofs_batch(
+    documents: list[dict],
+    *,
+    verification_method_ids: list[str | None] | None = None,
+    concurrency: int | None = None,
+) -> list[dict]:
+    """
+    Create ``ecdsa-jcs-2019`` proofs for many documents at once.
+
+    Canonicalisation and hashing (steps 1-4 of ``create_proof``) run
+    locally for the whole batch; the hash-data payloads are then signed by
+    the configured signer in one batch (for SignServer: concurrent requests
+    over the pooled connections) and each signature is mapped back to its
+    document. All proofs of a
+    batch share the same ``created`` timestamp.
+
+    Args:
+        documents: Unsigned DID documents.
+        verification_method_ids: Optional VM URI per document (same length
+            as *documents*); ``None`` entries fall back as in ``create_proof``.
+        concurrency: SignServer requests in flight
+            (default: SIGNSERVER_BATCH_CONCURRENCY).
+
+    Returns:
+        One proof dict per document, in input order.
+
+    Raises:
+        ValidationError: If any document cannot be signed (nothing is returned).
+    """
+    from src.common.exceptions import ValidationError
+    from src.integrations.signer import get_signer
+
+    if verification_method_ids is None:
+        verification_method_ids = [None] * len(documents)
+    elif len(verification_method_ids) != len(documents):
+        raise ValidationError("verification_method_ids must match documents one to one.")
+
+    signer = get_signer()
+    created = _proof_created()
+    all_options = [
+        _build_proof_options(doc, vm_id, created)
+        for doc, vm_id in zip(documents, verification_method_ids, strict=True)
+    ]
+    hash_datas = [
+        _proof_hash_data(options, doc, hash_name=signer.hash_name)
+        for options, doc in zip(all_options, documents, strict=True)
+    ]
+
+    der_signatures = signer.sign_batch(hash_datas, concurrency=concurrency)
+
+    return [
+        _finish_proof(options, der, key_size=signer.key_size)
+        for options, der in zip(all_options, der_signatures, strict=True)
+    ]
 
-    # ── 1. Resolve verificationMethod for the proof ─────────────────
+
+def _proof_created() -> str:
+    return datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _build_proof_options(did_document: dict, verification_method_id: str | None, created: str) -> dict:
+    """Steps 1-2: proof options (without proofValue)."""
     if not verification_method_id:
         verification_method_id = _resolve_verification_method(did_document)
-
-    # ── 2. Build proof options (without proofValue) ─────────────────
-    now = datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-    proof_options = {
+    return {
         "type": "DataIntegrityProof",
         "cryptosuite": "ecdsa-jcs-2019",
         "proofPurpose": "assertionMethod",
         "verificationMethod": verification_method_id,
-        "created": now,
+        "created": created,
     }
 
-    # ── 3. JCS-canonicalise both objects ────────────────────────────
+
+def _proof_hash_data(proof_options: dict, did_document: dict, *, hash_name: str = "sha256") -> bytes:
+    """
+    Steps 3-4: ``H(JCS(options)) || H(JCS(document))`` with H = SHA-256
+    for P-256 keys (64 bytes) or SHA-384 for P-384 keys (96 bytes).
+    """
     proof_options_bytes = _jcs_canonicalize(proof_options)
     document_bytes = _jcs_canonicalize(did_document)
-
-    # ── 4. Build hash_data ──────────────────────────────────────────
     hash_data = (
-        hashlib.sha256(proof_options_bytes).digest()
-        + hashlib.sha256(document_bytes).digest()
+        hashlib.new(hash_name, proof_options_bytes).digest()
+        + hashlib.new(hash_name, document_bytes).digest()
     )
-    # hash_data is 64 bytes (two SHA-256 digests concatenated)
 
     logger.info(
         "proof_hash_data",
@@ -296,27 +573,22 @@ def create_proof(
         document_len=len(document_bytes),
         hash_data_hex=hash_data[:16].hex() + "...",
     )
+    return hash_data
 
-    # ── 5. Sign via SignServer ──────────────────────────────────────
-    der_signature = sign_bytes(hash_data)
 
-    # ── 6. Convert DER → raw r||s ──────────────────────────────────
-    raw_sig = _der_to_raw_ecdsa(der_signature, key_size=32)
-
-    # ── 7. Multibase-encode (base64url-no-pad, prefix 'u') ─────────
+def _finish_proof(proof_options: dict, der_signature: bytes, *, key_size: int) -> dict:
+    """Steps 6-8: DER → raw r||s (key_size from the signer's curve) → multibase."""
+    raw_sig = _der_to_raw_ecdsa(der_signature, key_size=key_size)
     proof_value = _multibase_encode(raw_sig)
-
-    # ── 8. Complete the proof ───────────────────────────────────────
-    proof_options["proofValue"] = proof_value
+    proof = {**proof_options, "proofValue": proof_value}
 
     logger.info(
         "proof_created",
         cryptosuite="ecdsa-jcs-2019",
         proof_value_len=len(proof_value),
-        verification_method=verification_method_id,
+        verification_method=proof["verificationMethod"],
     )
-
-    return proof_options
+    return proof
 
 
 def add_proof_to_document(did_document: dict, proof: dict) -> dict:
@@ -368,6 +640,210 @@ def sign_and_attach_proof(
     return signed, proof.get("proofValue", "")
 
 
+# ═════════════════════════════════════════════════════════════════════════
+#  Proof Verification
+# ═════════════════════════════════════════════════════════════════════════
+
+
+def verify_proof(did_document: dict, *, public_key_jwk: dict | None = None) -> dict:
+    """
+    Verify the ``ecdsa-jcs-2019`` Data Integrity proof of *did_document*.
+
+    Mirrors ``create_proof``: proof options = proof without ``proofValue``,
+    JCS-canonicalise options and document (without ``proof``), rebuild
+    hash_data (SHA-256, or SHA-384 for P-384 keys) and check the ECDSA
+    signature against the ``publicKeyJwk`` of the referenced verification
+    method. Parsed public keys are cached by JWK thumbprint (RFC 7638).
+
+    Proofs created before the Data Integrity ``@context`` entry was added
+    to the document (``add_proof_to_document`` appends it after signing)
+    are accepted: if the document as published does not verify and ends
+    with that context, it is checked again without it.
+
+    Args:
+        did_document: Signed DID document (with a ``proof`` member).
+        public_key_jwk: Verify against this key instead of looking up
+            ``proof.verificationMethod`` in the document.
+
+    Returns:
+        {"verified": bool, "verificationMethod": str | None,
+         "created": str | None, "error": str | None}
+        — never raises for a malformed or invalid proof, key or document.
+    """
+    proof = did_document.get("proof") if isinstance(did_document, dict) else None
+    result = {
+        "verified": False,
+        "verificationMethod": proof.get("verificationMethod") if isinstance(proof, dict) else None,
+        "created": proof.get("created") if isinstance(proof, dict) else None,
+        "error": None,
+    }
+    try:
+        _verify_proof(did_document, proof, public_key_jwk)
+    except _ProofError as e:
+        result["error"] = str(e)
+        return result
+
+    result["verified"] = True
+    return result
+
+
+def verify_proofs_batch(
+    documents: list[dict],
+    *,
+    processes: int | None = None,
+    chunksize: int = 64,
+) -> list[dict]:
+    """
+    ``verify_proof`` over many documents (integrity audits of the whole
+    published corpus), spread across a process pool.
+
+    Args:
+        documents: Signed DID documents.
+        processes: Worker processes (default: CPU count). 1 = in-process.
+        chunksize: Documents sent to a worker at a time.
+
+    Returns:
+        One ``verify_proof`` result per document, in input order.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, -(-len(documents) // chunksize)))
+    if processes == 1:
+        return [verify_proof(doc) for doc in documents]
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(verify_proof, documents, chunksize=chunksize))
+
+
+def jwk_thumbprint(jwk: dict) -> str:
+    """RFC 7638 JWK thumbprint (SHA-256, base64url without padding)."""
+    required = {
+        "EC": ("crv", "kty", "x", "y"),
+        "OKP": ("crv", "kty", "x"),
+        "RSA": ("e", "kty", "n"),
+    }.get(jwk.get("kty"))
+    if required is None or any(name not in jwk for name in required):
+        raise ValueError("Unsupported or incomplete JWK.")
+    members = json.dumps(
+        {name: jwk[name] for name in required}, separators=(",", ":"), sort_keys=True
+    )
+    digest = hashlib.sha256(members.encode("utf-8")).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+class _ProofError(Exception):
+    """The proof is missing, malformed or does not verify."""
+
+
+# (curve, bytes per integer in r||s, hash) for the keys a proof may use
+_VERIFY_CURVES = {
+    "P-256": (32, "sha256"),
+    "P-384": (48, "sha384"),
+}
+
+_PUBLIC_KEY_CACHE_SIZE = 4096
+_public_keys: dict[str, object] = {}
+
+
+def _verify_proof(did_document: dict, proof, public_key_jwk: dict | None) -> None:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+
+    if not isinstance(proof, dict):
+        raise _ProofError("Document has no proof.")
+    if proof.get("type") != "DataIntegrityProof" or proof.get("cryptosuite") != "ecdsa-jcs-2019":
+        raise _ProofError("Unsupported proof type (expected DataIntegrityProof / ecdsa-jcs-2019).")
+
+    jwk = public_key_jwk or _find_public_key_jwk(did_document, proof.get("verificationMethod"))
+    curve = jwk.get("crv")
+    if jwk.get("kty") != "EC" or not isinstance(curve, str) or curve not in _VERIFY_CURVES:
+        raise _ProofError(f"Unsupported key type {jwk.get('kty')}/{curve}.")
+    key_size, hash_name = _VERIFY_CURVES[curve]
+
+    raw_sig = _multibase_decode(proof.get("proofValue"))
+    if len(raw_sig) != 2 * key_size:
+        raise _ProofError(f"proofValue must be {2 * key_size} bytes for {curve}, got {len(raw_sig)}.")
+    der_sig = encode_dss_signature(
+        int.from_bytes(raw_sig[:key_size], "big"),
+        int.from_bytes(raw_sig[key_size:], "big"),
+    )
+
+    public_key = _public_key_from_jwk(jwk)
+    algorithm = ec.ECDSA(hashes.SHA256() if hash_name == "sha256" else hashes.SHA384())
+    proof_options = {k: v for k, v in proof.items() if k != "proofValue"}
+    unsecured = {k: v for k, v in did_document.items() if k != "proof"}
+
+    for candidate in _unsecured_candidates(unsecured):
+        try:
+            hash_data = _proof_hash_data(proof_options, candidate, hash_name=hash_name)
+        except (TypeError, ValueError) as e:
+            # NaN / Infinity, integers beyond 2**53, non-JSON values
+            raise _ProofError(f"Cannot canonicalize the document: {e}") from None
+        try:
+            public_key.verify(der_sig, hash_data, algorithm)
+            return
+        except InvalidSignature:
+            continue
+    raise _ProofError("Signature does not verify.")
+
+
+def _unsecured_candidates(unsecured: dict):
+    yield unsecured
+    ctx = unsecured.get("@context")
+    if isinstance(ctx, list) and ctx and ctx[-1] == DATA_INTEGRITY_CONTEXT:
+        yield {**unsecured, "@context": ctx[:-1]}
+
+
+def _find_public_key_jwk(did_document: dict, vm_id) -> dict:
+    if not vm_id or not isinstance(vm_id, str):
+        raise _ProofError("Proof has no verificationMethod.")
+    doc_id = did_document.get("id", "")
+    for vm in did_document.get("verificationMethod") or []:
+        candidate = vm.get("id") if isinstance(vm, dict) else None
+        if not isinstance(candidate, str):
+            continue
+        if candidate.startswith("#"):
+            candidate = f"{doc_id}{candidate}"
+        if candidate == vm_id or (vm_id.startswith("#") and candidate == f"{doc_id}{vm_id}"):
+            jwk = vm.get("publicKeyJwk")
+            if not isinstance(jwk, dict):
+                raise _ProofError(f"Verification method {vm_id} has no publicKeyJwk.")
+            return jwk
+    raise _ProofError(f"Verification method {vm_id} not found in the document.")
+
+
+def _public_key_from_jwk(jwk: dict):
+    """Parsed EC public key, cached by JWK thumbprint."""
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    try:
+        thumbprint = jwk_thumbprint(jwk)
+    except (TypeError, ValueError) as e:
+        raise _ProofError(str(e)) from None
+    key = _public_keys.get(thumbprint)
+    if key is not None:
+        return key
+
+    curve = ec.SECP256R1() if jwk["crv"] == "P-256" else ec.SECP384R1()
+    try:
+        x = int.from_bytes(_b64url_decode(jwk["x"]), "big")
+        y = int.from_bytes(_b64url_decode(jwk["y"]), "big")
+        key = ec.EllipticCurvePublicNumbers(x, y, curve).public_key()
+    except (TypeError, ValueError, KeyError) as e:
+        # x / y not strings, not base64url, or not a point of the curve
+        raise _ProofError(f"Invalid publicKeyJwk: {e}") from None
+
+    if len(_public_keys) >= _PUBLIC_KEY_CACHE_SIZE:
+        _public_keys.clear()
+    _public_keys[thumbprint] = key
+    return key
+
+
 # ═════════════════════════════════════════════════════════════════════════
 #  Verifiable Credential Builder
 # ═════════════════════════════════════════════════════════════════════════
@@ -461,6 +937,34 @@ def _enrich_jwk(jwk: dict, relationships: list[str]) -> dict:
     return enriched
 
 
+def _vm_fragment_key(did_uri: str, vm, version_id) -> tuple:
+    return (did_uri, str(vm.id), vm.method_id_fragment, str(version_id), vm.relationships, vm.method_type)
+
+
+def _vm_fragment(did_uri: str, vm, version_id, public_key_jwks: dict | None) -> dict:
+    """verificationMethod entry for *vm*, from the fragment cache when possible."""
+    key = _vm_fragment_key(did_uri, vm, version_id)
+    entry = _vm_fragments.get(key)
+    if entry is not None:
+        return entry
+
+    if public_key_jwks is not None and version_id in public_key_jwks:
+        jwk = public_key_jwks[version_id]
+    else:
+        jwk = vm.certificate.current_version.public_key_jwk
+
+    entry = {
+        "id": f"{did_uri}#{vm.method_id_fragment}",
+        "type": vm.method_type,
+        "controller": did_uri,
+        "publicKeyJwk": _enrich_jwk(jwk or {}, vm.relationship_list),
+    }
+    if len(_vm_fragments) >= _VM_FRAGMENT_CACHE_SIZE:
+        _vm_fragments.clear()
+    _vm_fragments[key] = entry
+    return entry
+
+
 def _build_service_endpoints(did_uri: str, endpoints: list[dict]) -> list[dict]:
     services = []
     for ep in endpoints:
@@ -500,30 +1004,8 @@ def _resolve_verification_method(did_document: dict) -> str:
 
 
 def _jcs_canonicalize(obj: dict) -> bytes:
-    """
-    JSON Canonicalization Scheme (RFC 8785).
-
-    For DID documents (which contain only strings, arrays, objects, and
-    occasionally integers — no floats, no special unicode) Python's
-    ``json.dumps(sort_keys=True)`` produces output identical to JCS.
-
-    For full RFC 8785 compliance install the ``jcs`` package::
-
-        pip install jcs
-
-    and this function will use it automatically.
-    """
-    try:
-        import jcs as _jcs  # type: ignore[import-untyped]
-
-        return _jcs.canonicalize(obj)
-    except ImportError:
-        return json.dumps(
-            obj,
-            sort_keys=True,
-            separators=(",", ":"),
-            ensure_ascii=False,
-        ).encode("utf-8")
+    """JSON Canonicalization Scheme (RFC 8785) — voir ``src.common.did.jcs``."""
+    return canonicalize(obj)
 
 
 def _der_to_raw_ecdsa(der_bytes: bytes, *, key_size: int = 32) -> bytes:
@@ -620,3 +1102,37 @@ def _multibase_encode(raw_bytes: bytes) -> str:
     """
     encoded = base64.urlsafe_b64encode(raw_bytes).rstrip(b"=").decode("ascii")
     return f"u{encoded}"
+
+
+def _multibase_decode(value) -> bytes:
+    """Decode a ``u`` (base64url) or ``z`` (base58btc) multibase string."""
+    if not isinstance(value, str) or len(value) < 2:
+        raise _ProofError("Missing proofValue.")
+    prefix, body = value[0], value[1:]
+    try:
+        if prefix == "u":
+            return _b64url_decode(body)
+        if prefix == "z":
+            return _base58btc_decode(body)
+    except ValueError as e:
+        raise _ProofError(f"Invalid proofValue: {e}") from None
+    raise _ProofError(f"Unsupported multibase prefix {prefix!r}.")
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _base58btc_decode(value: str) -> bytes:
+    number = 0
+    for char in value:
+        digit = _BASE58_ALPHABET.find(char)
+        if digit < 0:
+            raise ValueError(f"invalid base58 character {char!r}")
+        number = number * 58 + digit
+    leading_zeros = len(value) - len(value.lstrip("1"))
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big") if number else b""
+    return b"\x00" * leading_zeros + body
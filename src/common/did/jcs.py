@@ -0,0 +1,166 @@
+"""
+JSON Canonicalization Scheme (RFC 8785).
+
+``canonicalize(obj)`` returns the UTF-8 bytes hashed by ecdsa-jcs-2019:
+
+  - object members sorted by the UTF-16 code units of their names;
+  - strings serialized as ECMAScript ``JSON.stringify`` does (only ``"``,
+    ``\\`` and U+0000–U+001F are escaped, lowercase ``\\u00xx``);
+  - numbers serialized as IEEE-754 doubles with the ECMAScript
+    ``Number.prototype.toString`` algorithm (``1e+21``, ``0.000001``, ``-0`` → ``0``);
+  - no whitespace.
+
+Fast path: a DID document is strings, lists and dicts (plus the odd small
+integer, boolean or null). For such a tree — and as long as no member name
+holds a character above U+FFFF, where code point and UTF-16 order differ —
+``json.dumps(sort_keys=True)`` in its C encoder produces exactly the RFC 8785
+bytes, so it is used after a cheap scan of the tree. Anything else (floats,
+integers beyond 2**53, astral member names) goes through the reference
+serializer below.
+
+The conformance vectors and a benchmark against the ``jcs`` package live in
+``python -m src.manage benchmark_jcs``.
+"""
+
+import json
+import math
+from decimal import Decimal
+from json.encoder import encode_basestring as _encode_string
+
+# Integers in ±2**53 are exact doubles and print the same in Python and ECMAScript.
+_MAX_SAFE_INTEGER = 2**53
+
+_fast_encoder = json.JSONEncoder(
+    ensure_ascii=False,
+    allow_nan=False,
+    sort_keys=True,
+    separators=(",", ":"),
+)
+
+
+def canonicalize(obj) -> bytes:
+    """
+    Serialize *obj* (dict / list / str / int / float / bool / None) per RFC 8785.
+
+    Raises:
+        ValueError: NaN / Infinity, an integer that is not exactly
+            representable as a double, or a lone surrogate.
+        TypeError: a value that is not a JSON type, or a non-string member name.
+    """
+    if _is_simple(obj):
+        text = _fast_encoder.encode(obj)
+    else:
+        parts: list[str] = []
+        _serialize(obj, parts.append)
+        text = "".join(parts)
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Cannot canonicalize a lone surrogate: {e}") from e
+
+
+def format_number(value) -> str:
+    """ECMAScript ``Number.prototype.toString`` of *value* as an IEEE-754 double."""
+    if isinstance(value, int):
+        if -_MAX_SAFE_INTEGER <= value <= _MAX_SAFE_INTEGER:
+            return str(value)
+        as_float = float(value)
+        if int(as_float) != value:
+            raise ValueError(f"Integer {value} is not exactly representable as a double.")
+        value = as_float
+
+    if not math.isfinite(value):
+        raise ValueError(f"{value!r} is not allowed in canonical JSON.")
+    if value == 0:
+        return "0"
+
+    # repr() gives the shortest round-tripping digits — the same digits as
+    # ECMAScript; only the layout (where the point goes, exponent form) differs.
+    sign = "-" if value < 0 else ""
+    _, digit_tuple, exponent = Decimal(repr(abs(value))).as_tuple()
+    digits = "".join(map(str, digit_tuple)).rstrip("0")
+    exponent += len(digit_tuple) - len(digits)
+    k = len(digits)
+    n = k + exponent  # value = 0.<digits> × 10**n
+
+    if k <= n <= 21:
+        text = digits + "0" * (n - k)
+    elif 0 < n <= 21:
+        text = f"{digits[:n]}.{digits[n:]}"
+    elif -6 < n <= 0:
+        text = "0." + "0" * -n + digits
+    else:
+        e = n - 1
+        mantissa = digits if k == 1 else f"{digits[0]}.{digits[1:]}"
+        text = f"{mantissa}e{'+' if e >= 0 else '-'}{abs(e)}"
+    return sign + text
+
+
+# ── Internal helpers ────────────────────────────────────────────────────
+
+
+def _is_simple(obj) -> bool:
+    """True if ``json.dumps(sort_keys=True)`` already yields the RFC 8785 bytes."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            try:
+                names = "".join(value)
+            except TypeError:
+                return False
+            if not (names.isascii() or max(names) <= "\uffff"):
+                return False
+            items = value.values()
+        elif kind is list:
+            items = value
+        else:
+            items = (value,)
+        for item in items:
+            kind = type(item)
+            if kind is str or item is None or kind is bool:
+                continue
+            if kind is dict or kind is list:
+                stack.append(item)
+            elif kind is not int or not -_MAX_SAFE_INTEGER <= item <= _MAX_SAFE_INTEGER:
+                return False
+    return True
+
+
+def _utf16_key(name: str) -> bytes:
+    return name.encode("utf-16-be", "surrogatepass")
+
+
+def _serialize(value, write) -> None:
+    if value is None:
+        write("null")
+    elif value is True:
+        write("true")
+    elif value is False:
+        write("false")
+    elif isinstance(value, str):
+        write(_encode_string(value))
+    elif isinstance(value, (int, float)):
+        write(format_number(value))
+    elif isinstance(value, dict):
+        for name in value:
+            if not isinstance(name, str):
+                raise TypeError(f"Object member names must be strings, got {type(name).__name__}.")
+        write("{")
+        for index, name in enumerate(sorted(value, key=_utf16_key)):
+            if index:
+                write(",")
+            write(_encode_string(name))
+            write(":")
+            _serialize(value[name], write)
+        write("}")
+    elif isinstance(value, (list, tuple)):
+        write("[")
+        for index, item in enumerate(value):
+            if index:
+                write(",")
+            _serialize(item, write)
+        write("]")
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable.")
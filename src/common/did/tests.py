@@ -0,0 +1,115 @@
+"""
+verify_proof must answer verified=false, never raise, on malformed input
+(POST /api/v2/public/verify takes it from anyone).
+
+  python -m src.manage test src.common.did
+"""
+
+import base64
+import json
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from django.test import SimpleTestCase
+
+from src.common.did.assembler import (
+    _build_proof_options,
+    _finish_proof,
+    _proof_hash_data,
+    add_proof_to_document,
+    verify_proof,
+)
+
+DID = "did:web:localhost:acme:owner:passport"
+
+
+def _b64url(value: int) -> str:
+    return base64.urlsafe_b64encode(value.to_bytes(32, "big")).rstrip(b"=").decode("ascii")
+
+
+def _signed_document(**extra) -> dict:
+    key = ec.generate_private_key(ec.SECP256R1())
+    numbers = key.public_key().public_numbers()
+    jwk = {
+        "kty": "EC",
+        "crv": "P-256",
+        "x": _b64url(numbers.x),
+        "y": _b64url(numbers.y),
+    }
+    document = {
+        "@context": ["https://www.w3.org/ns/did/v1"],
+        "id": DID,
+        "verificationMethod": [
+            {"id": f"{DID}#key-1", "type": "JsonWebKey2020", "controller": DID, "publicKeyJwk": jwk}
+        ],
+        "assertionMethod": [f"{DID}#key-1"],
+        **extra,
+    }
+    options = _build_proof_options(document, f"{DID}#key-1", "2026-01-01T00:00:00Z")
+    signature = key.sign(_proof_hash_data(options, document), ec.ECDSA(hashes.SHA256()))
+    return add_proof_to_document(document, _finish_proof(options, signature, key_size=32))
+
+
+def _with_jwk(document: dict, **members) -> dict:
+    vm = {**document["verificationMethod"][0]}
+    vm["publicKeyJwk"] = {**vm["publicKeyJwk"], **members}
+    return {**document, "verificationMethod": [vm]}
+
+
+class VerifyProofTests(SimpleTestCase):
+    def test_valid_proof_verifies(self):
+        result = verify_proof(_signed_document())
+        self.assertTrue(result["verified"], result["error"])
+
+    def test_tampered_document_does_not_verify(self):
+        document = {**_signed_document(), "alsoKnownAs": ["https://evil.example"]}
+        result = verify_proof(document)
+        self.assertFalse(result["verified"])
+        self.assertEqual(result["error"], "Signature does not verify.")
+
+    def test_malformed_public_key_jwk(self):
+        document = _signed_document()
+        cases = {
+            "non-string x": _with_jwk(document, x=12345),
+            "non-base64url y": _with_jwk(document, y="é" * 43),
+            "list crv": _with_jwk(document, crv=["P-256"]),
+        }
+        for label, candidate in cases.items():
+            with self.subTest(label):
+                result = verify_proof(candidate)
+                self.assertFalse(result["verified"])
+                self.assertIsNotNone(result["error"])
+
+    def test_missing_coordinate_in_explicit_key(self):
+        jwk = {**_signed_document()["verificationMethod"][0]["publicKeyJwk"]}
+        del jwk["y"]
+        result = verify_proof(_signed_document(), public_key_jwk=jwk)
+        self.assertFalse(result["verified"])
+
+    def test_non_string_verification_method_id(self):
+        document = _signed_document()
+        document["verificationMethod"] = [{"id": 42}, *document["verificationMethod"]]
+        self.assertFalse(verify_proof(document)["verified"])
+
+    def test_document_that_cannot_be_canonicalized(self):
+        cases = {
+            "NaN": float("nan"),
+            "1e400 (infinity)": float("inf"),
+            "integer not exact as a double": 2**53 + 1,
+        }
+        for label, value in cases.items():
+            with self.subTest(label):
+                document = {**_signed_document(), "extra": value}
+                result = verify_proof(document)
+                self.assertFalse(result["verified"])
+                self.assertIn("Cannot canonicalize", result["error"])
+
+    def test_endpoint_answers_200_on_malformed_input(self):
+        document = {**_with_jwk(_signed_document(), x=12345), "extra": float("nan")}
+        response = self.client.post(
+            "/api/v2/public/verify",
+            data=json.dumps({"document": document}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["verified"])
@@ -37,6 +37,18 @@ class PermissionDeniedError(ApplicationError):
         super().__init__(message=message, status_code=403)
 
 
+class ServiceUnavailableError(ApplicationError):
+    def __init__(self, message: str = "Service temporarily unavailable."):
+        super().__init__(message=message, status_code=503)
+
+
+class OutcomeUnknownError(ServiceUnavailableError):
+    """The external service may have applied the request (read timeout, HTTP 5xx): to be reconciled."""
+
+    def __init__(self, message: str = "Outcome of the external call is unknown."):
+        super().__init__(message=message)
+
+
 def configure_exception_handlers(api):
     """Register exception handlers on a NinjaExtraAPI instance."""
 
@@ -38,6 +38,10 @@ app.conf.beat_schedule = {
         "task": "src.apps.authentication.tasks.clear_blacklisted_tokens",
         "schedule": crontab(hour=0, minute=0),
     },
+    "recover-publish-sagas": {
+        "task": "src.apps.documents.tasks.recover_publish_sagas_task",
+        "schedule": crontab(minute="*/5"),
+    },
 }
 
 
@@ -27,6 +27,15 @@ CSRF_TRUSTED_ORIGINS = env.CSRF_TRUSTED_ORIGINS
 # ── Autres ──────────────────────────────────────────────────────────────
 
 PLATFORM_DOMAIN = env.PLATFORM_DOMAIN
+DOCUMENT_PUBLISH_MODE = env.DOCUMENT_PUBLISH_MODE
+PUBLIC_SEARCH_CACHE_TTL = env.PUBLIC_SEARCH_CACHE_TTL
+SERVER_INTERFACE = env.SERVER_INTERFACE
+BULK_PUBLISH_CONCURRENCY = env.BULK_PUBLISH_CONCURRENCY
+BULK_PUBLISH_MAX_DOCUMENTS = env.BULK_PUBLISH_MAX_DOCUMENTS
+BULK_PUBLISH_SYNC_MAX_DOCUMENTS = env.BULK_PUBLISH_SYNC_MAX_DOCUMENTS
+PUBLISH_SAGA_RECOVERY_AFTER = env.PUBLISH_SAGA_RECOVERY_AFTER
+PUBLISH_SAGA_RECOVERY_BATCH = env.PUBLISH_SAGA_RECOVERY_BATCH
+PUBLISH_SAGA_MAX_RECOVERY_ATTEMPTS = env.PUBLISH_SAGA_MAX_RECOVERY_ATTEMPTS
 CSRF_COOKIE_SECURE = env.CSRF_COOKIE_SECURE
 _DOMAIN = "localhost"
 
@@ -34,9 +43,43 @@ _DOMAIN = "localhost"
 
 UNIVERSAL_REGISTRAR_URL = env.UNIVERSAL_REGISTRAR_URL
 UNIVERSAL_RESOLVER_URL = env.UNIVERSAL_RESOLVER_URL
+DID_LOCAL_RESOLUTION = env.DID_LOCAL_RESOLUTION
+DID_RESOLVER_CACHE_TTL = env.DID_RESOLVER_CACHE_TTL
+DID_RESOLVER_LOCAL_CACHE_TTL = env.DID_RESOLVER_LOCAL_CACHE_TTL
+DID_RESOLVER_STALE_TTL = env.DID_RESOLVER_STALE_TTL
+DID_RESOLVER_NEGATIVE_TTL = env.DID_RESOLVER_NEGATIVE_TTL
+DID_RESOLVER_ERROR_TTL = env.DID_RESOLVER_ERROR_TTL
+DID_RESOLVER_LRU_SIZE = env.DID_RESOLVER_LRU_SIZE
+DID_RESOLVER_LRU_TTL = env.DID_RESOLVER_LRU_TTL
+DID_RESOLVER_REFRESH_WORKERS = env.DID_RESOLVER_REFRESH_WORKERS
+DID_RESOLVER_SINGLE_FLIGHT_WAIT = env.DID_RESOLVER_SINGLE_FLIGHT_WAIT
+DID_RESOLVE_BATCH_MAX_DIDS = env.DID_RESOLVE_BATCH_MAX_DIDS
+DID_RESOLVE_BATCH_CONCURRENCY = env.DID_RESOLVE_BATCH_CONCURRENCY
 SIGNSERVER_URL = env.SIGNSERVER_URL
 SIGNSERVER_WORKER_NAME = env.SIGNSERVER_WORKER_NAME
+SIGNSERVER_TIMEOUT = env.SIGNSERVER_TIMEOUT
+SIGNSERVER_BATCH_CONCURRENCY = env.SIGNSERVER_BATCH_CONCURRENCY
+SIGNSERVER_KEY_CURVE = env.SIGNSERVER_KEY_CURVE
+SIGNER_BACKEND = env.SIGNER_BACKEND
+SIGNER_KEY_FILE = env.SIGNER_KEY_FILE
+SIGNER_KEY_PASSWORD = env.SIGNER_KEY_PASSWORD
+UNIVERSAL_REGISTRAR_TIMEOUT = env.UNIVERSAL_REGISTRAR_TIMEOUT
+UNIVERSAL_RESOLVER_TIMEOUT = env.UNIVERSAL_RESOLVER_TIMEOUT
+INTEGRATION_HTTP_POOL_SIZE = env.INTEGRATION_HTTP_POOL_SIZE
+INTEGRATION_HTTP_ASYNC_POOL_SIZE = env.INTEGRATION_HTTP_ASYNC_POOL_SIZE
+INTEGRATION_HTTP_RETRIES = env.INTEGRATION_HTTP_RETRIES
+INTEGRATION_HTTP_BACKOFF = env.INTEGRATION_HTTP_BACKOFF
+INTEGRATION_HTTP_CONNECT_TIMEOUT = env.INTEGRATION_HTTP_CONNECT_TIMEOUT
+INTEGRATION_HTTP_BUDGET = env.INTEGRATION_HTTP_BUDGET
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = env.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+CIRCUIT_BREAKER_WINDOW = env.CIRCUIT_BREAKER_WINDOW
+CIRCUIT_BREAKER_RESET_TIMEOUT = env.CIRCUIT_BREAKER_RESET_TIMEOUT
 JWK_EXTRACTOR_JAR = env.JWK_EXTRACTOR_JAR
+JWK_EXTRACTOR_JAVA = env.JWK_EXTRACTOR_JAVA
+CERT_EXTRACTOR_BACKEND = env.CERT_EXTRACTOR_BACKEND
+CERT_EXTRACTOR_POOL_SIZE = env.CERT_EXTRACTOR_POOL_SIZE
+CERT_EXTRACTOR_TIMEOUT = env.CERT_EXTRACTOR_TIMEOUT
+CERT_EXTRACTOR_CACHE_TTL = env.CERT_EXTRACTOR_CACHE_TTL
 PLATFORM_DOMAIN_WITHOUT_SCHEME = env.PLATFORM_DOMAIN_WITHOUT_SCHEME
 
 # ── Applications Installées ─────────────────────────────────────────────
@@ -129,6 +172,16 @@ DATABASES = {
     },
 }
 
+# Même base, connexion distincte en autocommit : le journal de saga de
+# publication y écrit chaque étape hors de la transaction de requête
+# (ATOMIC_REQUESTS), pour qu'elle survive à un crash du worker.
+DATABASES["journal"] = {
+    **DATABASES["default"],
+    "ATOMIC_REQUESTS": False,
+    "TEST": {"MIRROR": "default"},
+}
+PUBLISH_SAGA_DATABASE = "journal"
+
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
@@ -33,6 +33,7 @@ CSRF_TRUSTED_ORIGINS: list[str] = [
 # ── Base de données ─────────────────────────────────────────────────────
 
 DATABASES["default"]["CONN_MAX_AGE"] = 600  # noqa: F405
+DATABASES["journal"]["CONN_MAX_AGE"] = 600
 
 # ── Surcharge de journalisation ─────────────────────────────────────────
 # En production, structlog rend du JSON (configuré dans logging_conf.py
@@ -46,6 +47,6 @@ EMAIL_BACKEND = env.EMAIL_BACKEND
 JWK_EXTRACTOR_JAR = "/app/bin/ecdsa-extractor.jar"
 JWK_EXTRACTOR_JAVA = "java"
 
-# DID_RESOLVER_CACHE_TTL=7200
+# DID_RESOLVER_CACHE_TTL / DID_RESOLVER_STALE_TTL … : voir env.py
 
 EMAIL_TIMEOUT=10
\ No newline at end of file
@@ -19,6 +19,7 @@ DATABASES = {
         "NAME": ":memory:",
     },
 }
+PUBLISH_SAGA_DATABASE = "default"
 
 # ── Celery (synchronous in tests) ──────────────────────────────────────
 
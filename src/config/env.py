@@ -109,13 +109,59 @@ class AppSettings(BaseSettings):
     # ── External services ───────────────────────────────────────────────
     UNIVERSAL_REGISTRAR_URL: str = ""
     UNIVERSAL_RESOLVER_URL: str = ""
+    DID_LOCAL_RESOLUTION: bool = True  # resolve did:web:<PLATFORM_DOMAIN>:… from the DB
+    DID_RESOLVER_CACHE_TTL: int = 3600  # seconds a resolution result is fresh
+    DID_RESOLVER_LOCAL_CACHE_TTL: int = 604800  # same, platform DIDs (re-warmed on publish/deactivate)
+    DID_RESOLVER_STALE_TTL: int = 86400  # then served stale while refreshed in the background
+    DID_RESOLVER_NEGATIVE_TTL: int = 60  # "not found" cached for
+    DID_RESOLVER_ERROR_TTL: int = 10  # resolver errors cached for
+    DID_RESOLVER_LRU_SIZE: int = 1024  # in-process entries (0 = Redis only)
+    DID_RESOLVER_LRU_TTL: int = 60  # seconds an in-process entry is trusted before re-reading Redis
+    DID_RESOLVER_REFRESH_WORKERS: int = 2  # background refresh threads per process
+    DID_RESOLVE_BATCH_MAX_DIDS: int = 200  # per POST /public/resolve/batch
+    DID_RESOLVE_BATCH_CONCURRENCY: int = 8  # Universal Resolver requests in flight per batch
+    DID_RESOLVER_SINGLE_FLIGHT_WAIT: float = 5.0  # max wait on another caller's fetch before fetching
     SIGNSERVER_URL: str = ""
     SIGNSERVER_WORKER_NAME: str = ""
+    SIGNSERVER_TIMEOUT: int = 30  # read timeout, seconds
+    SIGNSERVER_BATCH_CONCURRENCY: int = 8  # requests in flight for batch signing
+    SIGNSERVER_KEY_CURVE: str = "P-256"  # "P-256" | "P-384"
+    SIGNER_BACKEND: str = "signserver"  # "signserver" | "local" | "stub"
+    SIGNER_KEY_FILE: str = ""  # PEM EC private key, "local" backend
+    SIGNER_KEY_PASSWORD: str = ""
+    UNIVERSAL_REGISTRAR_TIMEOUT: int = 30
+    UNIVERSAL_RESOLVER_TIMEOUT: int = 15
+    INTEGRATION_HTTP_POOL_SIZE: int = 10  # keep-alive connections per service
+    INTEGRATION_HTTP_ASYNC_POOL_SIZE: int = 100  # connections per service, async client (ASGI)
+    INTEGRATION_HTTP_RETRIES: int = 2
+    INTEGRATION_HTTP_BACKOFF: float = 0.2  # seconds, exponential + jitter
+    INTEGRATION_HTTP_CONNECT_TIMEOUT: float = 3.05
+    INTEGRATION_HTTP_BUDGET: float = 40  # seconds per call, retries included
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_WINDOW: int = 60  # seconds
+    CIRCUIT_BREAKER_RESET_TIMEOUT: int = 30  # seconds before a half-open probe
     JWK_EXTRACTOR_JAR: str = "path/to/ecdsa-extractor.jar"
+    JWK_EXTRACTOR_JAVA: str = "java"
+    CERT_EXTRACTOR_BACKEND: str = "python"  # "python" | "jar" | "daemon" (JAR built with --daemon)
+    CERT_EXTRACTOR_POOL_SIZE: int = 2  # daemon backend, per worker process
+    CERT_EXTRACTOR_TIMEOUT: int = 30  # seconds
+    CERT_EXTRACTOR_CACHE_TTL: int = 86400  # seconds, 0 = no result cache
 
     # ── Platform ────────────────────────────────────────────────────────
     PLATFORM_DOMAIN: str = "http://localhost:8000"
     PLATFORM_DOMAIN_WITHOUT_SCHEME: str = "localhost"
+    DOCUMENT_PUBLISH_MODE: str = "sync"  # "sync" | "async" (Celery job, 202)
+    PUBLIC_SEARCH_CACHE_TTL: int = 300  # public search pages (invalidated on publish/deactivate)
+    DID_JSON_BROTLI: bool = False  # also write did.json.br (nginx brotli_static)
+    DID_STORAGE_BACKENDS: list[str] = ["filesystem"]  # "filesystem" | "s3"; several = fan-out
+    DID_STORAGE_S3_PREFIX: str = "dids"  # key prefix in S3_BUCKET_NAME
+    DID_STORAGE_UPLOAD_CONCURRENCY: int = 8  # S3 requests in flight per batch
+    BULK_PUBLISH_CONCURRENCY: int = 4  # parallel publishes per bulk request (cap)
+    BULK_PUBLISH_MAX_DOCUMENTS: int = 500  # per bulk API call, mode=async
+    BULK_PUBLISH_SYNC_MAX_DOCUMENTS: int = 20  # per bulk API call, mode=sync (must finish within the gunicorn timeout)
+    PUBLISH_SAGA_RECOVERY_AFTER: int = 600  # seconds before a stuck saga is recovered
+    PUBLISH_SAGA_RECOVERY_BATCH: int = 50  # sagas per recovery run
+    PUBLISH_SAGA_MAX_RECOVERY_ATTEMPTS: int = 5  # then FAILED (manual intervention)
     SUPERADMIN_EMAIL: str = ""
     SUPERADMIN_PASSWORD: str = ""
     SUPERADMIN_FULL_NAME: str = ""
@@ -142,6 +188,25 @@ class AppSettings(BaseSettings):
     # ── Gunicorn ────────────────────────────────────────────────────────
     GUNICORN_WORKERS: int = 4
     GUNICORN_BIND: str = "0.0.0.0:8899"
+    SERVER_INTERFACE: str = "wsgi"  # "asgi": uvicorn workers, async public resolve/search
+
+    @field_validator("SERVER_INTERFACE")
+    @classmethod
+    def validate_server_interface(cls, v: str) -> str:
+        allowed = {"wsgi", "asgi"}
+        if v not in allowed:
+            msg = f"SERVER_INTERFACE must be one of {allowed}, got '{v}'"
+            raise ValueError(msg)
+        return v
+
+    @field_validator("CERT_EXTRACTOR_BACKEND")
+    @classmethod
+    def validate_cert_extractor_backend(cls, v: str) -> str:
+        allowed = {"python", "jar", "daemon"}
+        if v not in allowed:
+            msg = f"CERT_EXTRACTOR_BACKEND must be one of {allowed}, got '{v}'"
+            raise ValueError(msg)
+        return v
 
     @field_validator("DJANGO_ENV")
     @classmethod
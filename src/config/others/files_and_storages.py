@@ -22,8 +22,24 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DID_DOCUMENTS_ROOT = BASE_DIR / "data" / "dids"
 
+# did.json is written compact with a did.json.gz sibling (nginx gzip_static);
+# did.json.br as well when enabled (needs the ngx_brotli module to be served).
+DID_JSON_BROTLI = env.DID_JSON_BROTLI
+
 STORAGE_STRATEGY = enum_to_env(StorageEnum, env.STORAGE)
 
+_S3_BASE_OPTIONS = {
+    "access_key": env.S3_ACCESS_KEY,
+    "secret_key": env.S3_SECRET_KEY,
+    "bucket_name": env.S3_BUCKET_NAME,
+    "endpoint_url": env.S3_ENDPOINT_URL,
+    "signature_version": "s3v4",
+    "addressing_style": "path",
+    "querystring_auth": True,
+    "querystring_expire": 3600,
+    "region_name": "us-east-1",
+}
+
 if STORAGE_STRATEGY == StorageEnum.LOCAL:
     STATIC_URL = "/static/"
     MEDIA_URL = "/media/"
@@ -43,18 +59,6 @@ elif STORAGE_STRATEGY == StorageEnum.S3:
     )
     MEDIA_URL = f"{env.S3_ENDPOINT_URL}/{env.S3_BUCKET_NAME}/media/"
 
-    _S3_BASE_OPTIONS = {
-        "access_key": env.S3_ACCESS_KEY,
-        "secret_key": env.S3_SECRET_KEY,
-        "bucket_name": env.S3_BUCKET_NAME,
-        "endpoint_url": env.S3_ENDPOINT_URL,
-        "signature_version": "s3v4",
-        "addressing_style": "path",
-        "querystring_auth": True,
-        "querystring_expire": 3600,
-        "region_name": "us-east-1",
-    }
-
     STORAGES = {
         "default": {
             "BACKEND": "storages.backends.s3.S3Storage",
@@ -75,5 +79,14 @@ elif STORAGE_STRATEGY == StorageEnum.S3:
 else:
     raise RuntimeError(f"Unknown storage strategy {STORAGE_STRATEGY!r}")
 
+# ── DID document storage ────────────────────────────────────────────────
+# Where published did.json files go (src.integrations.did_storage):
+# "filesystem" (DID_DOCUMENTS_ROOT) and/or "s3" (same bucket/credentials as
+# the S3 STORAGES, under DID_STORAGE_S3_PREFIX). Several = fan-out.
+
+DID_STORAGE_BACKENDS = env.DID_STORAGE_BACKENDS
+DID_STORAGE_S3_OPTIONS = {**_S3_BASE_OPTIONS, "location": env.DID_STORAGE_S3_PREFIX}
+DID_STORAGE_UPLOAD_CONCURRENCY = env.DID_STORAGE_UPLOAD_CONCURRENCY
+
 # Prevent manifest errors from crashing the app
 WHITENOISE_MANIFEST_STRICT = False
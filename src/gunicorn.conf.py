@@ -1,10 +1,20 @@
 """
 Gunicorn configuration.
 
-Reads from pydantic_settings env for worker count and bind address.
-structlog handles all logging — gunicorn's default loggers are suppressed.
+Reads from pydantic_settings env for worker count, bind address and
+interface. structlog handles all logging — gunicorn's default loggers are
+suppressed.
+
+SERVER_INTERFACE selects the deployment profile:
+  wsgi (default) — sync workers serving src.wsgi: one request per process.
+  asgi           — uvicorn workers serving src.asgi: the async endpoints
+                   (public resolve / search) wait on the Universal Resolver
+                   without holding the process, so one worker keeps
+                   hundreds of resolves in flight; sync endpoints run in
+                   Django's thread pool.
 """
 
+import importlib.util
 import multiprocessing
 
 from src.config.env import env
@@ -16,7 +26,19 @@ bind = env.GUNICORN_BIND  # "0.0.0.0:8899"
 # ── Workers ─────────────────────────────────────────────────────────────
 
 workers = env.GUNICORN_WORKERS or (multiprocessing.cpu_count() * 2 + 1)
-worker_class = "sync"
+if env.SERVER_INTERFACE == "asgi":
+    # Refuse to boot rather than serve the async endpoints on the sync
+    # fallback: both come from uv.lock (uv sync --frozen).
+    _missing = [m for m in ("uvicorn_worker", "httpx") if importlib.util.find_spec(m) is None]
+    if _missing:
+        raise RuntimeError(
+            f"SERVER_INTERFACE=asgi needs {', '.join(_missing)}: rebuild the image (uv sync --frozen)."
+        )
+    wsgi_app = "src.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "src.wsgi:application"
+    worker_class = "sync"
 worker_tmp_dir = "/dev/shm"  # Faster heartbeat checks in Docker
 
 # ── Timeouts ────────────────────────────────────────────────────────────
@@ -0,0 +1,344 @@
+"""
+Warm pool of ecdsa-extractor daemons ("daemon" certificate backend).
+
+Instead of forking ``java -jar`` for every upload, each gunicorn/celery
+worker process keeps a few ``java -jar ecdsa-extractor.jar --daemon``
+children alive and talks to them over stdin/stdout. Certificate bytes are
+written straight into the pipe — no temp file — and a request costs
+milliseconds once the JVM is warm.
+
+Framing (see org.jwk.ExtractorDaemon, big-endian):
+    request  = u8 op | i32 pw_len (-1 = none) | pw | i32 cert_len | cert
+    response = u8 status (0 ok, 1 error) | i32 len | UTF-8 payload
+
+Lifecycle:
+    - processes are spawned lazily, up to CERT_EXTRACTOR_POOL_SIZE, and
+      must answer a ping before use (a JAR without --daemon is rejected);
+    - a process that died, timed out or broke the framing is killed and its
+      slot freed: a request waiting for a daemon is woken and spawns the
+      replacement at once (one transparent retry on crash);
+    - the pool is bound to the PID that created it, so children are never
+      shared across a fork (gunicorn preload, celery prefork);
+    - ``health_check()`` pings idle processes and reaps dead ones.
+
+Configuration:
+    JWK_EXTRACTOR_JAR / JWK_EXTRACTOR_JAVA — same as the "jar" backend.
+    CERT_EXTRACTOR_POOL_SIZE — daemons per worker process (default: 2).
+    CERT_EXTRACTOR_TIMEOUT — seconds per request (default: 30).
+"""
+
+import atexit
+import os
+import queue
+import selectors
+import struct
+import subprocess
+import threading
+import time
+
+import structlog
+from django.conf import settings
+
+from src.common.exceptions import ValidationError
+
+logger = structlog.get_logger(__name__)
+
+OP_PING = 0
+OP_JWK = 1
+OP_METADATA = 2
+
+_MODE_OPS = {"--jwk": OP_JWK, "--metadata": OP_METADATA}
+
+_STATUS_OK = 0
+_RESPONSE_HEADER = struct.Struct(">Bi")
+
+
+class _DaemonCrashed(Exception):
+    """The child exited or closed its pipes mid-request."""
+
+
+def _get_pool_size() -> int:
+    return max(1, int(getattr(settings, "CERT_EXTRACTOR_POOL_SIZE", 2)))
+
+
+def _get_timeout() -> float:
+    return float(getattr(settings, "CERT_EXTRACTOR_TIMEOUT", 30))
+
+
+# ── Process ─────────────────────────────────────────────────────────────
+
+
+class _ExtractorProcess:
+    """One ``--daemon`` child. Not thread-safe: the pool hands it to a single caller."""
+
+    def __init__(self, java_bin: str, jar_path: str):
+        try:
+            self.proc = subprocess.Popen(
+                [java_bin, "-jar", jar_path, "--daemon"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                bufsize=0,
+            )
+        except FileNotFoundError:
+            raise ValidationError(
+                f"Java binary not found at '{java_bin}'. "
+                "Ensure JDK is installed and JWK_EXTRACTOR_JAVA is set."
+            ) from None
+        self.requests = 0
+
+        # A JAR built before --daemon existed reads it as a file name and
+        # exits: fail loudly instead of retrying forever.
+        try:
+            ok, _ = self.request(OP_PING, b"", None, timeout=_get_timeout())
+        except (TimeoutError, _DaemonCrashed):
+            ok = False
+        if not ok:
+            self.close()
+            logger.error("cert_daemon_unsupported", jar=jar_path, return_code=self.proc.returncode)
+            raise ValidationError(
+                f"Certificate extractor '{jar_path}' does not answer as a daemon. "
+                "Rebuild it from jwk_extract/ (gradle jar) or set CERT_EXTRACTOR_BACKEND=jar."
+            )
+        self.requests = 0
+        logger.info("cert_daemon_started", pid=self.proc.pid)
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, op: int, cert_bytes: bytes, p12_password: str | None, timeout: float):
+        """
+        Send one request and wait for its response.
+
+        Returns (ok, payload). Raises TimeoutError or _DaemonCrashed.
+        """
+        if p12_password is None:
+            pw_frame = struct.pack(">i", -1)
+        else:
+            pw = p12_password.encode("utf-8")
+            pw_frame = struct.pack(">i", len(pw)) + pw
+        frame = struct.pack(">B", op) + pw_frame + struct.pack(">i", len(cert_bytes)) + cert_bytes
+
+        deadline = time.monotonic() + timeout
+        try:
+            self.proc.stdin.write(frame)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise _DaemonCrashed(str(e)) from e
+
+        status, length = _RESPONSE_HEADER.unpack(self._read_exact(_RESPONSE_HEADER.size, deadline))
+        payload = self._read_exact(length, deadline).decode("utf-8")
+        self.requests += 1
+        return status == _STATUS_OK, payload
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        fd = self.proc.stdout.fileno()
+        chunks = []
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while size > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
+                    raise TimeoutError
+                chunk = os.read(fd, size)
+                if not chunk:
+                    raise _DaemonCrashed("extractor closed its output")
+                chunks.append(chunk)
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self):
+        if self.alive:
+            try:
+                self.proc.stdin.close()  # EOF → clean exit
+                self.proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+        logger.info("cert_daemon_stopped", pid=self.proc.pid, requests=self.requests)
+
+
+# ── Pool ────────────────────────────────────────────────────────────────
+
+
+class _ExtractorPool:
+    def __init__(self, size: int, java_bin: str, jar_path: str):
+        self.pid = os.getpid()
+        self.size = size
+        self.java_bin = java_bin
+        self.jar_path = jar_path
+        # Idle daemons, and None for each slot freed by discard(): a waiter
+        # blocked in get() is woken to spawn the replacement.
+        self._idle: queue.LifoQueue[_ExtractorProcess | None] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._spawned = 0
+
+    def acquire(self, timeout: float) -> _ExtractorProcess:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = self._spawn_or_wait(deadline)
+            if worker is None:
+                continue  # a slot was freed: spawn in it
+            if worker.alive:
+                return worker
+            self.discard(worker)
+
+    def _spawn_or_wait(self, deadline: float) -> _ExtractorProcess | None:
+        with self._lock:
+            can_spawn = self._spawned < self.size
+            if can_spawn:
+                self._spawned += 1
+        if can_spawn:
+            try:
+                return _ExtractorProcess(self.java_bin, self.jar_path)
+            except Exception:
+                with self._lock:
+                    self._spawned -= 1
+                raise
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError
+        try:
+            return self._idle.get(timeout=remaining)
+        except queue.Empty:
+            raise TimeoutError from None
+
+    def release(self, worker: _ExtractorProcess):
+        self._idle.put(worker)
+
+    def discard(self, worker: _ExtractorProcess):
+        if worker.alive:
+            worker.proc.kill()
+            worker.proc.wait()
+        logger.warning(
+            "cert_daemon_discarded",
+            pid=worker.proc.pid,
+            return_code=worker.proc.returncode,
+            requests=worker.requests,
+        )
+        with self._lock:
+            self._spawned -= 1
+        self._idle.put(None)
+
+    def drain(self) -> list[_ExtractorProcess]:
+        """Take every idle daemon off the queue (freed-slot markers are dropped)."""
+        workers = []
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return workers
+            if worker is not None:
+                workers.append(worker)
+
+    def close(self):
+        for worker in self.drain():
+            worker.close()
+            with self._lock:
+                self._spawned -= 1
+
+
+_pool: _ExtractorPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> _ExtractorPool:
+    global _pool
+    pid = os.getpid()
+    if _pool is not None and _pool.pid == pid:
+        return _pool
+    with _pool_lock:
+        if _pool is None or _pool.pid != pid:
+            # After a fork the inherited children belong to the parent:
+            # leave them alone and start a fresh pool for this process.
+            _pool = _ExtractorPool(
+                size=_get_pool_size(),
+                java_bin=getattr(settings, "JWK_EXTRACTOR_JAVA", "") or "java",
+                jar_path=settings.JWK_EXTRACTOR_JAR,
+            )
+        return _pool
+
+
+@atexit.register
+def shutdown():
+    """Stop the idle daemons of the current process."""
+    if _pool is not None and _pool.pid == os.getpid():
+        _pool.close()
+
+
+# ── Public API ──────────────────────────────────────────────────────────
+
+
+def run_extractor(mode: str, cert_bytes: bytes, p12_password: str | None = None) -> str:
+    """
+    Drop-in replacement for ``cert_service._run_extractor`` backed by the pool.
+
+    Returns the JSON string produced by the JAR. Raises ValidationError with
+    the same messages as the subprocess backend.
+    """
+    op = _MODE_OPS[mode]
+    timeout = _get_timeout()
+    pool = _get_pool()
+
+    for attempt in (1, 2):
+        try:
+            worker = pool.acquire(timeout)
+        except TimeoutError:
+            raise ValidationError(
+                f"Certificate extraction timed out ({timeout:g}s): no extractor available."
+            ) from None
+
+        try:
+            ok, payload = worker.request(op, cert_bytes, p12_password, timeout)
+        except TimeoutError:
+            pool.discard(worker)
+            raise ValidationError(f"Certificate extraction timed out ({timeout:g}s).") from None
+        except _DaemonCrashed as e:
+            pool.discard(worker)
+            logger.warning("cert_daemon_crashed", attempt=attempt, error=str(e))
+            if attempt == 2:
+                raise ValidationError(f"Certificate extraction failed: {e}.") from None
+            continue
+
+        pool.release(worker)
+
+        if not ok:
+            logger.error("cert_extraction_failed", mode=mode, backend="daemon", stderr=payload)
+            raise ValidationError(f"Certificate extraction failed: {payload}")
+        return payload
+
+
+def health_check() -> dict:
+    """
+    Ping every idle daemon of this process and reap the dead ones (they are
+    respawned lazily by the next request).
+
+    Returns a dict with pool size, live/reaped counts and the slowest ping
+    in milliseconds.
+    """
+    pool = _get_pool()
+    live, reaped, slowest = 0, 0, 0.0
+    for worker in pool.drain():
+        start = time.monotonic()
+        try:
+            ok, _ = worker.request(OP_PING, b"", None, timeout=5)
+        except (TimeoutError, _DaemonCrashed):
+            ok = False
+        if ok:
+            live += 1
+            slowest = max(slowest, (time.monotonic() - start) * 1000)
+            pool.release(worker)
+        else:
+            reaped += 1
+            pool.discard(worker)
+
+    return {
+        "pool_size": pool.size,
+        "spawned": pool._spawned,
+        "live": live,
+        "reaped": reaped,
+        "slowest_ping_ms": round(slowest, 2),
+    }
@@ -1,42 +1,85 @@
 """
 Certificate extraction service.
 
-Calls the ecdsa-extractor.jar via subprocess to extract JWK and metadata
-from X.509 certificates. Uses BouncyCastle under the hood for reliable
-handling of named curve parameters.
+Extracts JWK and metadata from X.509 certificates (PEM, DER, PKCS#7 and
+PKCS#12 inputs). Two interchangeable backends produce the same dict:
+
+  "python" — in-process extraction with ``cryptography``. No JVM start-up,
+             no temp file, no subprocess. This is the default.
+  "jar"    — the legacy ecdsa-extractor.jar, called via subprocess
+             (BouncyCastle under the hood).
+  "daemon" — the same JAR kept warm in a per-worker pool of ``--daemon``
+             processes (see cert_daemon). For deployments that keep
+             BouncyCastle as the source of truth.
+
+The Python backend mirrors the JAR output field for field (RFC 2253 DNs as
+emitted by ``X500Principal.getName()``, lowercase hex serial, ISO-8601
+instants, JWK coordinate padding), so switching backends never changes
+what ends up in ``CertificateVersion``.
 
 Configuration:
-    JWK_EXTRACTOR_JAR — path to the fat JAR. Set in Django settings.
+    CERT_EXTRACTOR_BACKEND — "python" (default), "jar" or "daemon".
+    CERT_EXTRACTOR_CACHE_TTL — seconds a result stays in the content-addressed
+        cache (default: 86400, 0 disables it).
+    JWK_EXTRACTOR_JAR — path to the fat JAR, built from jwk_extract/
+        (./gradlew jar → build/libs/ecdsa-extractor.jar; the image builds it
+        into /app/bin). Set in Django settings.
     JWK_EXTRACTOR_JAVA — path to java binary (default: 'java').
 """
 
+import base64
+import hashlib
+import hmac
 import json
 import subprocess
 import tempfile
 
 import structlog
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
 from src.common.exceptions import ValidationError
 
 logger = structlog.get_logger(__name__)
 
+BACKEND_PYTHON = "python"
+BACKEND_JAR = "jar"
+BACKEND_DAEMON = "daemon"
+BACKENDS = (BACKEND_PYTHON, BACKEND_JAR, BACKEND_DAEMON)
+
 
 def _get_java_bin() -> str:
-    return "java"
+    return getattr(settings, "JWK_EXTRACTOR_JAVA", "") or "java"
 
 
 def _get_jar_path() -> str:
     return settings.JWK_EXTRACTOR_JAR
 
 
-def extract_jwk(*, cert_pem_bytes: bytes, p12_password: str | None = None) -> dict:
+def _get_backend(backend: str | None = None) -> str:
+    backend = backend or getattr(settings, "CERT_EXTRACTOR_BACKEND", BACKEND_PYTHON)
+    if backend not in BACKENDS:
+        raise ImproperlyConfigured(
+            f"Unknown CERT_EXTRACTOR_BACKEND {backend!r}. Expected one of {BACKENDS}."
+        )
+    return backend
+
+
+def extract_jwk(
+    *,
+    cert_pem_bytes: bytes,
+    p12_password: str | None = None,
+    backend: str | None = None,
+    use_cache: bool = True,
+) -> dict:
     """
     Extract JWK from a certificate file.
 
     Args:
-        cert_pem_bytes: raw bytes of the PEM/DER/P12 file
+        cert_pem_bytes: raw bytes of the PEM/DER/P7B/P12 file
         p12_password: password for PKCS#12 keystores (optional)
+        backend: override CERT_EXTRACTOR_BACKEND for this call (optional)
+        use_cache: look up / store the result in the extraction cache
 
     Returns:
         dict — the JWK as a Python dict
@@ -44,14 +87,18 @@ def extract_jwk(*, cert_pem_bytes: bytes, p12_password: str | None = None) -> di
     Raises:
         ValidationError on extraction failure.
     """
-    result = _run_extractor("--jwk", cert_pem_bytes, p12_password)
-    try:
-        return json.loads(result)
-    except json.JSONDecodeError as e:
-        raise ValidationError(f"Failed to parse JWK output: {e}") from e
+    return _extract(
+        "--jwk", cert_pem_bytes, p12_password, backend=backend, use_cache=use_cache
+    )
 
 
-def extract_metadata(*, cert_pem_bytes: bytes, p12_password: str | None = None) -> dict:
+def extract_metadata(
+    *,
+    cert_pem_bytes: bytes,
+    p12_password: str | None = None,
+    backend: str | None = None,
+    use_cache: bool = True,
+) -> dict:
     """
     Extract full metadata from a certificate file.
 
@@ -61,16 +108,146 @@ def extract_metadata(*, cert_pem_bytes: bytes, p12_password: str | None = None)
             not_valid_before (ISO), not_valid_after (ISO),
             key_type, key_curve (EC only), key_size (RSA only),
             fingerprint_sha256,
+            key_usage (if present), extended_key_usage (if present),
             public_key_jwk (dict)
 
     Raises:
         ValidationError on extraction failure.
     """
-    result = _run_extractor("--metadata", cert_pem_bytes, p12_password)
+    return _extract(
+        "--metadata", cert_pem_bytes, p12_password, backend=backend, use_cache=use_cache
+    )
+
+
+def _extract(
+    mode: str,
+    cert_bytes: bytes,
+    p12_password: str | None,
+    *,
+    backend: str | None,
+    use_cache: bool,
+) -> dict:
+    backend = _get_backend(backend)
+    cache_key = _cache_key(mode, cert_bytes, p12_password) if use_cache else None
+
+    if cache_key:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    if backend == BACKEND_PYTHON:
+        builder = _build_jwk if mode == "--jwk" else _build_metadata
+        result = _run_native(builder, cert_bytes, p12_password, mode=mode)
+    else:
+        output = _run_jar_backend(backend, mode, cert_bytes, p12_password)
+        try:
+            result = json.loads(output)
+        except json.JSONDecodeError as e:
+            what = "JWK" if mode == "--jwk" else "metadata"
+            raise ValidationError(f"Failed to parse {what} output: {e}") from e
+
+    if cache_key:
+        _cache_set(cache_key, result)
+    return result
+
+
+# ── Result cache ────────────────────────────────────────────────────────
+#
+# Extraction is a pure function of (bytes, password): the same certificate
+# re-uploaded after a rotation, into another org or after a label conflict
+# is served from Redis. Only successful results are cached. Bump
+# _CACHE_VERSION whenever the output format changes.
+
+_CACHE_VERSION = 1
+_CACHE_PREFIX = "cert_extract"
+_CACHE_HITS_KEY = f"{_CACHE_PREFIX}:stats:hits"
+_CACHE_MISSES_KEY = f"{_CACHE_PREFIX}:stats:misses"
+
+
+def _get_cache_ttl() -> int:
+    return int(getattr(settings, "CERT_EXTRACTOR_CACHE_TTL", 86400))
+
+
+def _cache_key(mode: str, cert_bytes: bytes, p12_password: str | None) -> str | None:
+    if _get_cache_ttl() <= 0:
+        return None
+    digest = hashlib.sha256(cert_bytes).hexdigest()
+    if p12_password is None:
+        pw_digest = "-"
+    else:
+        # Keyed digest: the cache must not become a password-guessing oracle.
+        pw_digest = hmac.new(
+            settings.SECRET_KEY.encode(), p12_password.encode("utf-8"), hashlib.sha256
+        ).hexdigest()[:32]
+    return f"{_CACHE_PREFIX}:v{_CACHE_VERSION}:{mode.lstrip('-')}:{digest}:{pw_digest}"
+
+
+def _cache_get(key: str) -> dict | None:
+    from django.core.cache import cache
+
     try:
-        return json.loads(result)
-    except json.JSONDecodeError as e:
-        raise ValidationError(f"Failed to parse metadata output: {e}") from e
+        result = cache.get(key)
+        _incr(cache, _CACHE_HITS_KEY if result is not None else _CACHE_MISSES_KEY)
+    except Exception as e:
+        logger.warning("cert_extraction_cache_unavailable", error=str(e))
+        return None
+
+    logger.debug("cert_extraction_cache_" + ("hit" if result is not None else "miss"), key=key)
+    return result
+
+
+def _cache_set(key: str, result: dict) -> None:
+    from django.core.cache import cache
+
+    try:
+        cache.set(key, result, timeout=_get_cache_ttl())
+    except Exception as e:
+        logger.warning("cert_extraction_cache_unavailable", error=str(e))
+
+
+def _incr(cache, key: str) -> None:
+    cache.add(key, 0, timeout=None)
+    cache.incr(key)
+
+
+def get_cache_stats() -> dict:
+    """
+    Hit/miss counters of the extraction cache (shared by all workers).
+
+    Returns:
+        {"hits": int, "misses": int, "hit_ratio": float, "ttl": int}
+    """
+    from django.core.cache import cache
+
+    counters = cache.get_many([_CACHE_HITS_KEY, _CACHE_MISSES_KEY])
+    hits = counters.get(_CACHE_HITS_KEY, 0)
+    misses = counters.get(_CACHE_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else 0.0,
+        "ttl": _get_cache_ttl(),
+    }
+
+
+def reset_cache_stats() -> None:
+    from django.core.cache import cache
+
+    cache.delete_many([_CACHE_HITS_KEY, _CACHE_MISSES_KEY])
+
+
+# ── JAR backends ────────────────────────────────────────────────────────
+
+
+def _run_jar_backend(
+    backend: str, mode: str, cert_bytes: bytes, p12_password: str | None
+) -> str:
+    if backend == BACKEND_DAEMON:
+        from src.integrations.cert_daemon import run_extractor
+
+        return run_extractor(mode, cert_bytes, p12_password)
+    return _run_extractor(mode, cert_bytes, p12_password)
 
 
 def _run_extractor(
@@ -81,6 +258,7 @@ def _run_extractor(
     """
     java_bin = _get_java_bin()
     jar_path = _get_jar_path()
+    timeout = getattr(settings, "CERT_EXTRACTOR_TIMEOUT", 30)
 
     with tempfile.NamedTemporaryFile(suffix=".pem", delete=True) as tmp:
         tmp.write(cert_bytes)
@@ -96,7 +274,7 @@ def _run_extractor(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=30,
+                timeout=timeout,
             )
         except FileNotFoundError:
             raise ValidationError(
@@ -104,16 +282,300 @@ def _run_extractor(
                 "Ensure JDK is installed and JWK_EXTRACTOR_JAVA is set."
             ) from None
         except subprocess.TimeoutExpired:
-            raise ValidationError("Certificate extraction timed out (30s).") from None
+            raise ValidationError(f"Certificate extraction timed out ({timeout}s).") from None
 
         if result.returncode != 0:
             error_msg = result.stderr.strip() or "Unknown error"
             logger.error(
                 "cert_extraction_failed",
                 mode=mode,
+                backend=BACKEND_JAR,
                 return_code=result.returncode,
                 stderr=error_msg,
             )
             raise ValidationError(f"Certificate extraction failed: {error_msg}")
 
         return result.stdout.strip()
+
+
+# ── Python backend ──────────────────────────────────────────────────────
+#
+# Mirrors org.jwk.JWKExtractor. Keep both in sync: any field added to the
+# JAR output must be added here too (see compare_cert_extractors).
+
+# Attribute keywords X500Principal emits in RFC 2253 format. Every other
+# attribute is printed as <dotted-oid>=#<hex DER value>.
+_RFC2253_KEYWORDS = {
+    "2.5.4.3": "CN",
+    "2.5.4.6": "C",
+    "2.5.4.7": "L",
+    "2.5.4.8": "ST",
+    "2.5.4.10": "O",
+    "2.5.4.11": "OU",
+    "2.5.4.9": "STREET",
+    "0.9.2342.19200300.100.1.25": "DC",
+    "0.9.2342.19200300.100.1.1": "UID",
+}
+
+_CURVE_NAMES = {
+    "secp256r1": "P-256",
+    "secp384r1": "P-384",
+    "secp521r1": "P-521",
+    "secp256k1": "secp256k1",
+}
+
+_COORDINATE_SIZES = {
+    "P-256": 32,
+    "secp256k1": 32,
+    "P-384": 48,
+    "P-521": 66,
+}
+
+
+class _UnsupportedKeyError(Exception):
+    pass
+
+
+def _run_native(builder, cert_bytes: bytes, p12_password: str | None, *, mode: str) -> dict:
+    """Load the certificate and run *builder* on it, mapping errors like the JAR CLI."""
+    try:
+        return builder(_load_certificate(cert_bytes, p12_password))
+    except _UnsupportedKeyError as e:
+        error_msg = f"Unsupported key type: {e}"
+    except Exception as e:
+        error_msg = f"Error: {e}"
+
+    logger.error(
+        "cert_extraction_failed",
+        mode=mode,
+        backend=BACKEND_PYTHON,
+        error=error_msg,
+    )
+    raise ValidationError(f"Certificate extraction failed: {error_msg}")
+
+
+def _load_certificate(cert_bytes: bytes, p12_password: str | None):
+    """X.509 (PEM / DER / PKCS#7) first, PKCS#12 as a fallback — like the JAR."""
+    try:
+        return _load_from_x509(cert_bytes)
+    except Exception as e:
+        try:
+            return _load_from_pkcs12(cert_bytes, p12_password)
+        except Exception:
+            raise ValueError(
+                f"Cannot parse certificate: {e}. File may be a private key, "
+                "an unsupported format, or corrupted."
+            ) from None
+
+
+def _load_from_x509(cert_bytes: bytes):
+    from cryptography import x509
+    from cryptography.hazmat.primitives.serialization import pkcs7
+
+    if b"-----BEGIN PKCS7-----" in cert_bytes:
+        certs = pkcs7.load_pem_pkcs7_certificates(cert_bytes)
+    elif b"-----BEGIN" in cert_bytes:
+        certs = x509.load_pem_x509_certificates(cert_bytes)
+    else:
+        try:
+            return x509.load_der_x509_certificate(cert_bytes)
+        except ValueError:
+            certs = pkcs7.load_der_pkcs7_certificates(cert_bytes)
+
+    if not certs:
+        raise ValueError("No certificates found in file.")
+    return certs[0]
+
+
+def _load_from_pkcs12(cert_bytes: bytes, p12_password: str | None):
+    """Try the explicit password, then "", then no password (JAR order)."""
+    from cryptography.hazmat.primitives.serialization import pkcs12
+
+    passwords: list[bytes | None] = []
+    if p12_password is not None:
+        passwords.append(p12_password.encode("utf-8"))
+    passwords += [b"", None]
+
+    for password in passwords:
+        try:
+            bundle = pkcs12.load_pkcs12(cert_bytes, password)
+        except ValueError:
+            continue  # Wrong password → try next
+        if bundle.cert is not None:
+            return bundle.cert.certificate
+        if bundle.additional_certs:
+            return bundle.additional_certs[0].certificate
+        raise ValueError("No certificate entries found in PKCS#12 keystore.")
+
+    if p12_password is None:
+        raise ValueError("The keystore requires a password. Use --p12-password <pwd>.")
+    raise ValueError("Wrong password or corrupted keystore.")
+
+
+def _build_metadata(cert) -> dict:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes
+
+    meta: dict = {
+        "subject_dn": _format_dn(cert.subject),
+        "issuer_dn": _format_dn(cert.issuer),
+        "serial_number": format(cert.serial_number, "x"),
+        "not_valid_before": _format_instant(cert.not_valid_before_utc),
+        "not_valid_after": _format_instant(cert.not_valid_after_utc),
+    }
+
+    public_key = cert.public_key()
+    meta["key_type"] = _key_type(public_key)
+    if meta["key_type"] == "EC":
+        meta["key_curve"] = _CURVE_NAMES.get(public_key.curve.name, "unknown")
+    elif meta["key_type"] == "RSA":
+        meta["key_size"] = public_key.public_numbers().n.bit_length()
+
+    meta["fingerprint_sha256"] = cert.fingerprint(hashes.SHA256()).hex()
+
+    try:
+        ku = cert.extensions.get_extension_for_class(x509.KeyUsage).value
+    except x509.ExtensionNotFound:
+        ku = None
+    if ku is not None:
+        meta["key_usage"] = [
+            ku.digital_signature,
+            ku.content_commitment,
+            ku.key_encipherment,
+            ku.data_encipherment,
+            ku.key_agreement,
+            ku.key_cert_sign,
+            ku.crl_sign,
+            ku.key_agreement and ku.encipher_only,
+            ku.key_agreement and ku.decipher_only,
+        ]
+
+    try:
+        eku = cert.extensions.get_extension_for_class(x509.ExtendedKeyUsage).value
+    except x509.ExtensionNotFound:
+        eku = None
+    if eku is not None:
+        meta["extended_key_usage"] = [oid.dotted_string for oid in eku]
+
+    meta["public_key_jwk"] = _build_jwk(cert)
+    return meta
+
+
+def _build_jwk(cert) -> dict:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+
+    public_key = cert.public_key()
+
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        numbers = public_key.public_numbers()
+        crv = _CURVE_NAMES.get(public_key.curve.name, "unknown")
+        size = _COORDINATE_SIZES.get(crv, 32)
+        return {
+            "kty": "EC",
+            "crv": crv,
+            "x": _b64url(_int_to_bytes(numbers.x, size)),
+            "y": _b64url(_int_to_bytes(numbers.y, size)),
+        }
+
+    if isinstance(public_key, rsa.RSAPublicKey):
+        numbers = public_key.public_numbers()
+        return {
+            "kty": "RSA",
+            "n": _b64url(_int_to_bytes(numbers.n)),
+            "e": _b64url(_int_to_bytes(numbers.e)),
+        }
+
+    if isinstance(public_key, ed25519.Ed25519PublicKey | ed448.Ed448PublicKey):
+        crv = "Ed25519" if isinstance(public_key, ed25519.Ed25519PublicKey) else "Ed448"
+        raw = public_key.public_bytes(
+            serialization.Encoding.Raw, serialization.PublicFormat.Raw
+        )
+        return {"kty": "OKP", "crv": crv, "x": _b64url(raw)}
+
+    raise _UnsupportedKeyError(f"Unsupported key algorithm: {_key_type(public_key)}")
+
+
+def _key_type(public_key) -> str:
+    from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, rsa
+
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return "EC"
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return "RSA"
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "Ed25519"
+    if isinstance(public_key, ed448.Ed448PublicKey):
+        return "Ed448"
+    if isinstance(public_key, dsa.DSAPublicKey):
+        return "DSA"
+    return type(public_key).__name__
+
+
+# ── Encoding helpers ────────────────────────────────────────────────────
+
+
+def _format_dn(name) -> str:
+    """RFC 2253 string, byte-for-byte what X500Principal.getName() returns."""
+    return ",".join(
+        "+".join(_format_attribute(attr) for attr in rdn)
+        for rdn in reversed(name.rdns)
+    )
+
+
+def _format_attribute(attr) -> str:
+    keyword = _RFC2253_KEYWORDS.get(attr.oid.dotted_string)
+    if keyword is None:
+        return f"{attr.oid.dotted_string}=#{_der_attribute_value(attr).hex()}"
+    return f"{keyword}={_escape_dn_value(attr.value)}"
+
+
+def _escape_dn_value(value: str) -> str:
+    escaped = []
+    for i, ch in enumerate(value):
+        if ch in ',=+"\\<>;#':
+            escaped.append("\\" + ch)
+        elif (i == 0 or i == len(value) - 1) and ch == " ":
+            escaped.append("\\" + ch)
+        else:
+            escaped.append(ch)
+    return "".join(escaped)
+
+
+def _der_attribute_value(attr) -> bytes:
+    """DER TLV of an attribute value (the ``#hex`` form of RFC 2253)."""
+    # cryptography keeps the original ASN.1 string type on the private ``_type``.
+    tag = attr._type.value
+    value = attr.value
+    if isinstance(value, bytes):
+        content = value
+    elif tag == 12:  # UTF8String
+        content = value.encode("utf-8")
+    elif tag == 30:  # BMPString
+        content = value.encode("utf-16-be")
+    elif tag == 28:  # UniversalString
+        content = value.encode("utf-32-be")
+    else:
+        content = value.encode("latin-1")
+    return bytes([tag]) + _der_length(len(content)) + content
+
+
+def _der_length(length: int) -> bytes:
+    if length < 0x80:
+        return bytes([length])
+    encoded = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([0x80 | len(encoded)]) + encoded
+
+
+def _format_instant(value) -> str:
+    """java.time.Instant.toString() for whole-second timestamps."""
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _int_to_bytes(value: int, size: int = 0) -> bytes:
+    length = max(1, (value.bit_length() + 7) // 8, size)
+    return value.to_bytes(length, "big")
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
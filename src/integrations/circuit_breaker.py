@@ -0,0 +1,185 @@
+"""
+Circuit breakers for the external DID services.
+
+One breaker per service (SignServer, Registrar, Resolver), with its state
+kept in the default cache (Redis) so that every gunicorn/celery worker
+sees the same picture:
+
+  closed     — calls go through; failures are counted over a sliding
+               CIRCUIT_BREAKER_WINDOW. Reaching CIRCUIT_BREAKER_FAILURE_THRESHOLD
+               opens the breaker.
+  open       — calls fail fast with ServiceUnavailableError (HTTP 503) for
+               CIRCUIT_BREAKER_RESET_TIMEOUT seconds, instead of pinning a
+               sync worker on a dead dependency.
+  half_open  — the reset timeout elapsed: a single worker is allowed to
+               probe. Success closes the breaker, failure re-opens it.
+
+A failure is a transport error (connection, timeout) or an HTTP 5xx,
+counted once per ``http_client.request`` call (after its retries).
+If the cache itself is unreachable, the breaker stays out of the way.
+
+Cache keys (``circuit:{service}:…``):
+  failures   — failure counter, expires with the window
+  open_until — epoch seconds; present while the breaker is open
+  tripped    — set while open or half-open, cleared on success
+  probe      — held by the worker running the half-open probe
+"""
+
+import time
+
+import structlog
+from django.conf import settings
+
+from src.common.exceptions import ServiceUnavailableError
+
+logger = structlog.get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_SERVICE_LABELS = {
+    "signserver": "SignServer",
+    "registrar": "Universal Registrar",
+    "resolver": "Universal Resolver",
+}
+
+
+def _threshold() -> int:
+    return int(getattr(settings, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5))
+
+
+def _window() -> int:
+    return int(getattr(settings, "CIRCUIT_BREAKER_WINDOW", 60))
+
+
+def _reset_timeout() -> int:
+    return int(getattr(settings, "CIRCUIT_BREAKER_RESET_TIMEOUT", 30))
+
+
+def _key(service: str, name: str) -> str:
+    return f"circuit:{service}:{name}"
+
+
+def before_call(service: str, *, probe_ttl: float) -> None:
+    """
+    Let the call through or fail fast.
+
+    Args:
+        service: service name (see http_client).
+        probe_ttl: how long a half-open probe may hold its slot (the call's
+            own latency budget), so a crashed prober cannot wedge the breaker.
+
+    Raises:
+        ServiceUnavailableError: the breaker is open, or half-open with a
+            probe already in flight.
+    """
+    from django.core.cache import cache
+
+    try:
+        open_until, tripped = _get_many(cache, service, "open_until", "tripped")
+        if not tripped:
+            return
+        if open_until is not None:
+            _fail_fast(service, retry_in=open_until - time.time())
+        if not cache.add(_key(service, "probe"), 1, timeout=int(probe_ttl) + 1):
+            _fail_fast(service, retry_in=None)
+        logger.info("circuit_half_open_probe", service=service)
+    except ServiceUnavailableError:
+        raise
+    except Exception as e:
+        logger.warning("circuit_breaker_cache_unavailable", service=service, error=str(e))
+
+
+def record_success(service: str) -> None:
+    from django.core.cache import cache
+
+    try:
+        failures, tripped = _get_many(cache, service, "failures", "tripped")
+        if not failures and not tripped:
+            return  # steady state: a single read per call
+        cache.delete_many([_key(service, "failures"), _key(service, "tripped"), _key(service, "probe")])
+        if tripped:
+            logger.info("circuit_closed", service=service)
+    except Exception as e:
+        logger.warning("circuit_breaker_cache_unavailable", service=service, error=str(e))
+
+
+def record_failure(service: str, reason: str) -> None:
+    from django.core.cache import cache
+
+    try:
+        if cache.get(_key(service, "tripped")):
+            # Half-open probe failed (or a call raced the opening): re-open.
+            _open(cache, service, reason=reason)
+            return
+
+        failures_key = _key(service, "failures")
+        cache.add(failures_key, 0, timeout=_window())
+        failures = cache.incr(failures_key)
+        if failures >= _threshold():
+            _open(cache, service, reason=reason, failures=failures)
+    except Exception as e:
+        logger.warning("circuit_breaker_cache_unavailable", service=service, error=str(e))
+
+
+def get_state(service: str) -> dict:
+    """
+    Current breaker state, for health checks.
+
+    Returns:
+        {"state": "closed" | "open" | "half_open", "failures": int,
+         "retry_in": seconds until half-open (open only)}
+    """
+    from django.core.cache import cache
+
+    try:
+        open_until, tripped, failures = _get_many(cache, service, "open_until", "tripped", "failures")
+    except Exception as e:
+        return {"state": "unknown", "error": str(e)}
+
+    if not tripped:
+        return {"state": CLOSED, "failures": failures or 0}
+    if open_until is not None:
+        return {"state": OPEN, "failures": failures or 0, "retry_in": max(0, round(open_until - time.time()))}
+    return {"state": HALF_OPEN, "failures": failures or 0}
+
+
+def reset(service: str) -> None:
+    """Force the breaker closed (operator action)."""
+    from django.core.cache import cache
+
+    cache.delete_many([_key(service, name) for name in ("failures", "open_until", "tripped", "probe")])
+
+
+# ── Internal helpers ─────────────────────────────────────────────────────
+
+
+def _get_many(cache, service: str, *names: str) -> list:
+    values = cache.get_many([_key(service, name) for name in names])
+    return [values.get(_key(service, name)) for name in names]
+
+
+def _open(cache, service: str, reason: str, failures: int | None = None) -> None:
+    reset_timeout = _reset_timeout()
+    cache.set(_key(service, "open_until"), time.time() + reset_timeout, timeout=reset_timeout)
+    # Outlives open_until: its presence without open_until means half-open.
+    cache.set(_key(service, "tripped"), 1, timeout=reset_timeout + 3600)
+    cache.delete_many([_key(service, "failures"), _key(service, "probe")])
+    logger.error(
+        "circuit_opened",
+        service=service,
+        reason=reason,
+        failures=failures,
+        reset_timeout=reset_timeout,
+    )
+
+
+def _fail_fast(service: str, retry_in: float | None) -> None:
+    label = _SERVICE_LABELS.get(service, service)
+    if retry_in is not None and retry_in > 0:
+        message = f"{label} is unavailable (circuit open). Retry in {int(retry_in) + 1}s."
+    else:
+        message = f"{label} is unavailable (circuit open). Retry shortly."
+    logger.warning("circuit_rejected", service=service, retry_in=retry_in)
+    raise ServiceUnavailableError(message)
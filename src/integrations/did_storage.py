@@ -0,0 +1,352 @@
+"""
+Storage backends for published did.json files.
+
+``write_did_json_to_disk`` / ``delete_did_json_from_disk`` (assembler) go
+through ``get_did_storage()``, which combines the backends listed in
+DID_STORAGE_BACKENDS:
+
+  "filesystem" — DID_DOCUMENTS_ROOT, the volume nginx serves from. Atomic
+                 rename, compressed siblings for gzip_static, nothing
+                 rewritten when the bytes are unchanged. The default.
+  "s3"         — S3-compatible bucket (AWS, MinIO, …) with the credentials
+                 and endpoint of the S3 STORAGES settings, under the
+                 DID_STORAGE_S3_PREFIX prefix. Objects mirror the volume
+                 layout byte for byte (did.json, did.json.gz, did.json.br),
+                 so an edge node can sync the bucket into its own volume
+                 and serve it with the same nginx location.
+
+Several backends = fan-out: every write and delete goes to all of them in
+parallel and fails if any of them fails (the publish saga then compensates
+on all of them). Paths are relative: ``org/owner/label/did.json``.
+
+Configuration:
+    DID_STORAGE_BACKENDS — e.g. ["filesystem"] (default) or ["filesystem", "s3"].
+    DID_STORAGE_S3_OPTIONS — built from the S3 STORAGES options + prefix.
+    DID_STORAGE_UPLOAD_CONCURRENCY — S3 requests in flight per batch (default: 8).
+    DID_JSON_BROTLI — also write did.json.br.
+"""
+
+import contextlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import structlog
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from src.common.exceptions import ServiceUnavailableError
+
+logger = structlog.get_logger(__name__)
+
+DID_STORAGE_FILESYSTEM = "filesystem"
+DID_STORAGE_S3 = "s3"
+DID_STORAGES = (DID_STORAGE_FILESYSTEM, DID_STORAGE_S3)
+
+# suffix → S3 content type of the object
+_OBJECT_TYPES = {
+    "": "application/did+json",
+    ".gz": "application/gzip",
+    ".br": "application/x-brotli",
+}
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+_S3_DELETE_BATCH = 1000
+
+
+class DIDStorage:
+    """Writes and deletes did.json files (plus their compressed variants)."""
+
+    name = ""
+
+    def write_many(self, items: list[tuple[str, bytes]]) -> list[str]:
+        """
+        Store each ``(relative path, did.json bytes)``.
+
+        Returns one outcome per item: "unchanged", "variants", "missing" or
+        "drift" for the filesystem (see ``sync_did_json_file``), "written"
+        for object storage.
+        """
+        raise NotImplementedError
+
+    def delete_many(self, paths: list[str]) -> None:
+        raise NotImplementedError
+
+    def write(self, path: str, data: bytes) -> str:
+        return self.write_many([(path, data)])[0]
+
+    def delete(self, path: str) -> None:
+        self.delete_many([path])
+
+
+class FilesystemDIDStorage(DIDStorage):
+    name = DID_STORAGE_FILESYSTEM
+
+    def __init__(self, root, *, brotli: bool = False):
+        self.root = Path(root)
+        self.brotli = brotli
+
+    def write_many(self, items: list[tuple[str, bytes]]) -> list[str]:
+        outcomes = []
+        for relative_path, data in items:
+            path = self.root / relative_path
+            outcomes.append(sync_did_json_file(path, data, read_bytes(path), brotli=self.brotli))
+        return outcomes
+
+    def delete_many(self, paths: list[str]) -> None:
+        for relative_path in paths:
+            remove_did_json_file(self.root / relative_path)
+
+
+class S3DIDStorage(DIDStorage):
+    name = DID_STORAGE_S3
+
+    def __init__(self, options: dict, *, brotli: bool = False, concurrency: int = 8):
+        if not options.get("bucket_name"):
+            raise ImproperlyConfigured("DID_STORAGE_BACKENDS includes 's3' but no S3 bucket is configured.")
+        self.options = options
+        self.bucket = options["bucket_name"]
+        self.prefix = (options.get("location") or "").strip("/")
+        self.brotli = brotli
+        self.concurrency = max(1, concurrency)
+
+    def write_many(self, items: list[tuple[str, bytes]]) -> list[str]:
+        uploads = []
+        for relative_path, data in items:
+            uploads.append((relative_path, data))
+            for suffix, compressed in compressed_variants(data, brotli=self.brotli).items():
+                uploads.append((relative_path + suffix, compressed))
+        self._run(self._put, uploads)
+        logger.info("did_storage_s3_written", bucket=self.bucket, documents=len(items), objects=len(uploads))
+        return ["written"] * len(items)
+
+    def delete_many(self, paths: list[str]) -> None:
+        keys = [
+            self._key(relative_path + suffix)
+            for relative_path in paths
+            for suffix in _OBJECT_TYPES
+        ]
+        batches = [keys[i : i + _S3_DELETE_BATCH] for i in range(0, len(keys), _S3_DELETE_BATCH)]
+        self._run(self._delete_batch, [(batch,) for batch in batches])
+        logger.info("did_storage_s3_deleted", bucket=self.bucket, documents=len(paths))
+
+    def _key(self, relative_path: str) -> str:
+        return f"{self.prefix}/{relative_path}" if self.prefix else relative_path
+
+    def _put(self, relative_path: str, data: bytes) -> None:
+        suffix = next((s for s in (".gz", ".br") if relative_path.endswith(s)), "")
+        _s3_client(self.options).put_object(
+            Bucket=self.bucket,
+            Key=self._key(relative_path),
+            Body=data,
+            ContentType=_OBJECT_TYPES[suffix],
+            CacheControl="public, max-age=300",
+        )
+
+    def _delete_batch(self, keys: list[str]) -> None:
+        response = _s3_client(self.options).delete_objects(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        errors = response.get("Errors") or []
+        if errors:
+            raise RuntimeError(f"{len(errors)} object(s) not deleted, first: {errors[0]}")
+
+    def _run(self, func, calls: list[tuple]) -> None:
+        """Run *calls* with up to ``concurrency`` S3 requests in flight."""
+        if not calls:
+            return
+        workers = min(self.concurrency, len(calls))
+        try:
+            if workers == 1:
+                for args in calls:
+                    func(*args)
+                return
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="did-s3") as pool:
+                for future in [pool.submit(func, *args) for args in calls]:
+                    future.result()
+        except Exception as e:
+            logger.error("did_storage_s3_failed", bucket=self.bucket, error=str(e))
+            raise ServiceUnavailableError(f"DID object storage failed: {e}") from e
+
+
+class FanOutDIDStorage(DIDStorage):
+    """Writes to every backend in parallel; outcomes are those of the first one."""
+
+    name = "fan-out"
+
+    def __init__(self, backends: list[DIDStorage]):
+        self.backends = backends
+
+    def write_many(self, items: list[tuple[str, bytes]]) -> list[str]:
+        return self._fan_out("write_many", items)[0]
+
+    def delete_many(self, paths: list[str]) -> None:
+        self._fan_out("delete_many", paths)
+
+    def _fan_out(self, method: str, arg) -> list:
+        with ThreadPoolExecutor(max_workers=len(self.backends), thread_name_prefix="did-fan-out") as pool:
+            futures = [pool.submit(getattr(backend, method), arg) for backend in self.backends]
+        results, failed = [], []
+        for backend, future in zip(self.backends, futures, strict=True):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error("did_storage_fan_out_failed", backend=backend.name, operation=method, error=str(e))
+                failed.append((backend, e))
+        if failed:
+            names = ", ".join(backend.name for backend, _ in failed)
+            error = failed[0][1]
+            raise ServiceUnavailableError(f"DID storage failed on {names}: {error}") from error
+        return results
+
+
+def get_did_storage(backends: list[str] | None = None) -> DIDStorage:
+    """
+    The storage selected by DID_STORAGE_BACKENDS — or *backends* — (fan-out if several).
+
+    Raises:
+        ImproperlyConfigured: unknown or empty backend list, S3 without a bucket.
+    """
+    names = backends or getattr(settings, "DID_STORAGE_BACKENDS", None) or [DID_STORAGE_FILESYSTEM]
+    brotli = getattr(settings, "DID_JSON_BROTLI", False)
+
+    storages: list[DIDStorage] = []
+    for name in dict.fromkeys(names):
+        if name == DID_STORAGE_FILESYSTEM:
+            storages.append(FilesystemDIDStorage(settings.DID_DOCUMENTS_ROOT, brotli=brotli))
+        elif name == DID_STORAGE_S3:
+            storages.append(
+                S3DIDStorage(
+                    getattr(settings, "DID_STORAGE_S3_OPTIONS", {}),
+                    brotli=brotli,
+                    concurrency=getattr(settings, "DID_STORAGE_UPLOAD_CONCURRENCY", 8),
+                )
+            )
+        else:
+            raise ImproperlyConfigured(f"Unknown DID storage backend {name!r}. Expected one of {DID_STORAGES}.")
+    return storages[0] if len(storages) == 1 else FanOutDIDStorage(storages)
+
+
+# ── Filesystem primitives ───────────────────────────────────────────────
+
+
+def sync_did_json_file(path, data: bytes, current: bytes | None, *, brotli: bool, dry_run: bool = False) -> str:
+    """
+    Write *data* (and its compressed variants) to *path* where they differ.
+
+    Returns "unchanged", "variants" (only a compressed sibling was
+    missing), "missing" (no did.json) or "drift" (did.json differed).
+    """
+    suffixes = (".gz", ".br") if brotli and _brotli_module() is not None else (".gz",)
+    variants = {path.with_name(path.name + suffix): suffix for suffix in suffixes}
+
+    if current == data:
+        stale = [variant for variant in variants if not variant.exists()]
+        if not stale:
+            return "unchanged"
+        outcome = "variants"
+    else:
+        stale = list(variants)
+        outcome = "missing" if current is None else "drift"
+
+    if not dry_run:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = compressed_variants(data, brotli=brotli)
+        for variant in stale:
+            _atomic_write(variant, compressed[variants[variant]])
+        if outcome != "variants":
+            _atomic_write(path, data)
+    return outcome
+
+
+def remove_did_json_file(path) -> None:
+    """Delete did.json and its compressed variants (no-op if absent)."""
+    for suffix in _OBJECT_TYPES:
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def read_bytes(path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def compressed_variants(data: bytes, *, brotli: bool = False) -> dict[str, bytes]:
+    """``{".gz": …}`` (plus ``".br"`` with *brotli* when the module is installed)."""
+    import gzip
+
+    # mtime=0: identical input → identical .gz
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    module = _brotli_module() if brotli else None
+    if module is not None:
+        variants[".br"] = module.compress(data, quality=11, mode=module.MODE_TEXT)
+    return variants
+
+
+def _atomic_write(path, data: bytes) -> None:
+    """Write *data* to a temp file next to *path*, fsync, then rename over *path*."""
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; nginx must read it
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _brotli_module():
+    try:
+        import brotli  # type: ignore[import-untyped]
+    except ImportError:
+        logger.warning("did_json_brotli_unavailable", hint="pip install brotli, or unset DID_JSON_BROTLI.")
+        return None
+    return brotli
+
+
+# ── S3 client ───────────────────────────────────────────────────────────
+
+_s3_clients: dict[tuple, object] = {}
+_s3_lock = threading.Lock()
+
+
+def _s3_client(options: dict):
+    """One boto3 client per process and endpoint/credentials (clients are thread-safe)."""
+    key = (
+        os.getpid(),
+        options.get("endpoint_url"),
+        options.get("access_key"),
+        options.get("region_name"),
+    )
+    client = _s3_clients.get(key)
+    if client is not None:
+        return client
+    with _s3_lock:
+        client = _s3_clients.get(key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            client = boto3.client(
+                "s3",
+                endpoint_url=options.get("endpoint_url") or None,
+                aws_access_key_id=options.get("access_key"),
+                aws_secret_access_key=options.get("secret_key"),
+                region_name=options.get("region_name"),
+                config=Config(
+                    signature_version=options.get("signature_version", "s3v4"),
+                    s3={"addressing_style": options.get("addressing_style", "auto")},
+                    max_pool_connections=max(10, getattr(settings, "DID_STORAGE_UPLOAD_CONCURRENCY", 8)),
+                ),
+            )
+            _s3_clients[key] = client
+        return client
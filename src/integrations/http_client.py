@@ -0,0 +1,440 @@
+"""
+Shared HTTP layer for the external DID services.
+
+SignServer, the Universal Registrar and the Universal Resolver all go
+through ``request()`` instead of bare ``requests.post/get``:
+
+  - one ``requests.Session`` per service and per process, so TCP/TLS
+    connections are kept alive and reused across publishes and resolves;
+  - connect/read timeouts split per service;
+  - bounded retries with full-jitter exponential backoff. Idempotent
+    calls retry on connection errors, timeouts and 502/503/504. Other
+    calls only retry when the request never reached the server
+    (connect timeout / connection refused);
+  - a latency budget per call (all attempts included), so a slow
+    dependency cannot hold a sync worker past the gunicorn timeout;
+  - a per-service circuit breaker shared through Redis
+    (see ``circuit_breaker``).
+
+Sessions are bound to the PID that created them: after a fork (gunicorn
+preload, celery prefork) each child opens its own pool.
+
+``arequest()`` is the asyncio counterpart (ASGI handlers): same timeouts,
+retries, budget and breaker, over one pooled ``httpx.AsyncClient`` per
+service and per event loop (INTEGRATION_HTTP_ASYNC_POOL_SIZE connections),
+so a single worker can keep hundreds of calls waiting on a dependency.
+
+Configuration (Django settings):
+  INTEGRATION_HTTP_POOL_SIZE        — keep-alive connections per service (default: 10)
+  INTEGRATION_HTTP_ASYNC_POOL_SIZE  — connections per service, async client (default: 100)
+  INTEGRATION_HTTP_RETRIES          — extra attempts after the first one (default: 2)
+  INTEGRATION_HTTP_BACKOFF          — base backoff in seconds (default: 0.2)
+  INTEGRATION_HTTP_CONNECT_TIMEOUT  — connect timeout in seconds (default: 3.05)
+  INTEGRATION_HTTP_BUDGET           — max seconds per call, retries included (default: 40)
+  SIGNSERVER_TIMEOUT / UNIVERSAL_REGISTRAR_TIMEOUT / UNIVERSAL_RESOLVER_TIMEOUT
+                                    — read timeouts in seconds (30 / 30 / 15)
+"""
+
+import os
+import random
+import threading
+import time
+
+import structlog
+from django.conf import settings
+
+from src.common.exceptions import ValidationError
+
+logger = structlog.get_logger(__name__)
+
+SIGNSERVER = "signserver"
+REGISTRAR = "registrar"
+RESOLVER = "resolver"
+
+_READ_TIMEOUT_SETTINGS = {
+    SIGNSERVER: ("SIGNSERVER_TIMEOUT", 30),
+    REGISTRAR: ("UNIVERSAL_REGISTRAR_TIMEOUT", 30),
+    RESOLVER: ("UNIVERSAL_RESOLVER_TIMEOUT", 15),
+}
+
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_BACKOFF = 5.0
+
+_sessions: dict[str, object] = {}
+_sessions_pid: int | None = None
+_sessions_lock = threading.Lock()
+
+
+def get_timeout(service: str, read: float | None = None) -> tuple[float, float]:
+    """(connect, read) timeout tuple for *service*."""
+    connect = float(getattr(settings, "INTEGRATION_HTTP_CONNECT_TIMEOUT", 3.05))
+    if read is None:
+        name, default = _READ_TIMEOUT_SETTINGS[service]
+        read = float(getattr(settings, name, default))
+    return connect, read
+
+
+def get_session(service: str):
+    """
+    Return the keep-alive session of *service* for the current process.
+
+    Raises:
+        ValidationError: if ``requests`` is not installed.
+    """
+    global _sessions_pid
+    pid = os.getpid()
+    with _sessions_lock:
+        if _sessions_pid != pid:
+            # Inherited sockets belong to the parent process: start over.
+            _sessions.clear()
+            _sessions_pid = pid
+        session = _sessions.get(service)
+        if session is None:
+            session = _sessions[service] = _build_session()
+        return session
+
+
+def _build_session():
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        logger.error("integration_requests_missing", hint="pip install requests")
+        raise ValidationError("HTTP client (requests) not installed.") from None
+
+    pool_size = int(getattr(settings, "INTEGRATION_HTTP_POOL_SIZE", 10))
+    # Retries are handled in request(): the adapter must not retry on its own.
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def request(
+    service: str,
+    method: str,
+    url: str,
+    *,
+    idempotent: bool,
+    timeout: float | None = None,
+    retries: int | None = None,
+    use_breaker: bool = True,
+    **kwargs,
+):
+    """
+    Send an HTTP request to *service* through its pooled session.
+
+    Args:
+        service: SIGNSERVER, REGISTRAR or RESOLVER.
+        method: HTTP method.
+        url: full URL.
+        idempotent: whether the call may be replayed after it reached the
+            server (GET, signing the same bytes, …).
+        timeout: read timeout override in seconds (connect timeout is shared).
+        retries: override INTEGRATION_HTTP_RETRIES (0 = single attempt).
+        use_breaker: go through the service circuit breaker (health checks
+            bypass it so they report the real status).
+        **kwargs: forwarded to ``Session.request`` (params, json, data, headers…).
+
+    Returns:
+        The ``requests.Response`` of the last attempt. HTTP error statuses
+        are returned, not raised: callers keep their own error mapping.
+
+    Raises:
+        ServiceUnavailableError if the circuit breaker is open.
+        requests.RequestException once retries or the latency budget are exhausted.
+    """
+    from src.integrations import circuit_breaker
+
+    session = get_session(service)
+    if retries is None:
+        retries = int(getattr(settings, "INTEGRATION_HTTP_RETRIES", 2))
+    budget = float(getattr(settings, "INTEGRATION_HTTP_BUDGET", 40))
+
+    if use_breaker:
+        circuit_breaker.before_call(service, probe_ttl=budget)
+
+    try:
+        response = _send(
+            session, service, method, url, kwargs,
+            idempotent=idempotent,
+            retries=retries,
+            timeout=get_timeout(service, timeout),
+            deadline=time.monotonic() + budget,
+        )
+    except Exception as e:
+        if use_breaker:
+            circuit_breaker.record_failure(service, reason=type(e).__name__)
+        raise
+
+    if use_breaker:
+        if response.status_code >= 500:
+            circuit_breaker.record_failure(service, reason=f"HTTP {response.status_code}")
+        else:
+            circuit_breaker.record_success(service)
+    return response
+
+
+def _send(session, service, method, url, kwargs, *, idempotent, retries, timeout, deadline):
+    """Attempt loop: retries within *deadline* (the call's latency budget)."""
+    connect, read = timeout
+    attempt = 0
+    while True:
+        remaining = max(0.1, deadline - time.monotonic())
+        kwargs["timeout"] = (min(connect, remaining), min(read, remaining))
+        try:
+            response = session.request(method, url, **kwargs)
+        except Exception as e:
+            if attempt >= retries or not _is_retryable_error(e, idempotent):
+                raise
+            if not _backoff(service, attempt, deadline, reason=type(e).__name__):
+                raise
+        else:
+            if not (idempotent and response.status_code in _RETRY_STATUSES and attempt < retries):
+                return response
+            if not _backoff(service, attempt, deadline, reason=f"HTTP {response.status_code}"):
+                return response
+            response.close()
+        attempt += 1
+
+
+def _is_retryable_error(exc: Exception, idempotent: bool) -> bool:
+    import requests
+
+    if request_never_sent(exc):
+        return True
+    return idempotent and isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+def request_never_sent(exc: Exception) -> bool:
+    """
+    True when *exc* (raised by ``request``) proves the request never reached
+    the server — connect timeout or refused connection. Any other failure
+    of a non-idempotent call leaves its outcome unknown.
+    """
+    import requests
+
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    return isinstance(exc, requests.ConnectionError) and _never_sent(exc)
+
+
+def _never_sent(exc: Exception) -> bool:
+    """True when the connection could not be established at all."""
+    from urllib3.exceptions import NewConnectionError
+
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _backoff(service: str, attempt: int, deadline: float, reason: str) -> bool:
+    """Sleep before the next attempt. Returns False if the budget does not allow one."""
+    delay = _backoff_delay(service, attempt, deadline, reason)
+    if delay is None:
+        return False
+    time.sleep(delay)
+    return True
+
+
+def _backoff_delay(service: str, attempt: int, deadline: float, reason: str) -> float | None:
+    """Full-jitter delay before the next attempt, or None if the budget does not allow one."""
+    base = float(getattr(settings, "INTEGRATION_HTTP_BACKOFF", 0.2))
+    delay = random.uniform(0, min(_MAX_BACKOFF, base * (2**attempt)))
+    if time.monotonic() + delay >= deadline:
+        logger.warning("integration_http_budget_exhausted", service=service, attempt=attempt + 1)
+        return None
+    logger.warning(
+        "integration_http_retry",
+        service=service,
+        attempt=attempt + 1,
+        reason=reason,
+        delay=round(delay, 3),
+    )
+    return delay
+
+
+# ── Async (ASGI) ────────────────────────────────────────────────────────
+
+_async_clients: dict[tuple, tuple] = {}
+_async_available: bool | None = None
+
+
+def async_available() -> bool:
+    """
+    True if the async client (``httpx``) is installed. httpx is a declared
+    dependency: when it is missing (stale image), async callers fall back
+    to the sync client — logged as an error, once per process.
+    """
+    global _async_available
+    if _async_available is None:
+        import importlib.util
+
+        _async_available = importlib.util.find_spec("httpx") is not None
+        if not _async_available:
+            logger.error(
+                "integration_httpx_missing",
+                fallback="sync client in the thread pool",
+                hint="httpx is locked in uv.lock: rebuild the image (uv sync --frozen).",
+            )
+    return _async_available
+
+
+def async_enabled() -> bool:
+    """
+    True if async callers should use the async client: under ASGI
+    (SERVER_INTERFACE=asgi), where each worker runs one long-lived event
+    loop. Under WSGI every async view runs on a fresh ``async_to_sync``
+    loop, so a per-loop client would be rebuilt — and its connections
+    lost — on every request: the sync pooled session is used instead.
+    """
+    return getattr(settings, "SERVER_INTERFACE", "wsgi") == "asgi" and async_available()
+
+
+def get_async_client(service: str):
+    """
+    Return the pooled ``httpx.AsyncClient`` of *service* for the running
+    event loop (clients cannot be shared across loops or processes).
+
+    Raises:
+        ValidationError: if ``httpx`` is not installed.
+    """
+    import asyncio
+
+    try:
+        import httpx
+    except ImportError:
+        logger.error("integration_httpx_missing", hint="rebuild the image (uv sync --frozen)")
+        raise ValidationError("Async HTTP client (httpx) not installed.") from None
+
+    # One loop per worker under uvicorn (see async_enabled). If the loop
+    # changes anyway, the previous client is closed on its own loop.
+    loop = asyncio.get_running_loop()
+    key = (os.getpid(), service)
+    bound = _async_clients.get(key)
+    if bound is not None:
+        previous_loop, previous = bound
+        if previous_loop is loop and not previous.is_closed:
+            return previous
+        _close_async_client(previous_loop, previous)
+    pool_size = int(getattr(settings, "INTEGRATION_HTTP_ASYNC_POOL_SIZE", 100))
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+    )
+    _async_clients[key] = (loop, client)
+    return client
+
+
+def _close_async_client(loop, client) -> None:
+    """Close *client* on the loop that owns it, if that loop still runs."""
+    import asyncio
+
+    if client.is_closed:
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        logger.warning("integration_async_client_orphaned", reason="event loop closed before the client")
+
+
+async def arequest(
+    service: str,
+    method: str,
+    url: str,
+    *,
+    idempotent: bool,
+    timeout: float | None = None,
+    retries: int | None = None,
+    use_breaker: bool = True,
+    **kwargs,
+):
+    """
+    ``request()`` for async code: same arguments, retries, budget and breaker.
+
+    Returns:
+        The ``httpx.Response`` of the last attempt (status_code / text /
+        json() like a ``requests.Response``). HTTP error statuses are
+        returned, not raised.
+
+    Raises:
+        ServiceUnavailableError if the circuit breaker is open.
+        httpx.TransportError once retries or the latency budget are exhausted.
+    """
+    from asgiref.sync import sync_to_async
+
+    from src.integrations import circuit_breaker
+
+    client = get_async_client(service)
+    if retries is None:
+        retries = int(getattr(settings, "INTEGRATION_HTTP_RETRIES", 2))
+    budget = float(getattr(settings, "INTEGRATION_HTTP_BUDGET", 40))
+
+    # Breaker state lives in Redis (sync client): off the event loop.
+    if use_breaker:
+        await sync_to_async(circuit_breaker.before_call, thread_sensitive=False)(service, probe_ttl=budget)
+
+    try:
+        response = await _asend(
+            client, service, method, url, kwargs,
+            idempotent=idempotent,
+            retries=retries,
+            timeout=get_timeout(service, timeout),
+            deadline=time.monotonic() + budget,
+        )
+    except Exception as e:
+        if use_breaker:
+            await sync_to_async(circuit_breaker.record_failure, thread_sensitive=False)(
+                service, reason=type(e).__name__
+            )
+        raise
+
+    if use_breaker:
+        if response.status_code >= 500:
+            await sync_to_async(circuit_breaker.record_failure, thread_sensitive=False)(
+                service, reason=f"HTTP {response.status_code}"
+            )
+        else:
+            await sync_to_async(circuit_breaker.record_success, thread_sensitive=False)(service)
+    return response
+
+
+async def _asend(client, service, method, url, kwargs, *, idempotent, retries, timeout, deadline):
+    """``_send`` for httpx: retries within *deadline*."""
+    import asyncio
+
+    import httpx
+
+    connect, read = timeout
+    attempt = 0
+    while True:
+        remaining = max(0.1, deadline - time.monotonic())
+        kwargs["timeout"] = httpx.Timeout(min(read, remaining), connect=min(connect, remaining))
+        try:
+            response = await client.request(method, url, **kwargs)
+        except Exception as e:
+            if attempt >= retries or not _is_retryable_async_error(e, idempotent):
+                raise
+            delay = _backoff_delay(service, attempt, deadline, reason=type(e).__name__)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+        else:
+            if not (idempotent and response.status_code in _RETRY_STATUSES and attempt < retries):
+                return response
+            delay = _backoff_delay(service, attempt, deadline, reason=f"HTTP {response.status_code}")
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _is_retryable_async_error(exc: Exception, idempotent: bool) -> bool:
+    import httpx
+
+    # ConnectError / ConnectTimeout: the request never reached the server.
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    return idempotent and isinstance(exc, httpx.TransportError)
+
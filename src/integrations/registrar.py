@@ -15,11 +15,21 @@ The registrar's driver-did-web writes the did.json file to disk at
 the configured basePath (shared via dids_volume with nginx).
 
 If UNIVERSAL_REGISTRAR_URL is not set, stub responses are returned.
+
+Failures are split by what the registrar may have done:
+  ValidationError     — definite: rejected (HTTP 4xx, didState "failed")
+                        or never sent (connection refused / connect timeout).
+  OutcomeUnknownError — the request reached the registrar but no answer
+                        came back (read timeout, HTTP 5xx, unreadable body):
+                        it may have been applied. Check with
+                        fetch_registered_document().
 """
 
 import structlog
 from django.conf import settings
 
+from src.integrations import circuit_breaker, http_client
+
 logger = structlog.get_logger(__name__)
 
 
@@ -46,6 +56,7 @@ def create_did(did_document: dict) -> dict:
 
     Raises:
         ValidationError: If registration fails.
+        OutcomeUnknownError: If the registrar may have registered it anyway.
     """
     url = _get_registrar_url()
     if not url:
@@ -120,22 +131,53 @@ def deactivate_did(did_uri: str) -> dict:
     return _post(endpoint, payload, operation="deactivate")
 
 
+def fetch_registered_document(did_uri: str) -> dict | None:
+    """
+    The DID document the registrar currently publishes for *did_uri*,
+    resolved through the Universal Resolver (uncached), or None if the DID
+    is not registered (nor when the registrar is not configured: stubs
+    register nothing).
+
+    Used to settle calls that ended with OutcomeUnknownError.
+    """
+    from src.common.exceptions import NotFoundError
+    from src.integrations.resolver import resolve_upstream
+
+    if not _get_registrar_url():
+        return None
+    try:
+        return resolve_upstream(did_uri).get("didDocument") or None
+    except NotFoundError:
+        return None
+
+
 def health_check() -> dict:
     """
     Check Universal Registrar availability.
 
     Returns:
-        dict with "status" key and optional properties/methods info.
+        dict with "status" key, optional properties/methods info and
+        "circuit" (circuit breaker state).
     """
+    return {**_probe_health(), "circuit": circuit_breaker.get_state(http_client.REGISTRAR)}
+
+
+def _probe_health() -> dict:
     url = _get_registrar_url()
     if not url:
         return {"status": "not_configured"}
 
     try:
-        import requests as http_client
-
         # Check the properties endpoint
-        r = http_client.get(f"{url}/1.0/properties", timeout=5)
+        r = http_client.request(
+            http_client.REGISTRAR,
+            "GET",
+            f"{url}/1.0/properties",
+            idempotent=True,
+            timeout=5,
+            retries=0,
+            use_breaker=False,
+        )
         if r.status_code == 200:
             data = (
                 r.json()
@@ -168,8 +210,6 @@ def _post(endpoint: str, payload: dict, operation: str) -> dict:
     Validates the response and returns the parsed JSON.
     """
     try:
-        import requests as http_client
-
         logger.info(
             "registrar_request",
             operation=operation,
@@ -182,14 +222,32 @@ def _post(endpoint: str, payload: dict, operation: str) -> dict:
             ),
         )
 
-        response = http_client.post(
+        # create/update/deactivate are not replayed once sent: only
+        # connection failures are retried.
+        response = http_client.request(
+            http_client.REGISTRAR,
+            "POST",
             endpoint,
+            idempotent=False,
             json=payload,
             headers={"Content-Type": "application/json"},
-            timeout=30,
         )
 
         # The registrar returns 200 or 201 on success
+        if response.status_code >= 500:
+            logger.error(
+                "registrar_http_error",
+                operation=operation,
+                status=response.status_code,
+                body=response.text[:500],
+            )
+            from src.common.exceptions import OutcomeUnknownError
+
+            raise OutcomeUnknownError(
+                f"Registrar {operation} failed with HTTP {response.status_code}, "
+                f"it may have been applied: {response.text[:200]}"
+            )
+
         if response.status_code not in (200, 201):
             logger.error(
                 "registrar_http_error",
@@ -229,16 +287,16 @@ def _post(endpoint: str, payload: dict, operation: str) -> dict:
 
         return result
 
-    except ImportError:
-        logger.error("registrar_requests_missing", hint="pip install requests")
-        from src.common.exceptions import ValidationError
-
-        raise ValidationError("HTTP client (requests) not installed.") from None
-
     except Exception as e:
-        if "ValidationError" in type(e).__name__:
+        from src.common.exceptions import ApplicationError
+
+        if isinstance(e, ApplicationError):
             raise
         logger.error("registrar_failed", operation=operation, error=str(e))
+        if not http_client.request_never_sent(e):
+            from src.common.exceptions import OutcomeUnknownError
+
+            raise OutcomeUnknownError(f"Registrar {operation} failed, it may have been applied: {e}") from e
         from src.common.exceptions import ValidationError
 
         raise ValidationError(f"Registrar {operation} failed: {e}") from e
@@ -17,11 +17,40 @@ The resolver returns a W3C DID Resolution Result:
   }
 
 If UNIVERSAL_RESOLVER_URL is not set, a NotFoundError is raised.
+
+Results and failures are cached in memory and Redis, with
+stale-while-revalidate — see resolver_cache.
+
+DIDs hosted on this platform (did:web:<PLATFORM_DOMAIN_WITHOUT_SCHEME>:…)
+are resolved locally from the published DIDDocument — no round trip to the
+Universal Resolver, which would only fetch our own did.json back through
+nginx. Disable with DID_LOCAL_RESOLUTION = False. Their cache entries are
+re-warmed on publish / deactivate (rewarm_did), so they are kept for
+DID_RESOLVER_LOCAL_CACHE_TTL (days) instead of DID_RESOLVER_CACHE_TTL.
+
+resolve_did_version resolves a DID as it was at a given versionId or
+versionTime. For platform DIDs it reads DIDDocumentVersion through
+indexed lookups, and version results are cached without expiry because
+they cannot change.
+
+aresolve_did is the asyncio counterpart for ASGI views: a Universal
+Resolver fetch awaits the async HTTP client (http_client.arequest) instead
+of holding a worker thread. Under WSGI it goes through resolve_did and
+the pooled sync session.
 """
 
+import asyncio
+import copy
+import os
+import threading
+import time
+import weakref
+
 import structlog
 from django.conf import settings
 
+from src.integrations import circuit_breaker, http_client, resolver_cache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -29,75 +58,224 @@ def resolve_did(did_uri: str) -> dict:
     """
     Resolve a DID identifier via the Universal Resolver.
 
+    Results and failures are cached (see resolver_cache): fresh hits and
+    cached failures are answered from memory or Redis; a stale hit is
+    answered at once and refreshed in the background. On a miss, a single
+    upstream fetch per DID runs at a time — in this process and across
+    workers — and concurrent callers share its result.
+
     Args:
         did_uri: The fully-qualified DID to resolve
                  (e.g., 'did:web:annuairedid-be.qcdigitalhub.com:eliptik-corporation:alice:passport').
 
     Returns:
         Full DID Resolution Result dict that contains:
-          - didDocument: the resolved DID document
+          - didDocument: the resolved DID document (normalized)
           - didResolutionMetadata: resolution metadata (contentType, error, etc.)
           - didDocumentMetadata: document-level metadata
+        Shared with the cache: do not mutate it.
 
     Raises:
         ValidationError: if the resolver is unavailable or returns an error.
         NotFoundError:   if the DID cannot be resolved (meta.error is set).
     """
-    from django.core.cache import cache
+    cached = resolver_cache.get(did_uri)
+    if cached is not None:
+        entry, state = cached
+        logger.debug("resolver_cache_hit", did=did_uri, state=state)
+        if state == resolver_cache.STALE:
+            _refresh_in_background(did_uri)
+        return resolver_cache.unwrap(entry)
 
-    # Check cache first
-    cache_key = f"did_resolve:{did_uri}"
-    cached_result = cache.get(cache_key)
-    if cached_result:
-        logger.debug("resolver_cache_hit", did=did_uri)
-        if cached_result.get("didDocument"):
-            from src.common.did.assembler import normalize_did_document
+    return resolver_cache.unwrap(_resolve_single_flight(did_uri))
 
-            cached_result = {
-                **cached_result,
-                "didDocument": normalize_did_document(cached_result["didDocument"]),
-            }
-        return cached_result
 
-    url = _get_resolver_url()
-    if not url:
-        from src.common.exceptions import ValidationError
-        raise ValidationError("Universal Resolver is not configured. Set UNIVERSAL_RESOLVER_URL.")
+async def aresolve_did(did_uri: str) -> dict:
+    """
+    ``resolve_did`` for async views: same cache, single-flight and errors.
 
-    import urllib.parse
-    encoded = urllib.parse.quote(did_uri, safe="")
-    endpoint = f"{url}/1.0/identifiers/{encoded}"
+    Universal Resolver fetches await the pooled async HTTP client, so one
+    ASGI worker can keep hundreds of them in flight. Platform DIDs are
+    resolved from the database on a thread (``sync_to_async``), as are
+    all DIDs under WSGI or if ``httpx`` is not installed
+    (``http_client.async_enabled``).
+    """
+    from asgiref.sync import sync_to_async
 
-    result = _get(endpoint, did_uri=did_uri)
+    cached = await resolver_cache.aget(did_uri)
+    if cached is not None:
+        entry, state = cached
+        logger.debug("resolver_cache_hit", did=did_uri, state=state)
+        if state == resolver_cache.STALE:
+            _refresh_in_background(did_uri)
+        return resolver_cache.unwrap(entry)
 
-    if result.get("didDocument"):
-        from src.common.did.assembler import normalize_did_document
+    if _resolves_locally(did_uri) or not http_client.async_enabled():
+        return await sync_to_async(resolve_did)(did_uri)
 
-        result["didDocument"] = normalize_did_document(result["didDocument"])
+    return resolver_cache.unwrap(await _aresolve_single_flight(did_uri))
+
+
+def resolve_dids(did_uris: list[str]) -> dict[str, dict]:
+    """
+    Resolve several DIDs in one call.
+
+    Duplicates are resolved once. Cached and platform DIDs are answered on
+    the calling thread; the others are fetched from the Universal Resolver
+    concurrently, DID_RESOLVE_BATCH_CONCURRENCY at a time (through
+    ``resolve_did``: cache, single-flight and negative caching apply).
+
+    Returns:
+        ``{did: {"result": <resolution result>} | {"error": message, "status": http_status}}``
+        in the order of first appearance. One DID failing does not fail the others.
+        Results are copies of the cached ones: callers may modify them.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Cache the result
-    ttl = getattr(settings, "DID_RESOLVER_CACHE_TTL", 3600)  # 1 hour default
-    cache.set(cache_key, result, timeout=ttl)
-    logger.debug("resolver_cache_set", did=did_uri, ttl=ttl)
+    outcomes: dict[str, dict | None] = {}
+    remote = []
+    for did_uri in dict.fromkeys(did_uris):
+        if _resolves_locally(did_uri) or resolver_cache.get(did_uri) is not None:
+            outcomes[did_uri] = _resolution_outcome(did_uri)
+        else:
+            outcomes[did_uri] = None
+            remote.append(did_uri)
 
+    if remote:
+        workers = min(max(1, getattr(settings, "DID_RESOLVE_BATCH_CONCURRENCY", 8)), len(remote))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="did-resolve-batch") as pool:
+            for did_uri, outcome in zip(remote, pool.map(_resolution_outcome, remote), strict=True):
+                outcomes[did_uri] = outcome
+
+    logger.info("resolver_batch", dids=len(outcomes), fetched=len(remote))
+    return outcomes
+
+
+def resolve_did_version(did_uri: str, *, version_id: int | None = None, version_time=None) -> dict:
+    """
+    Resolve *did_uri* as published in version *version_id*, or as it was
+    at *version_time* (datetime; naive means UTC) — the DID ``versionId``
+    and ``versionTime`` parameters. Without either, same as ``resolve_did``.
+
+    Platform DIDs: versionTime is mapped to the version then in force
+    (index (document, published_at)); the version is read by number
+    (index (document, version_number)) and its result cached forever.
+    Its metadata has versionId, created and updated, but no
+    nextVersionId / nextUpdate, which would change on the next
+    publication. Other DIDs: the DID URL is passed to the Universal
+    Resolver (``resolve_did``).
+
+    Raises:
+        ValidationError: both parameters given.
+        NotFoundError:   no such version (or none published by version_time).
+    """
+    import datetime
+    import urllib.parse
+
+    from src.common.exceptions import NotFoundError, ValidationError
+
+    if version_id is not None and version_time is not None:
+        raise ValidationError("Give versionId or versionTime, not both.")
+    if version_id is None and version_time is None:
+        return resolve_did(did_uri)
+    if version_time is not None and version_time.tzinfo is None:
+        version_time = version_time.replace(tzinfo=datetime.UTC)
+
+    if not _resolves_locally(did_uri):
+        if version_id is not None:
+            query = {"versionId": version_id}
+        else:
+            query = {"versionTime": xml_datetime(version_time)}
+        return resolve_did(f"{did_uri}?{urllib.parse.urlencode(query)}")
+
+    if version_time is not None:
+        from src.apps.documents.selectors import get_version_number_at
+
+        version_id = get_version_number_at(did_uri=did_uri, at=version_time)
+        if version_id is None:
+            raise NotFoundError(f"No version of {did_uri} published at {xml_datetime(version_time)}")
+
+    result = resolver_cache.get_version(did_uri, version_id)
+    if result is None:
+        result = _resolve_version_locally(did_uri, version_id)
+        resolver_cache.set_version(did_uri, version_id, result)
     return result
 
 
+def rewarm_did(did_uri: str) -> None:
+    """
+    Bring the cached resolution of a platform DID in line with the database
+    (called after publish / deactivate / delete / review status change,
+    see documents.events).
+
+    Rebuilt from the committed document with local resolution; dropped
+    otherwise — the Universal Resolver will be asked again on next use.
+    Other processes pick it up within DID_RESOLVER_LRU_TTL.
+    """
+    from src.common.exceptions import NotFoundError
+
+    if not _resolves_locally(did_uri):
+        resolver_cache.delete(did_uri)
+        logger.info("resolver_cache_invalidated", did=did_uri)
+        return
+    try:
+        resolver_cache.set_result(did_uri, _resolve_locally(did_uri), ttl=_local_ttl())
+    except NotFoundError as e:
+        resolver_cache.set_error(did_uri, e)
+    logger.info("resolver_cache_rewarmed", did=did_uri)
+
+
+def forget_did_versions(did_uri: str, version_ids) -> None:
+    """
+    Drop the cached results of versions *version_ids* of a deleted platform
+    DID — cached without expiry, they would otherwise outlive the document
+    (and be served again if the DID were reused).
+    """
+    for version_id in version_ids:
+        resolver_cache.delete_version(did_uri, version_id)
+    logger.info("resolver_cache_versions_forgotten", did=did_uri, versions=len(version_ids))
+
+
+def resolve_upstream(did_uri: str) -> dict:
+    """
+    Resolve *did_uri* with the Universal Resolver, bypassing the cache and
+    local resolution: what is actually published for it (e.g. whether a
+    Registrar call went through). Raises as ``resolve_did``.
+    """
+    return _normalize_result(_get(_identifier_endpoint(did_uri), did_uri=did_uri))
+
+
+def is_platform_did(did_uri: str) -> bool:
+    """True for a plain DID (no path, query or fragment) hosted on this platform."""
+    domain = settings.PLATFORM_DOMAIN_WITHOUT_SCHEME.replace(":", "%3A")
+    return did_uri.startswith(f"did:web:{domain}:") and not any(c in did_uri for c in "/?#")
+
+
 def health_check() -> dict:
     """
     Check Universal Resolver availability.
 
     Returns:
-        dict with "status" key and optional methods info.
+        dict with "status" key and "circuit" (circuit breaker state).
     """
+    return {**_probe_health(), "circuit": circuit_breaker.get_state(http_client.RESOLVER)}
+
+
+def _probe_health() -> dict:
     url = _get_resolver_url()
     if not url:
         return {"status": "not_configured"}
 
     try:
-        import requests as http_client
-
-        r = http_client.get(f"{url}/1.0/methods", timeout=5)
+        r = http_client.request(
+            http_client.RESOLVER,
+            "GET",
+            f"{url}/1.0/methods",
+            idempotent=True,
+            timeout=5,
+            retries=0,
+            use_breaker=False,
+        )
         if r.status_code == 200:
             return {"status": "ok"}
         return {"status": "unavailable", "http_status": r.status_code}
@@ -108,6 +286,350 @@ def health_check() -> dict:
 # ── Internal helpers ─────────────────────────────────────────────────────
 
 
+def _resolution_outcome(did_uri: str) -> dict:
+    from src.common.exceptions import ApplicationError
+
+    try:
+        return {"result": copy.deepcopy(resolve_did(did_uri))}
+    except ApplicationError as e:
+        return {"error": e.message, "status": e.status_code}
+
+
+def _resolves_locally(did_uri: str) -> bool:
+    return getattr(settings, "DID_LOCAL_RESOLUTION", True) and is_platform_did(did_uri)
+
+
+def _local_ttl() -> int:
+    return int(getattr(settings, "DID_RESOLVER_LOCAL_CACHE_TTL", 604800))
+
+
+def _fetch(did_uri: str) -> dict:
+    """
+    Resolve *did_uri* without the cache: from the database for a platform
+    DID, else with the Universal Resolver. The document is normalized.
+    """
+    if _resolves_locally(did_uri):
+        return _resolve_locally(did_uri)
+    return _normalize_result(_get(_identifier_endpoint(did_uri), did_uri=did_uri))
+
+
+async def _afetch(did_uri: str) -> dict:
+    """``_fetch`` of a remote DID over the async HTTP client."""
+    return _normalize_result(await _aget(_identifier_endpoint(did_uri), did_uri=did_uri))
+
+
+def _identifier_endpoint(did_uri: str) -> str:
+    import urllib.parse
+
+    url = _get_resolver_url()
+    if not url:
+        from src.common.exceptions import ValidationError
+        raise ValidationError("Universal Resolver is not configured. Set UNIVERSAL_RESOLVER_URL.")
+
+    encoded = urllib.parse.quote(did_uri, safe="")
+    return f"{url}/1.0/identifiers/{encoded}"
+
+
+def _normalize_result(result: dict) -> dict:
+    from src.common.did.assembler import normalize_did_document
+
+    if result.get("didDocument"):
+        result["didDocument"] = normalize_did_document(result["didDocument"])
+    return result
+
+
+def _fetch_and_cache(did_uri: str) -> dict:
+    """``_fetch`` and cache the outcome; returns the cache entry (result or failure)."""
+    from src.common.exceptions import ApplicationError
+
+    local = _resolves_locally(did_uri)
+    try:
+        result = _fetch(did_uri)
+    except ApplicationError as e:
+        if not local and not _get_resolver_url():
+            raise
+        return resolver_cache.set_error(did_uri, e)
+    logger.debug("resolver_cache_set", did=did_uri)
+    return resolver_cache.set_result(did_uri, result, ttl=_local_ttl() if local else None)
+
+
+# ── Single-flight ───────────────────────────────────────────────────────
+#
+# On a miss, the first caller of a DID in this process (the leader) fetches
+# it; the others wait on its Event and share the entry. The leader itself
+# only fetches if it gets the Redis lock — otherwise another worker is
+# fetching, and it polls the cache for that worker's entry. Waits are
+# bounded by DID_RESOLVER_SINGLE_FLIGHT_WAIT; past it, callers fetch on
+# their own rather than fail.
+
+
+class _Flight:
+    __slots__ = ("done", "entry")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry: dict | None = None
+
+
+_flights: dict[str, _Flight] = {}
+_flights_lock = threading.Lock()
+
+_POLL_INTERVAL = 0.05
+
+
+def _single_flight_wait() -> float:
+    return float(getattr(settings, "DID_RESOLVER_SINGLE_FLIGHT_WAIT", 5.0))
+
+
+def _resolve_single_flight(did_uri: str) -> dict:
+    with _flights_lock:
+        flight = _flights.get(did_uri)
+        leader = flight is None
+        if leader:
+            flight = _flights[did_uri] = _Flight()
+
+    if not leader:
+        if flight.done.wait(_single_flight_wait()) and flight.entry is not None:
+            logger.debug("resolver_single_flight_shared", did=did_uri)
+            return flight.entry
+        logger.warning("resolver_single_flight_fallback", did=did_uri, scope="process")
+        return _fetch_and_cache(did_uri)
+
+    try:
+        flight.entry = _fetch_across_workers(did_uri)
+        return flight.entry
+    finally:
+        flight.done.set()
+        with _flights_lock:
+            _flights.pop(did_uri, None)
+
+
+def _fetch_across_workers(did_uri: str) -> dict:
+    wait = _single_flight_wait()
+    token = resolver_cache.acquire_fetch_lock(did_uri, timeout=wait)
+    if token is not None:
+        try:
+            return _fetch_and_cache(did_uri)
+        finally:
+            resolver_cache.release_fetch_lock(did_uri, token)
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(_POLL_INTERVAL)
+        cached = resolver_cache.get(did_uri)
+        if cached is not None and cached[1] == resolver_cache.FRESH:
+            logger.debug("resolver_single_flight_shared", did=did_uri, scope="workers")
+            return cached[0]
+    logger.warning("resolver_single_flight_fallback", did=did_uri, scope="workers")
+    return _fetch_and_cache(did_uri)
+
+
+async def _afetch_and_cache(did_uri: str) -> dict:
+    """``_fetch_and_cache`` of a remote DID, for the event loop."""
+    from asgiref.sync import sync_to_async
+
+    from src.common.exceptions import ApplicationError
+
+    try:
+        result = await _afetch(did_uri)
+    except ApplicationError as e:
+        if not _get_resolver_url():
+            raise
+        return await sync_to_async(resolver_cache.set_error, thread_sensitive=False)(did_uri, e)
+    logger.debug("resolver_cache_set", did=did_uri)
+    return await sync_to_async(resolver_cache.set_result, thread_sensitive=False)(did_uri, result)
+
+
+# ── Single-flight (asyncio) ─────────────────────────────────────────────
+#
+# Same protocol for aresolve_did, within an event loop: the leader's fetch
+# runs as a Task that the other coroutines await (shielded: a client that
+# disconnects does not cancel it for the others). Redis calls run off the
+# loop.
+
+_aflights: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def _aresolve_single_flight(did_uri: str) -> dict:
+    flights = _aflights.setdefault(asyncio.get_running_loop(), {})
+    task = flights.get(did_uri)
+    if task is None:
+        task = asyncio.ensure_future(_afetch_across_workers(did_uri))
+        flights[did_uri] = task
+        task.add_done_callback(lambda done: _end_aflight(flights, did_uri, done))
+        return await asyncio.shield(task)
+
+    try:
+        entry = await asyncio.wait_for(asyncio.shield(task), _single_flight_wait())
+    except TimeoutError:
+        logger.warning("resolver_single_flight_fallback", did=did_uri, scope="process")
+        return await _afetch_and_cache(did_uri)
+    logger.debug("resolver_single_flight_shared", did=did_uri)
+    return entry
+
+
+def _end_aflight(flights: dict, did_uri: str, task: asyncio.Task) -> None:
+    if flights.get(did_uri) is task:
+        del flights[did_uri]
+    if not task.cancelled():
+        task.exception()  # retrieved: every waiter may have gone
+
+
+async def _afetch_across_workers(did_uri: str) -> dict:
+    from asgiref.sync import sync_to_async
+
+    wait = _single_flight_wait()
+    token = await sync_to_async(resolver_cache.acquire_fetch_lock, thread_sensitive=False)(
+        did_uri, timeout=wait
+    )
+    if token is not None:
+        try:
+            return await _afetch_and_cache(did_uri)
+        finally:
+            await sync_to_async(resolver_cache.release_fetch_lock, thread_sensitive=False)(did_uri, token)
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_POLL_INTERVAL)
+        cached = await resolver_cache.aget(did_uri)
+        if cached is not None and cached[1] == resolver_cache.FRESH:
+            logger.debug("resolver_single_flight_shared", did=did_uri, scope="workers")
+            return cached[0]
+    logger.warning("resolver_single_flight_fallback", did=did_uri, scope="workers")
+    return await _afetch_and_cache(did_uri)
+
+
+# ── Stale-while-revalidate ──────────────────────────────────────────────
+
+_refresh_pools: dict[int, object] = {}
+_refreshing: set[str] = set()
+_refresh_lock = threading.Lock()
+
+
+def _refresh_in_background(did_uri: str) -> None:
+    """Re-resolve a stale entry on a background thread (once per DID at a time)."""
+    with _refresh_lock:
+        if did_uri in _refreshing:
+            return
+        _refreshing.add(did_uri)
+        pool = _refresh_pools.get(os.getpid())
+        if pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            pool = ThreadPoolExecutor(
+                max_workers=max(1, getattr(settings, "DID_RESOLVER_REFRESH_WORKERS", 2)),
+                thread_name_prefix="did-resolve-refresh",
+            )
+            _refresh_pools[os.getpid()] = pool
+    pool.submit(_refresh, did_uri)
+
+
+def _refresh(did_uri: str) -> None:
+    from src.common.exceptions import ApplicationError, NotFoundError
+
+    # Another worker already refreshing this DID: leave it to it.
+    token = resolver_cache.acquire_fetch_lock(did_uri, timeout=_single_flight_wait())
+    if token is None:
+        with _refresh_lock:
+            _refreshing.discard(did_uri)
+        return
+
+    try:
+        ttl = _local_ttl() if _resolves_locally(did_uri) else None
+        resolver_cache.set_result(did_uri, _fetch(did_uri), ttl=ttl)
+        logger.info("resolver_cache_refreshed", did=did_uri)
+    except NotFoundError as e:
+        # The DID is gone: stop serving the stale document.
+        resolver_cache.set_error(did_uri, e)
+    except ApplicationError as e:
+        # Stale-if-error: keep serving the stale entry until it expires.
+        logger.warning("resolver_cache_refresh_failed", did=did_uri, error=e.message)
+    except Exception as e:
+        logger.error("resolver_cache_refresh_failed", did=did_uri, error=str(e))
+    finally:
+        resolver_cache.release_fetch_lock(did_uri, token)
+        with _refresh_lock:
+            _refreshing.discard(did_uri)
+        # Platform DIDs are refreshed from the database on this thread.
+        from django.db import connections
+
+        connections.close_all()
+
+
+def _resolve_locally(did_uri: str) -> dict:
+    """
+    Build the DID Resolution Result of a platform DID from the database.
+
+    Same shape as the Universal Resolver's: the published content, and
+    versionId / created / updated (first and current publication) —
+    plus deactivated once the document is deactivated.
+
+    Raises NotFoundError if no published document has this DID.
+    """
+    from src.apps.documents.models import DocumentStatus
+    from src.apps.documents.selectors import get_document_for_resolution
+
+    document = get_document_for_resolution(did_uri=did_uri)
+    if document is None:
+        from src.common.exceptions import NotFoundError
+
+        logger.info("resolver_local_not_found", did=did_uri)
+        raise NotFoundError(f"DID not found: {did_uri}")
+
+    version = document.current_version
+    metadata = {}
+    if document.first_published_at:
+        metadata["created"] = xml_datetime(document.first_published_at)
+    if version is not None:
+        metadata["versionId"] = str(version.version_number)
+        if version.published_at:
+            metadata["updated"] = xml_datetime(version.published_at)
+    if document.status == DocumentStatus.DEACTIVATED:
+        metadata["deactivated"] = True
+        metadata["updated"] = xml_datetime(document.updated_at)
+
+    logger.info("resolver_local_success", did=did_uri, version=metadata.get("versionId"))
+    return _resolution_result(document.content, metadata)
+
+
+def _resolve_version_locally(did_uri: str, version_id: int) -> dict:
+    """``_resolve_locally`` of one published version (DIDDocumentVersion)."""
+    from src.apps.documents.selectors import get_published_version
+
+    version = get_published_version(did_uri=did_uri, version_number=version_id)
+    if version is None:
+        from src.common.exceptions import NotFoundError
+
+        raise NotFoundError(f"DID version not found: {did_uri}?versionId={version_id}")
+
+    metadata = {"versionId": str(version.version_number)}
+    if version.first_published_at:
+        metadata["created"] = xml_datetime(version.first_published_at)
+    if version.published_at:
+        metadata["updated"] = xml_datetime(version.published_at)
+
+    logger.info("resolver_local_success", did=did_uri, version=metadata["versionId"])
+    return _resolution_result(version.content, metadata)
+
+
+def _resolution_result(content: dict, metadata: dict) -> dict:
+    from src.common.did.assembler import normalize_did_document
+
+    return {
+        "@context": "https://w3id.org/did-resolution/v1",
+        "didDocument": normalize_did_document(content),
+        "didResolutionMetadata": {"contentType": "application/did+json"},
+        "didDocumentMetadata": metadata,
+    }
+
+
+def xml_datetime(value) -> str:
+    """DID Core timestamp: UTC, second precision, e.g. 2026-01-31T12:00:00Z."""
+    import datetime
+
+    return value.astimezone(datetime.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def _get_resolver_url() -> str:
     """Get the Universal Resolver base URL from settings, stripping trailing slashes."""
     url = getattr(settings, "UNIVERSAL_RESOLVER_URL", "")
@@ -121,59 +643,82 @@ def _get(endpoint: str, did_uri: str) -> dict:
     Raises ValidationError or NotFoundError based on the resolver response.
     """
     try:
-        import requests as http_client
-
         logger.info("resolver_request", did=did_uri, endpoint=endpoint)
 
-        response = http_client.get(
+        response = http_client.request(
+            http_client.RESOLVER,
+            "GET",
             endpoint,
+            idempotent=True,
             # headers={"Accept": "application/did+json, application/json"},
             headers={"Accept": "application/did-resolution"},
-            timeout=15,
         )
+        return _parse_response(response, did_uri)
 
-        if response.status_code == 404:
-            from src.common.exceptions import NotFoundError
-            raise NotFoundError(f"DID not found: {did_uri}")
+    except Exception as e:
+        _raise_resolver_failure(e, did_uri)
 
-        if response.status_code not in (200, 201):
-            logger.error(
-                "resolver_http_error",
-                status=response.status_code,
-                body=response.text[:500],
-                did=did_uri,
-            )
-            from src.common.exceptions import ValidationError
-            raise ValidationError(
-                f"Resolver returned HTTP {response.status_code}: {response.text[:200]}"
-            )
 
-        result = response.json()
+async def _aget(endpoint: str, did_uri: str) -> dict:
+    """``_get`` over the async HTTP client."""
+    try:
+        logger.info("resolver_request", did=did_uri, endpoint=endpoint)
+
+        response = await http_client.arequest(
+            http_client.RESOLVER,
+            "GET",
+            endpoint,
+            idempotent=True,
+            headers={"Accept": "application/did-resolution"},
+        )
+        return _parse_response(response, did_uri)
+
+    except Exception as e:
+        _raise_resolver_failure(e, did_uri)
 
-        # Check didResolutionMetadata for error field (per W3C spec)
-        meta = result.get("didResolutionMetadata", {})
-        if meta.get("error"):
-            error_code = meta["error"]
-            logger.warning("resolver_did_error", did=did_uri, error=error_code)
-            from src.common.exceptions import NotFoundError
-            raise NotFoundError(f"DID resolution error: {error_code}")
 
-        logger.info(
-            "resolver_success",
+def _parse_response(response, did_uri: str) -> dict:
+    """Map a resolver HTTP response (requests or httpx) to its result, or raise."""
+    if response.status_code == 404:
+        from src.common.exceptions import NotFoundError
+        raise NotFoundError(f"DID not found: {did_uri}")
+
+    if response.status_code not in (200, 201):
+        logger.error(
+            "resolver_http_error",
+            status=response.status_code,
+            body=response.text[:500],
             did=did_uri,
-            has_document=bool(result.get("didDocument")),
+        )
+        from src.common.exceptions import ValidationError
+        raise ValidationError(
+            f"Resolver returned HTTP {response.status_code}: {response.text[:200]}"
         )
 
-        return result
+    result = response.json()
 
-    except ImportError:
-        logger.error("resolver_requests_missing", hint="pip install requests")
-        from src.common.exceptions import ValidationError
-        raise ValidationError("HTTP client (requests) not installed.") from None
+    # Check didResolutionMetadata for error field (per W3C spec)
+    meta = result.get("didResolutionMetadata", {})
+    if meta.get("error"):
+        error_code = meta["error"]
+        logger.warning("resolver_did_error", did=did_uri, error=error_code)
+        from src.common.exceptions import NotFoundError
+        raise NotFoundError(f"DID resolution error: {error_code}")
 
-    except Exception as e:
-        if type(e).__name__ in ("ValidationError", "NotFoundError"):
-            raise
-        logger.error("resolver_failed", did=did_uri, error=str(e))
-        from src.common.exceptions import ValidationError
-        raise ValidationError(f"Resolver failed: {e}") from e
+    logger.info(
+        "resolver_success",
+        did=did_uri,
+        has_document=bool(result.get("didDocument")),
+    )
+
+    return result
+
+
+def _raise_resolver_failure(e: Exception, did_uri: str):
+    from src.common.exceptions import ApplicationError
+
+    if isinstance(e, ApplicationError):
+        raise e
+    logger.error("resolver_failed", did=did_uri, error=str(e))
+    from src.common.exceptions import ValidationError
+    raise ValidationError(f"Resolver failed: {e}") from e
@@ -0,0 +1,289 @@
+"""
+Two-tier cache for DID resolution results.
+
+Tier 1 is an in-process LRU (DID_RESOLVER_LRU_SIZE entries, trusted for
+DID_RESOLVER_LRU_TTL seconds), tier 2 the default cache (Redis), shared by
+every gunicorn/celery worker. A miss in tier 1 reads tier 2 and promotes
+the entry. Results are stored already normalized: a hit returns the stored
+dict as is (no copy on the hot path) — callers must not mutate it, or
+work on a copy (resolver.resolve_dids returns copies).
+
+An entry is:
+  fresh        — until DID_RESOLVER_CACHE_TTL after it was resolved (for
+                 platform DIDs, DID_RESOLVER_LOCAL_CACHE_TTL): served.
+  stale        — for DID_RESOLVER_STALE_TTL more seconds: still served, and
+                 the caller refreshes it in the background
+                 (stale-while-revalidate), or serves it when the refresh
+                 fails (stale-if-error).
+  expired      — dropped.
+
+Failures are cached too (negative caching), so unknown DIDs requested in
+a loop do not reach the Universal Resolver every time: "not found" for
+DID_RESOLVER_NEGATIVE_TTL seconds, resolver errors (HTTP errors, open
+circuit) for DID_RESOLVER_ERROR_TTL seconds. Failures are never stale.
+
+Results of a given version of a platform DID (``?versionId=``) never
+change: they are cached without expiry (``get_version`` / ``set_version``)
+— only Redis eviction, or the deletion of the document
+(``delete_version``), drops them.
+
+If Redis is unreachable, the cache stays out of the way (tier 1 only).
+
+Cache keys:
+  did_resolve:v2:{did}  — the entry
+  did_resolve:v2:{did}?versionId={n} — a version's result (immutable)
+  did_resolve:lock:{did} — held by the worker fetching the DID upstream
+                           (single-flight across workers, see resolver)
+"""
+
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import structlog
+from django.conf import settings
+
+from src.common.exceptions import (
+    ApplicationError,
+    NotFoundError,
+    ServiceUnavailableError,
+    ValidationError,
+)
+
+logger = structlog.get_logger(__name__)
+
+FRESH = "fresh"
+STALE = "stale"
+
+_lru: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+_lru_lock = threading.Lock()
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "DID_RESOLVER_CACHE_TTL", 3600))
+
+
+def _stale_ttl() -> int:
+    return int(getattr(settings, "DID_RESOLVER_STALE_TTL", 86400))
+
+
+def _negative_ttl() -> int:
+    return int(getattr(settings, "DID_RESOLVER_NEGATIVE_TTL", 60))
+
+
+def _error_ttl() -> int:
+    return int(getattr(settings, "DID_RESOLVER_ERROR_TTL", 10))
+
+
+def _lru_size() -> int:
+    return int(getattr(settings, "DID_RESOLVER_LRU_SIZE", 1024))
+
+
+def _lru_ttl() -> int:
+    return int(getattr(settings, "DID_RESOLVER_LRU_TTL", 60))
+
+
+def _key(did_uri: str) -> str:
+    return f"did_resolve:v2:{did_uri}"
+
+
+def _version_did_url(did_uri: str, version_id: int) -> str:
+    return f"{did_uri}?versionId={version_id}"
+
+
+def _lock_key(did_uri: str) -> str:
+    return f"did_resolve:lock:{did_uri}"
+
+
+def get(did_uri: str) -> tuple[dict, str] | None:
+    """
+    The cached entry of *did_uri* and its state (FRESH or STALE), or None.
+
+    Use ``unwrap`` to get the result (or raise the cached failure).
+    """
+    now = time.time()
+    entry = _lru_get(did_uri, now)
+    if entry is None:
+        entry = _shared_get(did_uri)
+        if entry is None:
+            return None
+        _lru_set(did_uri, entry, now)
+    return _with_state(entry, now)
+
+
+async def aget(did_uri: str) -> tuple[dict, str] | None:
+    """``get`` for async callers: Redis is read off the event loop."""
+    from asgiref.sync import sync_to_async
+
+    now = time.time()
+    entry = _lru_get(did_uri, now)
+    if entry is None:
+        entry = await sync_to_async(_shared_get, thread_sensitive=False)(did_uri)
+        if entry is None:
+            return None
+        _lru_set(did_uri, entry, now)
+    return _with_state(entry, now)
+
+
+def unwrap(entry: dict) -> dict:
+    """The cached resolution result; raises the cached failure for a negative entry."""
+    error = entry.get("error")
+    if error is None:
+        return entry["result"]
+    status_code, message = error
+    if status_code == 404:
+        raise NotFoundError(message)
+    if status_code == 503:
+        raise ServiceUnavailableError(message)
+    raise ValidationError(message)
+
+
+def set_result(did_uri: str, result: dict, *, ttl: int | None = None) -> dict:
+    """Cache a (normalized) resolution result, fresh for *ttl* (default DID_RESOLVER_CACHE_TTL); returns the entry."""
+    now = time.time()
+    ttl = _ttl() if ttl is None else ttl
+    entry = {
+        "result": result,
+        "error": None,
+        "fresh_until": now + ttl,
+        "stale_until": now + ttl + _stale_ttl(),
+    }
+    _store(did_uri, entry, now)
+    return entry
+
+
+def set_error(did_uri: str, error: ApplicationError) -> dict:
+    """Cache a failed resolution: NotFoundError for DID_RESOLVER_NEGATIVE_TTL, others for DID_RESOLVER_ERROR_TTL."""
+    now = time.time()
+    ttl = _negative_ttl() if isinstance(error, NotFoundError) else _error_ttl()
+    entry = {
+        "result": None,
+        "error": (error.status_code, error.message),
+        "fresh_until": now + ttl,
+        "stale_until": now + ttl,
+    }
+    if ttl > 0:
+        _store(did_uri, entry, now)
+    return entry
+
+
+def get_version(did_uri: str, version_id: int) -> dict | None:
+    """The cached result of version *version_id* of *did_uri*, or None."""
+    cached = get(_version_did_url(did_uri, version_id))
+    return cached[0]["result"] if cached is not None else None
+
+
+def set_version(did_uri: str, version_id: int, result: dict) -> None:
+    """Cache the result of a published version, without expiry (it is immutable)."""
+    entry = {"result": result, "error": None, "fresh_until": math.inf, "stale_until": math.inf}
+    _store(_version_did_url(did_uri, version_id), entry, time.time())
+
+
+def delete(did_uri: str) -> None:
+    """Forget *did_uri* in this process and in Redis."""
+    from django.core.cache import cache
+
+    with _lru_lock:
+        _lru.pop(did_uri, None)
+    try:
+        cache.delete(_key(did_uri))
+    except Exception as e:
+        logger.warning("resolver_cache_unavailable", operation="delete", error=str(e))
+
+
+def delete_version(did_uri: str, version_id: int) -> None:
+    """Forget the cached result of version *version_id* of *did_uri* (the document was deleted)."""
+    delete(_version_did_url(did_uri, version_id))
+
+
+def acquire_fetch_lock(did_uri: str, *, timeout: float) -> str | None:
+    """
+    Claim the upstream fetch of *did_uri* across workers for *timeout* seconds.
+
+    Returns a token to pass to ``release_fetch_lock``, or None if another
+    worker holds the lock. If Redis is unreachable the lock is granted.
+    """
+    from django.core.cache import cache
+
+    token = uuid.uuid4().hex
+    try:
+        if not cache.add(_lock_key(did_uri), token, timeout=max(1, int(timeout + 0.999))):
+            return None
+    except Exception as e:
+        logger.warning("resolver_cache_unavailable", operation="lock", error=str(e))
+    return token
+
+
+def release_fetch_lock(did_uri: str, token: str) -> None:
+    from django.core.cache import cache
+
+    try:
+        if cache.get(_lock_key(did_uri)) == token:
+            cache.delete(_lock_key(did_uri))
+    except Exception as e:
+        logger.warning("resolver_cache_unavailable", operation="unlock", error=str(e))
+
+
+def clear_local() -> None:
+    """Empty the in-process tier."""
+    with _lru_lock:
+        _lru.clear()
+
+
+# ── Tiers ───────────────────────────────────────────────────────────────
+
+
+def _with_state(entry: dict, now: float) -> tuple[dict, str] | None:
+    if now < entry["fresh_until"]:
+        return entry, FRESH
+    if now < entry["stale_until"]:
+        return entry, STALE
+    return None
+
+
+def _store(did_uri: str, entry: dict, now: float) -> None:
+    from django.core.cache import cache
+
+    _lru_set(did_uri, entry, now)
+    timeout = None if entry["stale_until"] == math.inf else max(1, int(entry["stale_until"] - now))
+    try:
+        cache.set(_key(did_uri), entry, timeout=timeout)
+    except Exception as e:
+        logger.warning("resolver_cache_unavailable", operation="set", error=str(e))
+
+
+def _shared_get(did_uri: str) -> dict | None:
+    from django.core.cache import cache
+
+    try:
+        return cache.get(_key(did_uri))
+    except Exception as e:
+        logger.warning("resolver_cache_unavailable", operation="get", error=str(e))
+        return None
+
+
+def _lru_get(did_uri: str, now: float) -> dict | None:
+    with _lru_lock:
+        item = _lru.get(did_uri)
+        if item is None:
+            return None
+        entry, trusted_until = item
+        if now >= trusted_until:
+            # Re-read Redis: another worker may have refreshed or dropped it.
+            del _lru[did_uri]
+            return None
+        _lru.move_to_end(did_uri)
+        return entry
+
+
+def _lru_set(did_uri: str, entry: dict, now: float) -> None:
+    size = _lru_size()
+    if size <= 0:
+        return
+    with _lru_lock:
+        _lru[did_uri] = (entry, min(now + _lru_ttl(), entry["stale_until"]))
+        _lru.move_to_end(did_uri)
+        while len(_lru) > size:
+            _lru.popitem(last=False)
@@ -0,0 +1,174 @@
+"""
+Signer backends for ecdsa-jcs-2019 proofs.
+
+``create_proof`` / ``create_proofs_batch`` sign through ``get_signer()``,
+which picks one of:
+
+  "signserver" — SignServer CE PlainSigner over HTTP (see signserver). The
+                 worker's key curve is declared in SIGNSERVER_KEY_CURVE and
+                 its signature algorithm must match (SHA256withECDSA for
+                 P-256, SHA384withECDSA for P-384). This is the default.
+  "local"      — in-process ECDSA with the private key in SIGNER_KEY_FILE
+                 (PEM, P-256 or P-384). Real signatures without SignServer,
+                 for development, CI and benchmarks. Generate a key with:
+                     openssl ecparam -name prime256v1 -genkey -noout -out signer.pem
+  "stub"       — all-zero signature of the right length. Nothing is signed.
+
+Every signer exposes its curve, so the proof hash (SHA-256 / SHA-384 per
+ecdsa-jcs-2019) and the raw r||s size follow the key instead of being
+hard-coded to P-256.
+
+Configuration:
+    SIGNER_BACKEND — "signserver" (default), "local" or "stub".
+    SIGNER_KEY_FILE / SIGNER_KEY_PASSWORD — key of the "local" backend.
+    SIGNSERVER_KEY_CURVE — curve of the SignServer key (default: "P-256").
+"""
+
+import os
+import threading
+
+import structlog
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+logger = structlog.get_logger(__name__)
+
+SIGNER_SIGNSERVER = "signserver"
+SIGNER_LOCAL = "local"
+SIGNER_STUB = "stub"
+SIGNERS = (SIGNER_SIGNSERVER, SIGNER_LOCAL, SIGNER_STUB)
+
+# curve → (bytes per integer in r||s, ecdsa-jcs-2019 hash)
+CURVES = {
+    "P-256": (32, "sha256"),
+    "P-384": (48, "sha384"),
+}
+
+# cryptography curve name → JOSE curve name
+_CURVE_NAMES = {"secp256r1": "P-256", "secp384r1": "P-384"}
+
+
+class Signer:
+    """Signs ecdsa-jcs-2019 hash-data and returns a DER (or raw r||s) signature."""
+
+    name = ""
+
+    def __init__(self, curve: str):
+        if curve not in CURVES:
+            raise ImproperlyConfigured(
+                f"Unsupported signer curve {curve!r}. Expected one of {tuple(CURVES)}."
+            )
+        self.curve = curve
+        self.key_size, self.hash_name = CURVES[curve]
+
+    def sign(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def sign_batch(self, items: list[bytes], *, concurrency: int | None = None) -> list[bytes]:
+        return [self.sign(data) for data in items]
+
+
+class SignServerSigner(Signer):
+    name = SIGNER_SIGNSERVER
+
+    def sign(self, data: bytes) -> bytes:
+        from src.integrations.signserver import sign_bytes
+
+        return sign_bytes(data)
+
+    def sign_batch(self, items: list[bytes], *, concurrency: int | None = None) -> list[bytes]:
+        from src.integrations.signserver import sign_bytes_batch
+
+        return sign_bytes_batch(items, concurrency=concurrency)
+
+
+class LocalSigner(Signer):
+    name = SIGNER_LOCAL
+
+    def __init__(self, private_key):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec
+
+        curve = _CURVE_NAMES.get(private_key.curve.name)
+        if curve is None:
+            raise ImproperlyConfigured(
+                f"SIGNER_KEY_FILE holds a {private_key.curve.name} key; "
+                f"expected one of {tuple(CURVES)}."
+            )
+        super().__init__(curve)
+        self._key = private_key
+        hash_cls = hashes.SHA256 if self.hash_name == "sha256" else hashes.SHA384
+        self._algorithm = ec.ECDSA(hash_cls())
+
+    def sign(self, data: bytes) -> bytes:
+        return self._key.sign(data, self._algorithm)
+
+    def public_key(self):
+        return self._key.public_key()
+
+
+class StubSigner(Signer):
+    name = SIGNER_STUB
+
+    def sign(self, data: bytes) -> bytes:
+        return b"\x00" * (2 * self.key_size)
+
+
+_local_signers: dict[tuple, LocalSigner] = {}
+_local_lock = threading.Lock()
+
+
+def get_signer(backend: str | None = None) -> Signer:
+    """
+    Return the signer selected by SIGNER_BACKEND (or *backend*).
+
+    Raises:
+        ImproperlyConfigured: unknown backend, unreadable key file or
+            unsupported curve.
+    """
+    backend = backend or getattr(settings, "SIGNER_BACKEND", SIGNER_SIGNSERVER)
+    if backend == SIGNER_SIGNSERVER:
+        return SignServerSigner(getattr(settings, "SIGNSERVER_KEY_CURVE", "P-256"))
+    if backend == SIGNER_LOCAL:
+        return _get_local_signer()
+    if backend == SIGNER_STUB:
+        return StubSigner("P-256")
+    raise ImproperlyConfigured(f"Unknown SIGNER_BACKEND {backend!r}. Expected one of {SIGNERS}.")
+
+
+def _get_local_signer() -> LocalSigner:
+    """Load SIGNER_KEY_FILE once per process (reloaded if the file changes)."""
+    path = getattr(settings, "SIGNER_KEY_FILE", "")
+    if not path:
+        raise ImproperlyConfigured("SIGNER_BACKEND='local' requires SIGNER_KEY_FILE.")
+    try:
+        cache_key = (path, os.stat(path).st_mtime_ns)
+    except OSError as e:
+        raise ImproperlyConfigured(f"Cannot read SIGNER_KEY_FILE '{path}': {e}") from e
+
+    signer = _local_signers.get(cache_key)
+    if signer is not None:
+        return signer
+    with _local_lock:
+        signer = _local_signers.get(cache_key)
+        if signer is None:
+            _local_signers.clear()
+            signer = _local_signers[cache_key] = LocalSigner(_load_private_key(path))
+            logger.info("local_signer_loaded", path=path, curve=signer.curve)
+        return signer
+
+
+def _load_private_key(path: str):
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+    password = getattr(settings, "SIGNER_KEY_PASSWORD", "") or None
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        key = load_pem_private_key(data, password=password.encode() if password else None)
+    except (ValueError, TypeError) as e:
+        raise ImproperlyConfigured(f"Cannot load SIGNER_KEY_FILE '{path}': {e}") from e
+    if not isinstance(key, ec.EllipticCurvePrivateKey):
+        raise ImproperlyConfigured(f"SIGNER_KEY_FILE '{path}' is not an EC private key.")
+    return key
@@ -11,15 +11,19 @@ Configuration (environment / Django settings):
   SIGNSERVER_URL          — e.g. "http://signserver-node:8080" Internally
   SIGNSERVER_URL=http://signserver.qcdigitalhub.com/signserver
   SIGNSERVER_WORKER_NAME  — e.g. "PlainSigner"
+  SIGNSERVER_BATCH_CONCURRENCY — requests in flight for sign_bytes_batch (default: 8)
 
 If SIGNSERVER_URL is not set, a deterministic stub signature is returned
 so the rest of the pipeline can be exercised in development.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import structlog
 from django.conf import settings
 
-from src.common.exceptions import ValidationError
+from src.common.exceptions import ApplicationError, ValidationError
+from src.integrations import circuit_breaker, http_client
 
 logger = structlog.get_logger(__name__)
 
@@ -76,51 +80,73 @@ def sign_bytes(data: bytes) -> bytes:
         )
         return _STUB_RAW_SIG
 
-    try:
-        import requests as http_client
+    logger.info(
+        "signserver_signing",
+        url=url,
+        worker=worker,
+        payload_bytes=len(data),
+    )
+    sig_bytes = _sign_one(url, worker, data)
+    logger.info("signserver_signed", sig_bytes_len=len(sig_bytes))
+    return sig_bytes
 
-        logger.info(
-            "signserver_signing",
-            url=url,
-            worker=worker,
-            payload_bytes=len(data),
-        )
 
-        response = http_client.post(
-            url,
-            params={"workerName": worker},
-            data=data,
-            headers={"Content-Type": "application/octet-stream"},
-            timeout=30,
-        )
+def sign_bytes_batch(items: list[bytes], *, concurrency: int | None = None) -> list[bytes]:
+    """
+    Sign many payloads, returning the DER signatures in the same order.
 
-        if response.status_code != 200:
-            logger.error(
-                "signserver_http_error",
-                status=response.status_code,
-                body=response.text[:500],
-            )
-            raise ValidationError(
-                f"SignServer returned HTTP {response.status_code}: "
-                f"{response.text[:200]}"
-            )
+    The PlainSigner process endpoint takes one payload per request, so the
+    batch is submitted as up to *concurrency* requests in flight over the
+    pooled keep-alive connections of ``http_client`` — throughput is then
+    bounded by SignServer, not by one round trip per document.
 
-        sig_bytes = response.content
-        if not sig_bytes:
-            raise ValidationError("SignServer returned an empty signature.")
+    Args:
+        items: Payloads to sign (ecdsa-jcs-2019 hash-data, 64 bytes each).
+        concurrency: Requests in flight (default: SIGNSERVER_BATCH_CONCURRENCY).
 
-        logger.info("signserver_signed", sig_bytes_len=len(sig_bytes))
-        return sig_bytes
+    Returns:
+        One raw DER-encoded signature per item, in input order.
 
-    except ImportError:
-        logger.error("signserver_requests_missing", hint="pip install requests")
-        raise ValidationError("HTTP client (requests) not installed.") from None
+    Raises:
+        ApplicationError: The first failing item's error (ValidationError,
+            ServiceUnavailableError, OutcomeUnknownError…), its message
+            prefixed with the item index; the remaining items are cancelled.
+    """
+    if not items:
+        return []
 
-    except Exception as e:
-        if "ValidationError" in type(e).__name__:
-            raise
-        logger.error("signserver_failed", error=str(e), url=url)
-        raise ValidationError(f"SignServer signing failed: {e}") from e
+    url = _get_process_url()
+    worker = settings.SIGNSERVER_WORKER_NAME
+    if not url:
+        logger.warning(
+            "signserver_not_configured",
+            hint="Set SIGNSERVER_URL in settings. Returning stub signatures.",
+        )
+        return [_STUB_RAW_SIG] * len(items)
+
+    if concurrency is None:
+        concurrency = getattr(settings, "SIGNSERVER_BATCH_CONCURRENCY", 8)
+    workers = max(1, min(concurrency, len(items)))
+    logger.info("signserver_batch_signing", url=url, worker=worker, items=len(items), concurrency=workers)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="signserver") as pool:
+        futures = [pool.submit(_sign_one, url, worker, data) for data in items]
+        signatures = []
+        for index, future in enumerate(futures):
+            try:
+                signatures.append(future.result())
+            except ApplicationError as e:
+                for pending in futures[index + 1:]:
+                    pending.cancel()
+                logger.error("signserver_batch_failed", index=index, items=len(items), error=e.message)
+                # Prefix the item in place: the exception keeps its class and
+                # status_code (OutcomeUnknownError must stay reconcilable).
+                e.message = f"Batch item {index}: {e.message}"
+                e.args = (e.message,)
+                raise
+
+    logger.info("signserver_batch_signed", items=len(signatures))
+    return signatures
 
 
 def health_check() -> dict:
@@ -128,8 +154,13 @@ def health_check() -> dict:
     Check SignServer availability.
 
     Returns:
-        dict with "status" key ("ok", "unavailable", or "not_configured").
+        dict with "status" key ("ok", "unavailable", or "not_configured")
+        and "circuit" (circuit breaker state).
     """
+    return {**_probe_health(), "circuit": circuit_breaker.get_state(http_client.SIGNSERVER)}
+
+
+def _probe_health() -> dict:
     base = settings.SIGNSERVER_URL
     if not base:
         return {"status": "not_configured"}
@@ -137,9 +168,15 @@ def health_check() -> dict:
     health_url = _build_url(base, "/signserver/healthcheck/signserverhealth")
 
     try:
-        import requests as http_client
-
-        r = http_client.get(health_url, timeout=5)
+        r = http_client.request(
+            http_client.SIGNSERVER,
+            "GET",
+            health_url,
+            idempotent=True,
+            timeout=5,
+            retries=0,
+            use_breaker=False,
+        )
         if r.status_code == 200:
             return {"status": "ok", "response": r.text[:200]}
         return {"status": "unavailable", "http_status": r.status_code}
@@ -149,6 +186,43 @@ def health_check() -> dict:
     # ── Internal helpers ─────────────────────────────────────────────────────
 
 
+def _sign_one(url: str, worker: str, data: bytes) -> bytes:
+    """POST one payload to the PlainSigner. Raises ValidationError on failure."""
+    try:
+        # Signing the same bytes twice is harmless: safe to retry.
+        response = http_client.request(
+            http_client.SIGNSERVER,
+            "POST",
+            url,
+            idempotent=True,
+            params={"workerName": worker},
+            data=data,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+
+        if response.status_code != 200:
+            logger.error(
+                "signserver_http_error",
+                status=response.status_code,
+                body=response.text[:500],
+            )
+            raise ValidationError(
+                f"SignServer returned HTTP {response.status_code}: "
+                f"{response.text[:200]}"
+            )
+
+        sig_bytes = response.content
+        if not sig_bytes:
+            raise ValidationError("SignServer returned an empty signature.")
+        return sig_bytes
+
+    except Exception as e:
+        if isinstance(e, ApplicationError):
+            raise
+        logger.error("signserver_failed", error=str(e), url=url)
+        raise ValidationError(f"SignServer signing failed: {e}") from e
+
+
 def _get_process_url() -> str:
     """Build the ``/signserver/process`` endpoint URL."""
     base = getattr(settings, "SIGNSERVER_URL", "") or ""
@@ -8,7 +8,10 @@ Configuration racine des URL.
 - /admin/               → Administration Django
 """
 
+from inspect import iscoroutinefunction
+
 from django.contrib import admin
+from django.db import connections, transaction
 from django.urls import path
 from ninja_extra import NinjaExtraAPI
 from ninja_jwt.controller import NinjaJWTDefaultController
@@ -65,11 +68,28 @@ superadmin_api = NinjaExtraAPI(
 configure_exception_handlers(superadmin_api)
 superadmin_api.add_router("/", superadmin_router)
 
+# ── Vues async ──────────────────────────────────────────────────────────
+
+
+def _non_atomic_async_views(urls):
+    """
+    ATOMIC_REQUESTS ne peut pas envelopper une vue async (Django lève une
+    RuntimeError) : les vues async générées par Ninja (résolution et
+    recherche publiques, en lecture) s'exécutent en autocommit.
+    """
+    patterns, app_name, namespace = urls
+    for pattern in patterns:
+        if iscoroutinefunction(pattern.callback):
+            for alias in connections:
+                transaction.non_atomic_requests(using=alias)(pattern.callback)
+    return patterns, app_name, namespace
+
+
 # ── Modèles d'URL ───────────────────────────────────────────────────────
 
 urlpatterns = [
     # API
-    path("api/v2/", api.urls),
+    path("api/v2/", _non_atomic_async_views(api.urls)),
     path("superadmin/api/v2/", superadmin_api.urls),
     # Administration Django
     path("admin/", admin.site.urls),